@@ -0,0 +1,96 @@
+"""
+1.000 altas secuenciales (`POST /tags/`, `POST /projects/`) frente a una
+sola llamada a `/tags/bulk` y `/projects/bulk`. Todos los proyectos usan la
+misma imagen, así que el coste medido es el de la API y la base de datos,
+no el de Pillow.
+
+Uso:
+    python -m benchmarks.bench_bulk --items 1000
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import tempfile
+import time
+
+
+def _image() -> bytes:
+    from PIL import Image
+
+    buffer = io.BytesIO()
+    Image.new("RGB", (64, 64), "teal").save(buffer, "png")
+    return buffer.getvalue()
+
+
+def _project(prefix, i):
+    return {"title": f"{prefix} {i}", "description_en": "Seeded project", "description_es": "Proyecto"}
+
+
+async def _timed(coro):
+    start = time.perf_counter()
+    await coro
+    return time.perf_counter() - start
+
+
+async def run(args):
+    import httpx
+    from src.core.config import settings
+    from src.core.security import create_access_token
+    from src.main import app
+
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': settings.ADMIN_USERNAME, 'role': 'admin'})}"}
+    image = _image()
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", headers=headers, timeout=600) as client:
+
+            async def sequential_tags():
+                for i in range(args.items):
+                    (await client.post("/tags/", json={"name": f"seq-{i}"})).raise_for_status()
+
+            async def bulk_tags():
+                body = {"create": [{"name": f"bulk-{i}"} for i in range(args.items)]}
+                (await client.post("/tags/bulk", json=body)).raise_for_status()
+
+            async def sequential_projects():
+                for i in range(args.items):
+                    (await client.post(
+                        "/projects/", data=_project("Seq", i), files={"image": ("p.png", image, "image/png")},
+                    )).raise_for_status()
+
+            async def bulk_projects():
+                payload = {"create": [{**_project("Bulk", i), "image": "p.png"} for i in range(args.items)]}
+                (await client.post(
+                    "/projects/bulk", data={"payload": json.dumps(payload)},
+                    files=[("files", ("p.png", image, "image/png"))],
+                )).raise_for_status()
+
+            timings = {
+                "tags sequential": await _timed(sequential_tags()),
+                "tags bulk": await _timed(bulk_tags()),
+                "projects sequential": await _timed(sequential_projects()),
+                "projects bulk": await _timed(bulk_projects()),
+            }
+
+    print(f"items={args.items}")
+    for name, seconds in timings.items():
+        print(f"  {name:<20} {seconds * 1000:10.1f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # La configuración se lee al importar la app, así que se fija antes
+        os.environ["DATABASE_URL"] = "sqlite:///"
+        os.environ["DATABASE_NAME"] = os.path.join(tmp, "bench.db")
+        os.environ["MEDIA_ROOT"] = os.path.join(tmp, "media")
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Mide la latencia (p50/p99) de `GET /technologies/` mientras hay subidas de
+imágenes en curso, con el procesamiento de Pillow en el hilo de la petición
+(`--image-workers 0`) o en el pool de procesos.
+
+Uso:
+    python -m benchmarks.bench_image_workers --image-workers 0
+    python -m benchmarks.bench_image_workers --image-workers 2
+"""
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import tempfile
+import time
+
+
+def _percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))] * 1000
+
+
+def _large_png() -> bytes:
+    from PIL import Image
+
+    file = io.BytesIO()
+    Image.effect_noise((2400, 1600), 64).convert("RGB").save(file, "png")
+    return file.getvalue()
+
+
+async def _readers(client, duration, concurrency):
+    latencies = []
+    deadline = time.perf_counter() + duration
+
+    async def reader():
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.get("/technologies/")
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+
+    await asyncio.gather(*(reader() for _ in range(concurrency)))
+    return latencies
+
+
+async def _uploaders(client, headers, image, stop, concurrency, counters):
+    async def uploader(n):
+        i = 0
+        while not stop.is_set():
+            i += 1
+            response = await client.post(
+                "/technologies/",
+                headers=headers,
+                data={"name": f"bench-{n}-{i}"},
+                files={"icon": ("bench.png", image, "image/png")},
+            )
+            counters[response.status_code] = counters.get(response.status_code, 0) + 1
+
+    await asyncio.gather(*(uploader(n) for n in range(concurrency)))
+
+
+async def run(args):
+    import httpx
+    from src.main import app
+    from src.core.config import settings
+    from src.core.security import create_access_token
+
+    image = _large_png()
+    headers = {"Authorization": f"Bearer {create_access_token({'sub': settings.ADMIN_USERNAME})}"}
+    transport = httpx.ASGITransport(app=app)
+
+    async with app.router.lifespan_context(app):
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            baseline = await _readers(client, args.duration, args.readers)
+
+            stop = asyncio.Event()
+            counters = {}
+            uploads = asyncio.create_task(
+                _uploaders(client, headers, image, stop, args.uploaders, counters)
+            )
+            await asyncio.sleep(1)
+            loaded = await _readers(client, args.duration, args.readers)
+            stop.set()
+            await uploads
+
+    print(f"IMAGE_WORKERS={settings.IMAGE_WORKERS}")
+    for label, latencies in (("idle", baseline), ("with uploads", loaded)):
+        print(
+            f"  {label:<13} requests={len(latencies):>5} "
+            f"p50={statistics.median(latencies) * 1000:7.1f}ms p99={_percentile(latencies, 99):7.1f}ms"
+        )
+    print(f"  upload responses: {dict(sorted(counters.items()))}")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--image-workers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=20)
+    parser.add_argument("--uploaders", type=int, default=8)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # La configuración se lee al importar la app, así que se fija antes
+        os.environ["IMAGE_WORKERS"] = str(args.image_workers)
+        os.environ["DATABASE_URL"] = "sqlite:///"
+        os.environ["DATABASE_NAME"] = os.path.join(tmp, "bench.db")
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
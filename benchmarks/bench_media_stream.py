@@ -0,0 +1,75 @@
+"""
+Compara el pico de memoria al servir una imagen cargando el BLOB completo
+frente a leerla en bloques con `media_service.iter_media_chunks`.
+
+Uso:
+    python -m benchmarks.bench_media_stream
+"""
+import hashlib
+import os
+import tempfile
+import tracemalloc
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.database import Base
+from src.models.media import Media
+from src.services import media_service
+
+SIZES_MB = [1, 4, 16, 64]
+
+
+def _peak(fn) -> int:
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        with Session() as db:
+            for size_mb in SIZES_MB:
+                data = os.urandom(size_mb * 1024 * 1024)
+                # get_media_info toma el tamaño de la columna `size`, como las imágenes guardadas por la app
+                db.add(Media(
+                    filename=f"{size_mb}mb.bin",
+                    content_type="application/octet-stream",
+                    data=data,
+                    size=len(data),
+                    content_hash=hashlib.sha256(data).hexdigest(),
+                ))
+            db.commit()
+
+        print(f"{'size':>8} {'full load (MB)':>16} {'chunked (MB)':>14}")
+        for size_mb in SIZES_MB:
+            filename = f"{size_mb}mb.bin"
+            with Session() as db:
+                def full_load():
+                    media = db.query(Media).filter(Media.filename == filename).first()
+                    bytes(media.data)
+                    db.expunge_all()
+
+                full_peak = _peak(full_load)
+
+            with Session() as db:
+                streamed = []
+
+                def chunked():
+                    info = media_service.get_media_info(db, filename)
+                    streamed.append(sum(len(chunk) for chunk in media_service.iter_media_chunks(db, info)))
+
+                chunked_peak = _peak(chunked)
+                assert streamed == [size_mb * 1024 * 1024], f"se leyeron {streamed} bytes"
+
+            print(f"{size_mb:>6}MB {full_peak / 2**20:>16.2f} {chunked_peak / 2**20:>14.2f}")
+
+
+if __name__ == "__main__":
+    main()
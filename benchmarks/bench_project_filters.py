@@ -0,0 +1,123 @@
+"""
+Latencia de `GET /projects/?technology=&tag=` sobre un conjunto sintético
+(10k proyectos, 500 tags), con y sin los índices inversos de las tablas
+project_technologies y project_tags. La caché de respuestas se desactiva.
+
+Uso:
+    python -m benchmarks.bench_project_filters --projects 10000 --tags 500
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+INDEXES = ("ix_project_technologies_technology_id_project_id", "ix_project_tags_tag_id_project_id")
+
+
+# Respuestas reducidas (fields=id,title) para que domine el coste de la consulta
+QUERIES = [
+    "tag=tag-7",
+    "tag=tag-7&tag=tag-11",
+    "technology=tech-3&tag=tag-7",
+    "technology=tech-3&technology=tech-5&match=any",
+    "technology=tech-3&tag=tag-7&tag=tag-11&match=any&include_total=true",
+]
+
+
+def _seed(args):
+    from sqlalchemy import insert
+
+    from src.database import engine
+    from src.models.project import Project
+    from src.models.tag import Tag
+    from src.models.technology import Technology
+    from src.models.project_tag import project_tags
+    from src.models.project_technology import project_technologies
+
+    rng = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(Tag), [{"name": f"tag-{i}"} for i in range(args.tags)])
+        conn.execute(insert(Technology), [
+            {"name": f"tech-{i}", "icon": f"/static/images/t{i}.png"} for i in range(args.technologies)
+        ])
+        conn.execute(insert(Project), [
+            {
+                "title": f"Project {i}",
+                "description_en": "en",
+                "description_es": "es",
+                "image_route": f"/static/images/p{i}.png",
+            }
+            for i in range(args.projects)
+        ])
+        tag_ids, technology_ids = range(1, args.tags + 1), range(1, args.technologies + 1)
+        # Sesgo hacia los primeros ids para que los tags consultados tengan cientos de proyectos
+        conn.execute(insert(project_tags), [
+            {"project_id": project_id, "tag_id": tag_id}
+            for project_id in range(1, args.projects + 1)
+            for tag_id in {int(rng.paretovariate(0.6)) % args.tags + 1 for _ in range(4)} | {rng.choice(tag_ids)}
+        ])
+        conn.execute(insert(project_technologies), [
+            {"project_id": project_id, "technology_id": technology_id}
+            for project_id in range(1, args.projects + 1)
+            for technology_id in set(rng.sample(technology_ids, 3))
+        ])
+
+
+async def _measure(client, urls, repeat):
+    latencies = []
+    for _ in range(repeat):
+        for url in urls:
+            start = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000, max(latencies) * 1000
+
+
+async def run(args):
+    import httpx
+    from sqlalchemy import text
+
+    from src.database import engine
+    from src.main import app
+
+    urls = [f"/projects/?fields=id,title&limit=20&{query}" for query in QUERIES]
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        _seed(args)
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            indexed = await _measure(client, urls, args.repeat)
+            with engine.begin() as conn:
+                for name in INDEXES:
+                    conn.execute(text(f"DROP INDEX {name}"))
+                conn.execute(text("ANALYZE"))
+            scan = await _measure(client, urls, args.repeat)
+
+    print(f"projects={args.projects} tags={args.tags} technologies={args.technologies}")
+    print(f"  reverse indexes     p50={indexed[0]:8.2f}ms max={indexed[1]:8.2f}ms")
+    print(f"  primary keys only   p50={scan[0]:8.2f}ms max={scan[1]:8.2f}ms")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--tags", type=int, default=500)
+    parser.add_argument("--technologies", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # La configuración se lee al importar la app, así que se fija antes
+        os.environ["RESPONSE_CACHE_BACKEND"] = "none"
+        os.environ["DATABASE_URL"] = "sqlite:///"
+        os.environ["DATABASE_NAME"] = os.path.join(tmp, "bench.db")
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Latencia de `GET /projects/search?q=` sobre miles de proyectos sintéticos,
+frente a lo que hace hoy el frontend: descargar todos los proyectos y
+filtrarlos en el cliente. La caché de respuestas se desactiva.
+
+Uso:
+    python -m benchmarks.bench_project_search --projects 3000
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import tempfile
+import time
+
+WORDS = (
+    "api backend frontend python fastapi astro react database cache search "
+    "portfolio mobile cloud docker kubernetes analytics dashboard payments "
+    "realtime chat maps weather blog commerce auth graphql streaming"
+).split()
+QUERIES = ["fastapi", "docker cloud", "pay", "realtime chat", "weather maps"]
+
+
+def _seed(projects):
+    from sqlalchemy import insert
+
+    from src.database import engine
+    from src.models.project import Project
+    from src.models.project_search import ensure_project_search
+
+    rng = random.Random(42)
+    rows = [
+        {
+            "title": " ".join(rng.sample(WORDS, 3)).title(),
+            "description_en": " ".join(rng.choices(WORDS, k=80)),
+            "description_es": " ".join(rng.choices(WORDS, k=80)),
+            "image_route": f"/static/images/p{i}.png",
+        }
+        for i in range(projects)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Project), rows)
+    # Construye el índice para las filas insertadas sin pasar por el servicio
+    ensure_project_search(engine)
+
+
+async def _measure(client, urls, repeat, check=None):
+    latencies = []
+    for _ in range(repeat):
+        for url in urls:
+            start = time.perf_counter()
+            response = await client.get(url)
+            response.raise_for_status()
+            if check:
+                check(response)
+            latencies.append(time.perf_counter() - start)
+    return statistics.median(latencies) * 1000, max(latencies) * 1000
+
+
+async def run(args):
+    import httpx
+    from src.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        _seed(args.projects)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+            search = await _measure(client, [f"/projects/search?q={q}" for q in QUERIES], args.repeat)
+
+            def client_side_filter(response):
+                for q in QUERIES:
+                    terms = q.split()
+                    [p for p in response.json() if all(t in (p["title"] + p["description_en"]).lower() for t in terms)]
+
+            full = await _measure(client, [f"/projects/?limit={args.projects}"], args.repeat, client_side_filter)
+
+    print(f"projects={args.projects}")
+    print(f"  /projects/search          p50={search[0]:8.2f}ms max={search[1]:8.2f}ms (per query)")
+    print(f"  download all + filter     p50={full[0]:8.2f}ms max={full[1]:8.2f}ms (all {len(QUERIES)} queries)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=3000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # La configuración se lee al importar la app, así que se fija antes
+        os.environ["RESPONSE_CACHE_BACKEND"] = "none"
+        os.environ["DATABASE_URL"] = "sqlite:///"
+        os.environ["DATABASE_NAME"] = os.path.join(tmp, "bench.db")
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
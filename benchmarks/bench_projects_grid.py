@@ -0,0 +1,92 @@
+"""
+Tamaño de la respuesta y latencia (p50/p99) de `GET /projects/` para la
+rejilla de proyectos del frontend: respuesta completa, `fields=` con solo lo
+que muestra una tarjeta y `lang=` con una sola descripción. La caché de
+respuestas se desactiva para medir la consulta y la serialización.
+
+Uso:
+    python -m benchmarks.bench_projects_grid --projects 100 --requests 200
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+
+VARIANTS = {
+    "full": "",
+    "card fields": "&fields=title,image_route,project_url",
+    "lang=en": "&lang=en",
+}
+
+
+def _percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))] * 1000
+
+
+def _seed(projects, description_bytes):
+    from src.database import SessionLocal
+    from src.models.project import Project
+    from src.models.tag import Tag
+    from src.models.technology import Technology
+
+    text = ("Lorem ipsum dolor sit amet. " * (description_bytes // 28 + 1))[:description_bytes]
+    with SessionLocal() as db:
+        technologies = [Technology(name=f"tech-{i}", icon=f"/static/images/t{i}.png") for i in range(10)]
+        tags = [Tag(name=f"tag-{i}") for i in range(5)]
+        for i in range(projects):
+            db.add(Project(
+                title=f"Project {i}",
+                description_en=text,
+                description_es=text,
+                image_route=f"/static/images/p{i}.png",
+                project_url=f"https://example.com/{i}",
+                technologies=technologies[i % 10:i % 10 + 3],
+                tags=tags[i % 5:i % 5 + 2],
+            ))
+        db.commit()
+
+
+async def run(args):
+    import httpx
+    from src.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app):
+        _seed(args.projects, args.description_bytes)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            print(f"{'variant':<12} {'bytes':>10} {'p50 ms':>9} {'p99 ms':>9}")
+            for label, query in VARIANTS.items():
+                url = f"/projects/?limit={args.projects}{query}"
+                latencies, size = [], 0
+                for _ in range(args.requests):
+                    start = time.perf_counter()
+                    response = await client.get(url)
+                    response.raise_for_status()
+                    latencies.append(time.perf_counter() - start)
+                    size = len(response.content)
+                print(
+                    f"{label:<12} {size:>10} "
+                    f"{statistics.median(latencies) * 1000:>9.2f} {_percentile(latencies, 99):>9.2f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=100)
+    parser.add_argument("--description-bytes", type=int, default=2000)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # La configuración se lee al importar la app, así que se fija antes
+        os.environ["RESPONSE_CACHE_BACKEND"] = "none"
+        os.environ["DATABASE_URL"] = "sqlite:///"
+        os.environ["DATABASE_NAME"] = os.path.join(tmp, "bench.db")
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
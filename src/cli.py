@@ -0,0 +1,99 @@
+"""
+Comandos de mantenimiento de la aplicación.
+
+Uso:
+    python -m src.cli dedupe-media
+    python -m src.cli migrate-media --to filesystem
+    python -m src.cli import-translations [--dir src/i18n] [--lang en]
+    python -m src.cli export-translations [--dir src/i18n] [--lang en]
+"""
+import argparse
+import logging
+
+from src.core.logging import setup_logging
+from src.core.translations import DatabaseTranslationStore, TranslationStore, copy_translations
+from src.database import SessionLocal, engine, Base, upgrade_schema
+from src.models.project_search import ensure_project_search
+from src.utils import backfill_media_metadata, deduplicate_media, migrate_media_storage
+
+logger = logging.getLogger(__name__)
+
+
+def prepare_database():
+    """Crea las tablas y columnas que falten, igual que el arranque de la app."""
+    Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    ensure_project_search(engine)
+
+
+def dedupe_media(args: argparse.Namespace):
+    prepare_database()
+    backfill_media_metadata()
+    db = SessionLocal()
+    try:
+        result = deduplicate_media(db)
+    finally:
+        db.close()
+    print(
+        f"Grupos duplicados: {result['duplicate_groups']}, "
+        f"registros eliminados: {result['removed_rows']}, "
+        f"imágenes sin referencias: {result['orphans']}"
+    )
+
+
+def migrate_media(args: argparse.Namespace):
+    prepare_database()
+    backfill_media_metadata()
+    db = SessionLocal()
+    try:
+        moved = migrate_media_storage(db, args.to)
+    finally:
+        db.close()
+    print(f"Imágenes movidas a '{args.to}': {moved}")
+
+
+def import_translations(args: argparse.Namespace):
+    prepare_database()
+    copied = copy_translations(TranslationStore(args.dir), DatabaseTranslationStore(SessionLocal), args.lang)
+    for lang, keys in copied.items():
+        print(f"Idioma '{lang}' importado: {keys} claves")
+
+
+def export_translations(args: argparse.Namespace):
+    prepare_database()
+    copied = copy_translations(DatabaseTranslationStore(SessionLocal), TranslationStore(args.dir), args.lang)
+    for lang, keys in copied.items():
+        print(f"Idioma '{lang}' exportado: {keys} claves")
+
+
+def main(argv=None):
+    setup_logging()
+    parser = argparse.ArgumentParser(prog="python -m src.cli")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    dedupe = commands.add_parser(
+        "dedupe-media", help="Fusiona las imágenes duplicadas por contenido (migración única)."
+    )
+    dedupe.set_defaults(func=dedupe_media)
+
+    migrate = commands.add_parser(
+        "migrate-media", help="Mueve los bytes de las imágenes a otro backend de almacenamiento."
+    )
+    migrate.add_argument("--to", choices=["database", "filesystem"], required=True)
+    migrate.set_defaults(func=migrate_media)
+
+    for name, func, help_text in (
+        ("import-translations", import_translations, "Copia los archivos JSON de idioma a la base de datos."),
+        ("export-translations", export_translations, "Escribe los idiomas de la base de datos como archivos JSON."),
+    ):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("--dir", default="src/i18n", help="Directorio de los archivos {lang}.json")
+        command.add_argument("--lang", action="append", help="Solo este idioma (se puede repetir)")
+        command.set_defaults(func=func)
+
+    args = parser.parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+from collections import Counter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Type, TypeVar
+
+from fastapi import HTTPException, UploadFile, status
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+
+from src.utils import save_image
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class BulkErrors:
+    """
+    Errores de validación de una operación en lote, uno por elemento. Se
+    acumulan todos en una sola pasada y se devuelven juntos con un 422, sin
+    haber escrito nada.
+    """
+
+    def __init__(self):
+        self.items: List[dict] = []
+
+    def add(self, op: str, index: int, msg: str) -> None:
+        self.items.append({"op": op, "index": index, "msg": msg})
+
+    def raise_if_any(self) -> None:
+        if self.items:
+            raise HTTPException(status_code=status.HTTP_422_UNPROCESSABLE_CONTENT, detail=self.items)
+
+
+def parse_payload(schema: Type[M], payload: str) -> M:
+    """Valida el campo `payload` (JSON) de un formulario multipart en lote."""
+    try:
+        return schema.model_validate_json(payload)
+    except ValidationError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+            detail=e.errors(include_url=False, include_context=False),
+        )
+
+
+def bundle_files(files: Sequence[UploadFile]) -> Dict[str, UploadFile]:
+    """Archivos del lote por nombre, que es como los referencian los elementos."""
+    bundle: Dict[str, UploadFile] = {}
+    for file in files:
+        if file.filename in bundle:
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_CONTENT,
+                detail=f"Duplicate file name in bundle: '{file.filename}'",
+            )
+        bundle[file.filename] = file
+    return bundle
+
+
+def check_files(errors: BulkErrors, op: str, index: int, name: Optional[str], bundle: Dict[str, UploadFile]) -> None:
+    if name is not None and name not in bundle:
+        errors.add(op, index, f"File '{name}' is not in the bundle")
+
+
+def save_bundle(db: Session, bundle: Dict[str, UploadFile], names: Iterable[Optional[str]]) -> Dict[str, str]:
+    """
+    Guarda (sin confirmar) cada archivo del lote una sola vez, con tantas
+    referencias como elementos lo usan, y devuelve nombre -> ruta pública.
+    Debe hacerse antes de liberar imágenes antiguas, por si son las mismas.
+    """
+    uses = Counter(name for name in names if name is not None)
+    return {
+        name: save_image(db, bundle[name], commit=False, references=count)
+        for name, count in uses.items()
+    }
+
+
+def check_ids(errors: BulkErrors, db: Session, model, updates: Sequence[int], deletes: Sequence[int]) -> None:
+    """Los ids a actualizar o borrar deben existir y aparecer una sola vez en el lote."""
+    wanted = set(updates) | set(deletes)
+    found = {id_ for (id_,) in db.query(model.id).filter(model.id.in_(wanted))} if wanted else set()
+    seen = set()
+    for op, ids in (("update", updates), ("delete", deletes)):
+        for index, id_ in enumerate(ids):
+            if id_ not in found:
+                errors.add(op, index, f"{model.__name__} {id_} not found")
+            elif id_ in seen:
+                errors.add(op, index, f"{model.__name__} {id_} appears more than once")
+            seen.add(id_)
+
+
+def check_unique_names(
+    errors: BulkErrors,
+    db: Session,
+    model,
+    creates: Sequence[str],
+    updates: Iterable[Tuple[int, int, Optional[str]]],
+    deletes: Sequence[int],
+) -> None:
+    """
+    Comprueba que los nombres (únicos en la tabla) sigan siéndolo después del
+    lote. `updates` son tuplas (index, id, nombre nuevo). Un nombre queda
+    libre si su dueño actual se borra; si se renombra, solo queda libre para
+    las altas, que se insertan después de todos los cambios de nombre. Los
+    cambios de nombre se aplican fila a fila, así que un intercambio (A -> "b",
+    B -> "a") violaría la restricción UNIQUE a mitad del lote: se rechaza.
+    """
+    candidates = [("create", index, None, name) for index, name in enumerate(creates)]
+    candidates += [("update", index, id_, name) for index, id_, name in updates if name is not None]
+    names = {name for *_, name in candidates}
+    holders = dict(db.query(model.name, model.id).filter(model.name.in_(names))) if names else {}
+    renamed = {id_ for _, _, id_, _ in candidates if id_ is not None}
+    seen = set()
+    for op, index, id_, name in candidates:
+        holder = holders.get(name)
+        freed = set(deletes) | (renamed if op == "create" else set())
+        if name in seen or (holder is not None and holder != id_ and holder not in freed):
+            errors.add(op, index, f"{model.__name__} with name '{name}' already exists")
+        seen.add(name)
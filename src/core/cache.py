@@ -0,0 +1,322 @@
+import json
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.core.config import settings
+
+
+class LRUByteCache:
+    """
+    Caché LRU en memoria acotada por el total de bytes almacenados y, si se
+    indica `max_items`, también por número de entradas. Es segura entre
+    hilos, ya que las rutas síncronas se ejecutan en el threadpool de Starlette.
+
+    El tamaño de cada entrada es el de su `data` si el valor lo expone o,
+    en su defecto, el de `len(value)`. Con `max_bytes=None` no se mide: la
+    caché queda acotada solo por `max_items`.
+    """
+
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        max_item_bytes: Optional[int] = None,
+        max_items: Optional[int] = None,
+    ):
+        self.max_bytes = max_bytes
+        self.max_item_bytes = max_item_bytes if max_item_bytes is not None else max_bytes
+        self.max_items = max_items
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _sizeof(value: Any) -> int:
+        data = getattr(value, "data", value)
+        try:
+            return len(data)
+        except TypeError:
+            return sys.getsizeof(data)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def accepts(self, size: int) -> bool:
+        """Indica si una entrada de `size` bytes cabe en la caché."""
+        if self.max_items is not None and self.max_items <= 0:
+            return False
+        if self.max_bytes is None:
+            return True
+        return 0 < self.max_bytes and size <= min(self.max_item_bytes, self.max_bytes)
+
+    def set(self, key: Hashable, value: Any) -> bool:
+        """Guarda una entrada y devuelve False si es demasiado grande para la caché."""
+        size = self._sizeof(value) if self.max_bytes is not None else 0
+        if not self.accepts(size):
+            return False
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while (self.max_bytes is not None and self._bytes > self.max_bytes) or (
+                self.max_items is not None and len(self._entries) > self.max_items
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+        return True
+
+    def invalidate(self, key: Hashable) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "max_items": self.max_items,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class MemoryCacheBackend:
+    """
+    Backend en memoria del proceso para `ResponseCache`. Al cambiar la versión
+    se vacía entero: todas sus entradas pertenecían a la versión anterior.
+    Con varios workers cada proceso tiene su propia copia y su propia versión.
+    """
+
+    # Sin E/S: se consulta directamente desde el event loop
+    blocking = False
+
+    def __init__(self, max_bytes: int):
+        self._cache = LRUByteCache(max_bytes)
+        self._version = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._cache.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self._cache.set(key, value)
+
+    def get_version(self) -> int:
+        return self._version
+
+    def incr_version(self) -> int:
+        with self._lock:
+            self._version += 1
+            self._cache.clear()
+            return self._version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._version = 0
+            self._cache.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        stats = self._cache.stats()
+        return {"entries": stats["entries"], "bytes": stats["bytes"], "max_bytes": stats["max_bytes"]}
+
+
+class RedisCacheBackend:
+    """
+    Backend sobre cualquier servidor compatible con Redis (Redis, Valkey,
+    KeyDB...). La versión es un contador compartido, así que una escritura en
+    un worker invalida la caché de todos.
+    """
+
+    VERSION_KEY = "response-cache:version"
+    # Cada operación es un viaje de red: desde código async se llama en el threadpool
+    blocking = True
+
+    def __init__(self, url: str, ttl: int = 0, prefix: str = "response-cache:"):
+        try:
+            import redis  # Dependencia opcional, solo para RESPONSE_CACHE_BACKEND=redis
+        except ImportError as exc:
+            raise RuntimeError("RESPONSE_CACHE_BACKEND=redis requiere el paquete `redis`") from exc
+        self._client = redis.Redis.from_url(url)
+        self._ttl = ttl or None
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self._client.set(self._prefix + key, value, ex=self._ttl)
+
+    def get_version(self) -> int:
+        return int(self._client.get(self.VERSION_KEY) or 0)
+
+    def incr_version(self) -> int:
+        return int(self._client.incr(self.VERSION_KEY))
+
+    def clear(self) -> None:
+        keys = list(self._client.scan_iter(match=self._prefix + "*"))
+        if keys:
+            self._client.delete(*keys)
+
+    def stats(self) -> Dict[str, Any]:
+        return {}
+
+
+class ResponseCache:
+    """
+    Caché de respuestas JSON ya serializadas. La clave incluye una versión
+    global del contenido que los servicios incrementan en cada escritura, así
+    que nunca hace falta invalidar entradas concretas. Sin backend
+    (`RESPONSE_CACHE_BACKEND=none`) no guarda nada.
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def key(self, request: Request, *vary: str) -> str:
+        """Versión + ruta + parámetros de consulta ordenados (+ partes extra que varíen la respuesta)."""
+        query = "&".join(f"{k}={v}" for k, v in sorted(request.query_params.multi_items()))
+        return ":".join((str(self.version()), request.url.path, query, *vary))
+
+    def version(self) -> int:
+        return self.backend.get_version() if self.backend is not None else 0
+
+    @property
+    def blocking(self) -> bool:
+        """Indica si el backend hace E/S bloqueante (p. ej. Redis)."""
+        return getattr(self.backend, "blocking", False)
+
+    def lookup(self, request: Request, *vary: str) -> tuple[str, Optional[bytes]]:
+        """Clave de la petición y su entrada guardada (None si no existe), en una sola llamada."""
+        key = self.key(request, *vary)
+        return key, self.get(key)
+
+    def bump_version(self) -> None:
+        """Marca como obsoletas todas las respuestas guardadas. Se llama tras cada commit de escritura."""
+        if self.backend is not None:
+            self.backend.incr_version()
+
+    def get(self, key: str) -> Optional[bytes]:
+        body = self.backend.get(key) if self.backend is not None else None
+        with self._lock:
+            if body is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return body
+
+    def set(self, key: str, body: bytes) -> None:
+        if self.backend is not None:
+            self.backend.set(key, body)
+
+    def clear(self) -> None:
+        if self.backend is not None:
+            self.backend.clear()
+        self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": type(self.backend).__name__ if self.backend is not None else None,
+            "version": self.version(),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            **(self.backend.stats() if self.backend is not None else {}),
+        }
+
+
+def create_response_cache() -> ResponseCache:
+    if settings.RESPONSE_CACHE_BACKEND == "redis":
+        return ResponseCache(RedisCacheBackend(settings.RESPONSE_CACHE_REDIS_URL, settings.RESPONSE_CACHE_TTL))
+    if settings.RESPONSE_CACHE_BACKEND == "memory":
+        return ResponseCache(MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_BYTES))
+    return ResponseCache()
+
+
+response_cache = create_response_cache()
+
+
+@dataclass
+class CachedResult:
+    """Datos a serializar más cabeceras que deben guardarse junto a ellos (p. ej. `Link`)."""
+    data: Any
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def _pack(headers: Dict[str, str], body: bytes) -> bytes:
+    # Las cabeceras van en la primera línea, así cualquier backend guarda un único valor de bytes
+    return json.dumps(headers).encode() + b"\n" + body
+
+
+def _unpack(entry: bytes) -> tuple[Dict[str, str], bytes]:
+    headers, _, body = entry.partition(b"\n")
+    return json.loads(headers), body
+
+
+async def _call_inline(fn: Callable[..., Any], *args: Any) -> Any:
+    return fn(*args)
+
+
+async def cached_json(
+    request: Request,
+    adapter: TypeAdapter,
+    load: Callable[[], Awaitable[Any]],
+    *vary: str,
+) -> Response:
+    """
+    Devuelve la respuesta guardada para esta petición o, si no existe, la
+    genera con `load()`, la serializa con `adapter` y la guarda. `load` puede
+    devolver un `CachedResult` para guardar también cabeceras. La clave se
+    calcula antes de consultar la base de datos: si una escritura cambia la
+    versión mientras tanto, lo guardado queda bajo la versión antigua.
+    """
+    # Con un backend de red (Redis) las consultas no deben bloquear el event loop
+    call = run_in_threadpool if response_cache.blocking else _call_inline
+    key, entry = await call(response_cache.lookup, request, *vary)
+    if entry is not None:
+        headers, body = _unpack(entry)
+        state = "HIT"
+    else:
+        result = await load()
+        if not isinstance(result, CachedResult):
+            result = CachedResult(result)
+        headers = result.headers
+        body = adapter.dump_json(adapter.validate_python(result.data, from_attributes=True), by_alias=True)
+        await call(response_cache.set, key, _pack(headers, body))
+        state = "MISS"
+    return Response(content=body, media_type="application/json", headers={**headers, "X-Cache": state})
@@ -1,6 +1,6 @@
 from pydantic_settings import BaseSettings
 from pydantic import ConfigDict, field_validator
-from typing import List, Union
+from typing import List, Literal, Union
 from pathlib import Path
 
 SRC_DIR = Path(__file__).resolve().parent.parent
@@ -14,6 +14,20 @@ class Settings(BaseSettings):
     # --- Configuración de la Base de Datos ---
     DATABASE_URL: str
     DATABASE_NAME: str
+    # Lecturas públicas con AsyncSession (aiosqlite / asyncpg) en lugar del threadpool
+    DB_ASYNC: bool = False
+    # Pool de conexiones (PostgreSQL). Con PgBouncer usar DB_USE_NULL_POOL=true
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: int = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_USE_NULL_POOL: bool = False
+    DB_STATEMENT_TIMEOUT_MS: int = 0
+    # PRAGMA aplicados a cada conexión SQLite (vacío = valor por defecto de SQLite)
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
 
     # --- Configuración de Seguridad ---
     ADMIN_USERNAME: str
@@ -28,7 +42,43 @@ class Settings(BaseSettings):
     ALLOWED_HEADERS: List[str] = ["*"]
     ALLOWED_EXPOSED_HEADERS: List[str] = []
     ALLOWED_CREDENTIALS: bool = False
+
+    # --- Configuración de Media ---
+    MEDIA_CHUNK_SIZE: int = 64 * 1024
+    # Dónde se guardan los bytes de las imágenes nuevas ("database" o "filesystem")
+    MEDIA_STORAGE: Literal["database", "filesystem"] = "database"
+    MEDIA_ROOT: Path = SRC_DIR.parent / "media"
+    # Caché en memoria de imágenes frecuentes (0 la desactiva)
+    MEDIA_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    MEDIA_CACHE_MAX_ITEM_BYTES: int = 1024 * 1024
+    # Variantes generadas al subir una imagen ("webp", "avif")
+    MEDIA_VARIANT_WIDTHS: List[int] = [320, 640, 1280]
+    MEDIA_VARIANT_FORMATS: List[str] = ["webp"]
+    # Procesos dedicados a Pillow (0 = en el hilo de la petición) y tamaño de su cola
+    IMAGE_WORKERS: int = 2
+    IMAGE_WORKER_QUEUE_SIZE: int = 4
+    IMAGE_WORKER_QUEUE_TIMEOUT: float = 0.5
+
+    # --- CV en PDF ---
+    # PDFs ya generados, uno por idioma y contenido de Markdown + CSS
+    CV_CACHE_DIR: Path = SRC_DIR.parent / "cache" / "cv"
+
+    # --- Caché de respuestas de los listados públicos ---
+    # "memory" (por proceso), "redis" (compartida entre workers) o "none"
+    RESPONSE_CACHE_BACKEND: Literal["memory", "redis", "none"] = "memory"
+    RESPONSE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+    RESPONSE_CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    # Caducidad de las entradas en Redis; las de versiones antiguas dejan de leerse antes
+    RESPONSE_CACHE_TTL: int = 24 * 60 * 60
     
+    # --- Traducciones (src/i18n) ---
+    # "files" (JSON en src/i18n) o "database" (tabla `translations`, compartida entre workers)
+    I18N_BACKEND: Literal["files", "database"] = "files"
+    # Recargar los idiomas cuando cambian (watchfiles o sondeo de mtime; con
+    # "database", consulta de las versiones cada I18N_POLL_INTERVAL segundos)
+    I18N_WATCH: bool = True
+    I18N_POLL_INTERVAL: float = 2.0
+
     @field_validator("ALLOWED_HOSTS", mode="before")
     @classmethod
     def assemble_cors_origins(cls, v: Union[str, List[str]]) -> Union[List[str], str]:
@@ -0,0 +1,18 @@
+from sqlalchemy import Table, func, select
+from sqlalchemy.orm import with_expression
+
+
+def with_project_counts(query, model, association: Table, column: str):
+    """
+    Rellena `model.project_count` con el número de proyectos de cada fila,
+    contados con un solo GROUP BY sobre la tabla de asociación (servido por
+    su índice `(column, project_id)`), sin cargar la relación `projects`.
+    """
+    counts = (
+        select(association.c[column].label("id"), func.count().label("projects"))
+        .group_by(association.c[column])
+        .subquery()
+    )
+    return query.outerjoin(counts, counts.c.id == model.id).options(
+        with_expression(model.project_count, func.coalesce(counts.c.projects, 0))
+    )
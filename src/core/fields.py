@@ -0,0 +1,108 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Type
+
+from fastapi import HTTPException, status
+from pydantic import BaseModel, ConfigDict, TypeAdapter, create_model
+from sqlalchemy import Column, inspect
+from sqlalchemy.orm import load_only
+
+# Campos traducidos: `description_en`, `description_es`...
+LOCALIZED_FIELD = re.compile(r"^(?P<base>.+)_(?P<lang>[a-z]{2})$")
+
+
+def localized_fields(schema: Type[BaseModel]) -> Dict[str, str]:
+    """Campo -> idioma, para los campos con la misma base en más de un idioma."""
+    matches = {name: LOCALIZED_FIELD.match(name) for name in schema.model_fields}
+    bases: Dict[str, int] = {}
+    for match in filter(None, matches.values()):
+        bases[match["base"]] = bases.get(match["base"], 0) + 1
+    return {
+        name: match["lang"]
+        for name, match in matches.items()
+        if match and bases[match["base"]] > 1
+    }
+
+
+def supported_languages(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    """Idiomas en los que el esquema tiene campos traducidos."""
+    return tuple(sorted(set(localized_fields(schema).values())))
+
+
+def select_fields(
+    schema: Type[BaseModel],
+    fields: Optional[str] = None,
+    lang: Optional[str] = None,
+) -> Optional[Tuple[str, ...]]:
+    """
+    Traduce `?fields=a,b` y `?lang=xx` a la tupla de campos del esquema que
+    hay que cargar y serializar (siempre con `id`, que usa la paginación).
+    Devuelve None si se pide la respuesta completa.
+    """
+    available = list(schema.model_fields)
+    selected = available
+    if fields:
+        selected = list(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+        unknown = [name for name in selected if name not in schema.model_fields]
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(unknown)}",
+            )
+    if lang:
+        localized = localized_fields(schema)
+        if lang not in set(localized.values()):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unsupported language '{lang}'",
+            )
+        selected = [name for name in selected if localized.get(name, lang) == lang]
+    if "id" in schema.model_fields and "id" not in selected:
+        selected = ["id", *selected]
+    if selected == available:
+        return None
+    return tuple(name for name in available if name in selected)
+
+
+@lru_cache(maxsize=256)
+def partial_model(schema: Type[BaseModel], fields: Optional[Tuple[str, ...]]) -> Type[BaseModel]:
+    """Copia del esquema solo con `fields` (o el propio esquema si es None)."""
+    if fields is None:
+        return schema
+    definitions = {
+        name: (info.annotation, info)
+        for name, info in schema.model_fields.items()
+        if name in fields
+    }
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=ConfigDict(from_attributes=True),
+        **definitions,
+    )
+
+
+@lru_cache(maxsize=256)
+def list_adapter(schema: Type[BaseModel], fields: Optional[Tuple[str, ...]] = None) -> TypeAdapter:
+    """TypeAdapter de `List[...]` para serializar un listado con los campos elegidos."""
+    return TypeAdapter(List[partial_model(schema, fields)])
+
+
+@lru_cache(maxsize=256)
+def item_adapter(schema: Type[BaseModel], fields: Optional[Tuple[str, ...]] = None) -> TypeAdapter:
+    """TypeAdapter para serializar un solo elemento con los campos elegidos."""
+    return TypeAdapter(partial_model(schema, fields))
+
+
+def load_only_fields(model, fields: Optional[Tuple[str, ...]]) -> tuple:
+    """
+    Opción `load_only` con las columnas de `model` que aparecen en `fields`,
+    para que el SELECT no traiga el resto. Sin `fields` no cambia nada.
+    """
+    if fields is None:
+        return ()
+    # Los `query_expression` (p. ej. project_count) no son columnas: se rellenan con with_expression
+    columns = [
+        attr for attr in inspect(model).column_attrs
+        if attr.key in fields and isinstance(attr.expression, Column)
+    ]
+    return (load_only(*(getattr(model, attr.key) for attr in columns)),)
@@ -0,0 +1,96 @@
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Iterable, Optional
+
+from fastapi import Request
+
+
+def make_etag(value: str) -> str:
+    """Construye un ETag fuerte a partir de un identificador (hash, versión...)."""
+    return f'"{value}"'
+
+
+def http_date(value: datetime) -> str:
+    """Formatea una fecha como cabecera HTTP (RFC 7231). Las fechas sin zona se asumen UTC."""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Comparación débil de If-None-Match contra un ETag (RFC 7232, sección 3.2)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag.removeprefix("W/") == etag.removeprefix("W/") for tag in candidates)
+
+
+def accepts_media_type(accept: Optional[str], media_type: str) -> bool:
+    """
+    Indica si la cabecera Accept anuncia explícitamente un tipo MIME
+    (los comodines no cuentan: se usan para negociar formatos opcionales).
+    """
+    if not accept:
+        return False
+    for part in accept.split(","):
+        value, *params = [item.strip() for item in part.split(";")]
+        if value.lower() != media_type:
+            continue
+        for param in params:
+            name, _, q = param.partition("=")
+            if name.strip() == "q" and q.strip() in ("0", "0.0", "0.00", "0.000"):
+                return False
+        return True
+    return False
+
+
+def preferred_language(accept_language: Optional[str], supported: Iterable[str]) -> Optional[str]:
+    """
+    Idioma de `supported` con mayor calidad en Accept-Language (`es-MX` cuenta
+    como `es`; a igual calidad gana el primero). None si ninguno coincide.
+    """
+    if not accept_language:
+        return None
+    supported = set(supported)
+    best, best_q = None, 0.0
+    for part in accept_language.split(","):
+        tag, *params = [item.strip() for item in part.split(";")]
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        language = tag.lower().split("-")[0]
+        if language in supported and q > best_q:
+            best, best_q = language, q
+    return best
+
+
+def is_not_modified(
+    request: Request, etag: Optional[str] = None, last_modified: Optional[datetime] = None
+) -> bool:
+    """
+    Indica si la petición condicional puede responderse con 304.
+    If-None-Match tiene prioridad sobre If-Modified-Since.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return etag is not None and etag_matches(if_none_match, etag)
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
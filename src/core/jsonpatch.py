@@ -0,0 +1,131 @@
+import copy
+from typing import Any, List, Tuple
+
+
+class PatchError(ValueError):
+    """El parche no es válido o no se puede aplicar al documento."""
+
+
+class PatchConflict(PatchError):
+    """Una operación `test` de JSON Patch no se cumplió."""
+
+
+def merge_patch(target: Any, patch: Any) -> Any:
+    """JSON Merge Patch (RFC 7396): `null` borra la clave, los objetos se fusionan."""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+def _pointer(path: Any) -> List[str]:
+    if not isinstance(path, str) or (path and not path.startswith("/")):
+        raise PatchError(f"Invalid JSON pointer: {path!r}")
+    return [token.replace("~1", "/").replace("~0", "~") for token in path.split("/")[1:]]
+
+
+def _index(container: list, token: str, insert: bool = False) -> int:
+    if insert and token == "-":
+        return len(container)
+    if not token.isdigit() or (len(token) > 1 and token.startswith("0")):
+        raise PatchError(f"Invalid array index: {token!r}")
+    index = int(token)
+    if index > len(container) or (not insert and index == len(container)):
+        raise PatchError(f"Array index out of range: {index}")
+    return index
+
+
+def _parent(document: Any, tokens: List[str]) -> Tuple[Any, str]:
+    node = document
+    for token in tokens[:-1]:
+        if isinstance(node, dict) and token in node:
+            node = node[token]
+        elif isinstance(node, list):
+            node = node[_index(node, token)]
+        else:
+            raise PatchError(f"Path not found: /{'/'.join(tokens)}")
+    return node, tokens[-1]
+
+
+def _get(document: Any, path: Any) -> Any:
+    tokens = _pointer(path)
+    if not tokens:
+        return document
+    parent, token = _parent(document, tokens)
+    if isinstance(parent, dict) and token in parent:
+        return parent[token]
+    if isinstance(parent, list):
+        return parent[_index(parent, token)]
+    raise PatchError(f"Path not found: {path}")
+
+
+def _remove(document: Any, path: Any) -> Any:
+    tokens = _pointer(path)
+    if not tokens:
+        raise PatchError("Cannot remove the whole document")
+    parent, token = _parent(document, tokens)
+    if isinstance(parent, dict) and token in parent:
+        return parent.pop(token)
+    if isinstance(parent, list):
+        return parent.pop(_index(parent, token))
+    raise PatchError(f"Path not found: {path}")
+
+
+def _add(document: Any, path: Any, value: Any, replace: bool = False) -> Any:
+    tokens = _pointer(path)
+    if not tokens:
+        return value
+    parent, token = _parent(document, tokens)
+    if isinstance(parent, dict):
+        if replace and token not in parent:
+            raise PatchError(f"Path not found: {path}")
+        parent[token] = value
+    elif isinstance(parent, list):
+        if replace:
+            parent[_index(parent, token)] = value
+        else:
+            parent.insert(_index(parent, token, insert=True), value)
+    else:
+        raise PatchError(f"Path not found: {path}")
+    return document
+
+
+def json_patch(document: Any, operations: Any) -> Any:
+    """
+    JSON Patch (RFC 6902): aplica la lista de operaciones sobre una copia del
+    documento. Si alguna falla no se devuelve nada a medias: se lanza PatchError.
+    """
+    if not isinstance(operations, list):
+        raise PatchError("A JSON Patch document must be an array of operations")
+    document = copy.deepcopy(document)
+    for operation in operations:
+        if not isinstance(operation, dict) or "path" not in operation:
+            raise PatchError(f"Invalid operation: {operation!r}")
+        op, path = operation.get("op"), operation["path"]
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise PatchError(f"Operation '{op}' needs a value")
+        if op in ("move", "copy") and "from" not in operation:
+            raise PatchError(f"Operation '{op}' needs 'from'")
+
+        if op == "add":
+            document = _add(document, path, copy.deepcopy(operation["value"]))
+        elif op == "remove":
+            _remove(document, path)
+        elif op == "replace":
+            document = _add(document, path, copy.deepcopy(operation["value"]), replace=True)
+        elif op == "move":
+            value = _remove(document, operation["from"])
+            document = _add(document, path, value)
+        elif op == "copy":
+            document = _add(document, path, copy.deepcopy(_get(document, operation["from"])))
+        elif op == "test":
+            if _get(document, path) != operation["value"]:
+                raise PatchConflict(f"Test failed at {path}")
+        else:
+            raise PatchError(f"Unknown operation: {op!r}")
+    return document
@@ -0,0 +1,86 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy.orm import Query
+
+from src.core.cache import CachedResult
+from src.dependencies import run_db
+
+
+def encode_cursor(last_id: int) -> str:
+    """Cursor opaco para el cliente: el último `id` de la página, en base64 URL-safe."""
+    raw = json.dumps({"id": last_id}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: Optional[str]) -> Optional[int]:
+    """Devuelve el `id` a partir del cual continuar, o 400 si el cursor no es válido."""
+    if not cursor:
+        return None
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        last_id = json.loads(raw)["id"]
+        if not isinstance(last_id, int):
+            raise ValueError(last_id)
+        return last_id
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset(query: Query, column, skip: int = 0, limit: int = 100, after: Optional[int] = None) -> Query:
+    """
+    Ordena por `column` (la clave primaria) y pagina: con `after` filtra
+    `column > after`, que usa el índice en lugar de recorrer las filas
+    saltadas; sin él se mantiene el `skip` (OFFSET) de siempre.
+    """
+    query = query.order_by(column)
+    if after is not None:
+        query = query.filter(column > after)
+    elif skip:
+        query = query.offset(skip)
+    return query.limit(limit)
+
+
+def pagination_headers(request: Request, items: List[Any], limit: int, total: Optional[int] = None) -> Dict[str, str]:
+    """
+    `Link: <...>; rel="next"` y `X-Next-Cursor` si la página está llena, y
+    `X-Total-Count` si se pidió el total. El enlace es relativo (ruta y
+    query): la respuesta se cachea sin el host con el que se pidió.
+    """
+    headers = {}
+    if items and len(items) >= limit:
+        cursor = encode_cursor(items[-1].id)
+        next_url = request.url.remove_query_params(["skip", "cursor"]).include_query_params(cursor=cursor, limit=limit)
+        next_url = f"{next_url.path}?{next_url.query}"
+        headers["Link"] = f'<{next_url}>; rel="next"'
+        headers["X-Next-Cursor"] = cursor
+    if total is not None:
+        headers["X-Total-Count"] = str(total)
+    return headers
+
+
+async def load_page(
+    request: Request,
+    db,
+    fetch: Callable[..., List[Any]],
+    count: Callable[..., int],
+    *,
+    skip: int,
+    limit: int,
+    cursor: Optional[str],
+    include_total: bool,
+    fields: Optional[Tuple[str, ...]] = None,
+    **filters: Any,
+) -> CachedResult:
+    """
+    Carga una página con `fetch(db, skip=, limit=, after=, fields=, **filters)`
+    y, solo si se pidió, el total con `count(db, **filters)`. Devuelve los datos
+    con sus cabeceras de paginación para guardarlos juntos en la caché de respuestas.
+    """
+    after = decode_cursor(cursor)
+    items = await run_db(db, fetch, skip=skip, limit=limit, after=after, fields=fields, **filters)
+    total = await run_db(db, count, **filters) if include_total else None
+    return CachedResult(items, pagination_headers(request, items, limit, total))
@@ -0,0 +1,464 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.http import etag_matches, make_etag
+from src.models.translation import Translation, TranslationVersion
+
+try:
+    import fcntl
+except ImportError:  # Windows: el bloqueo solo protege entre hilos del mismo proceso
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+
+# Combinaciones de namespaces serializadas que se guardan por idioma
+MAX_CACHED_SUBSETS = 64
+
+
+def serialize(data: Dict[str, Any]) -> bytes:
+    # Mismo formato que JSONResponse
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _digest(body: bytes) -> str:
+    return hashlib.sha256(body).hexdigest()[:16]
+
+
+def prefix_index(data: Dict[str, Any]) -> Dict[str, Tuple[str, ...]]:
+    """
+    Prefijo -> claves que están bajo él, para cada prefijo de las claves con
+    puntos: "contact.form.name" aparece en "contact", "contact.form" y en sí misma.
+    """
+    index: Dict[str, List[str]] = {}
+    for key in data:
+        parts = key.split(".")
+        for end in range(1, len(parts) + 1):
+            index.setdefault(".".join(parts[:end]), []).append(key)
+    return {prefix: tuple(keys) for prefix, keys in index.items()}
+
+
+@dataclass(frozen=True)
+class Subset:
+    body: bytes
+    etag: str
+
+
+@dataclass(frozen=True)
+class LanguageFile:
+    """
+    Contenido de un archivo de idioma, ya serializado para responder sin
+    tocar el disco. El ETag y el índice de prefijos se calculan al cargarlo.
+    """
+    data: Dict[str, Any]
+    body: bytes
+    mtime_ns: int
+    # Se incrementa en cada escritura a través del store (también desde otros workers)
+    version: int = 0
+    etag: str = field(init=False)
+    prefixes: Dict[str, Tuple[str, ...]] = field(init=False, repr=False, compare=False)
+    _subsets: Dict[Tuple[str, ...], Subset] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # El hash cubre también las ediciones a mano, que no cambian la versión
+        object.__setattr__(self, "etag", make_etag(f"{self.version}-{_digest(self.body)}"))
+        object.__setattr__(self, "prefixes", prefix_index(self.data))
+        object.__setattr__(self, "_subsets", {})
+
+    def subset(self, namespaces: Tuple[str, ...]) -> Subset:
+        """
+        Solo las claves bajo `namespaces` (en el orden del archivo), serializadas.
+        Su ETag depende únicamente de esas claves: no cambia al editar otras.
+        """
+        subset = self._subsets.get(namespaces)
+        if subset is None:
+            wanted = {key for namespace in namespaces for key in self.prefixes.get(namespace, ())}
+            body = serialize({key: value for key, value in self.data.items() if key in wanted})
+            subset = Subset(body=body, etag=make_etag(_digest(body)))
+            if len(self._subsets) < MAX_CACHED_SUBSETS:
+                self._subsets[namespaces] = subset
+        return subset
+
+
+class BaseTranslationStore:
+    """
+    Idiomas en memoria. Las lecturas devuelven el último estado cargado; cada
+    recarga construye un diccionario nuevo y lo sustituye de una vez, así que
+    un lector nunca ve un idioma a medio actualizar.
+    """
+
+    def __init__(self, on_change: Optional[Callable[[], None]] = None):
+        # Se llama cuando el watcher detecta cambios hechos fuera de este proceso
+        self.on_change = on_change
+        self._files: Optional[Dict[str, LanguageFile]] = None
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        raise NotImplementedError
+
+    def refresh(self) -> bool:
+        raise NotImplementedError
+
+    def write(
+        self,
+        lang: str,
+        change: Callable[[Dict[str, Any]], Dict[str, Any]],
+        if_match: Optional[str] = None,
+    ) -> LanguageFile:
+        raise NotImplementedError
+
+    def _loaded(self) -> Dict[str, LanguageFile]:
+        files = self._files
+        if files is None:
+            self.load()
+            files = self._files
+        return files
+
+    def languages(self) -> List[str]:
+        return sorted(self._loaded())
+
+    def get(self, lang: str) -> Optional[LanguageFile]:
+        return self._loaded().get(lang)
+
+    async def watch(self, stop: asyncio.Event) -> None:
+        """Llama a `refresh` cada I18N_POLL_INTERVAL segundos hasta que se activa `stop`."""
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=settings.I18N_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                if await asyncio.to_thread(self.refresh):
+                    self._changed()
+
+    def _changed(self) -> None:
+        logger.info("Idiomas recargados.")
+        if self.on_change:
+            self.on_change()
+
+
+class TranslationStore(BaseTranslationStore):
+    """
+    Archivos `{lang}.json` de un directorio, cargados en memoria una sola vez.
+    Las lecturas no tocan el sistema de archivos.
+    """
+
+    def __init__(self, directory: os.PathLike | str, on_change: Optional[Callable[[], None]] = None):
+        super().__init__(on_change)
+        self.directory = Path(directory)
+        self._write_locks: Dict[str, threading.Lock] = {}
+
+    def _path(self, lang: str) -> Path:
+        return self.directory / f"{lang}.json"
+
+    def _version_path(self, lang: str) -> Path:
+        return self.directory / f".{lang}.version"
+
+    def _read_version(self, lang: str) -> int:
+        try:
+            return int(self._version_path(lang).read_text(encoding="utf-8") or 0)
+        except (OSError, ValueError):
+            return 0
+
+    def _read(self, path: Path) -> LanguageFile:
+        mtime_ns = path.stat().st_mtime_ns
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return LanguageFile(
+            data=data, body=serialize(data), mtime_ns=mtime_ns, version=self._read_version(path.stem)
+        )
+
+    def _scan(self) -> Dict[str, int]:
+        """Idioma -> mtime de los archivos que hay ahora en el directorio."""
+        if not self.directory.is_dir():
+            return {}
+        return {
+            entry.name[:-5]: entry.stat().st_mtime_ns
+            for entry in os.scandir(self.directory)
+            if entry.name.endswith(".json") and entry.is_file()
+        }
+
+    def load(self) -> None:
+        """Carga (o vuelve a cargar) todos los idiomas."""
+        with self._lock:
+            self._files = self._load_changed({}, self._scan())
+
+    def _load_changed(self, current: Dict[str, LanguageFile], on_disk: Dict[str, int]) -> Dict[str, LanguageFile]:
+        files = {}
+        for lang, mtime_ns in on_disk.items():
+            entry = current.get(lang)
+            if entry is None or entry.mtime_ns != mtime_ns:
+                try:
+                    entry = self._read(self._path(lang))
+                except (OSError, ValueError) as e:
+                    # Archivo a medio escribir por otro proceso: se conserva la versión anterior
+                    logger.warning(f"No se pudo recargar el idioma '{lang}': {e}")
+                    if entry is None:
+                        continue
+            files[lang] = entry
+        return files
+
+    def refresh(self) -> bool:
+        """
+        Recarga solo los idiomas cuyo archivo cambió (por mtime), apareció o
+        se borró. Devuelve True si hubo cambios.
+        """
+        with self._lock:
+            current = self._files or {}
+            on_disk = self._scan()
+            if {lang: entry.mtime_ns for lang, entry in current.items()} == on_disk:
+                return False
+            self._files = self._load_changed(current, on_disk)
+            return True
+
+    def reload(self, lang: str) -> None:
+        """Vuelve a leer un idioma tras escribirlo (o lo quita si ya no existe)."""
+        with self._lock:
+            files = dict(self._files or {})
+            path = self._path(lang)
+            if path.is_file():
+                files[lang] = self._read(path)
+            else:
+                files.pop(lang, None)
+            self._files = files
+
+    @contextmanager
+    def _write_lock(self, lang: str) -> Iterator[Any]:
+        """
+        Exclusión mutua por idioma: un Lock entre hilos y, donde hay fcntl, un
+        flock sobre `.{lang}.version` entre procesos (varios workers o réplicas
+        con el mismo directorio). Ese archivo guarda además la versión.
+        """
+        with self._lock:
+            lock = self._write_locks.setdefault(lang, threading.Lock())
+        with lock, open(self._version_path(lang), "a+", encoding="utf-8") as version_file:
+            if fcntl is not None:
+                fcntl.flock(version_file, fcntl.LOCK_EX)
+            yield version_file
+
+    def write(
+        self,
+        lang: str,
+        change: Callable[[Dict[str, Any]], Dict[str, Any]],
+        if_match: Optional[str] = None,
+    ) -> LanguageFile:
+        """
+        Lee, modifica con `change` y guarda un idioma bajo su bloqueo. Se parte
+        del archivo en disco (no de la memoria) para no perder escrituras de
+        otros workers. El JSON se escribe en un temporal que sustituye al
+        original con os.replace: nadie puede leer un archivo a medias.
+        Con `if_match` la escritura falla (412) si el idioma cambió entretanto.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(lang)
+        with self._write_lock(lang) as version_file:
+            current = self._read(path) if path.is_file() else None
+            if if_match is not None and not (current and etag_matches(if_match, current.etag)):
+                raise HTTPException(
+                    status_code=status.HTTP_412_PRECONDITION_FAILED,
+                    detail=f"Language '{lang}' was modified by another request.",
+                )
+            data = change(dict(current.data) if current else {})
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f".{lang}.", suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    # indent=2 para que el JSON sea legible. ensure_ascii=False para acentos.
+                    json.dump(data, f, ensure_ascii=False, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+
+            version = (current.version if current else self._read_version(lang)) + 1
+            version_file.seek(0)
+            version_file.truncate()
+            version_file.write(str(version))
+            version_file.flush()
+            self.reload(lang)
+        return self.get(lang)
+
+    async def watch(self, stop: asyncio.Event) -> None:
+        """
+        Recarga los idiomas cuando cambian sus archivos (p. ej. editados a mano
+        o por otro worker). Usa `watchfiles` (inotify y equivalentes) si está
+        instalado y, si no, comprueba los mtime cada I18N_POLL_INTERVAL segundos.
+        """
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            awatch = None
+
+        if awatch is not None and self.directory.is_dir():
+            async for _ in awatch(self.directory, stop_event=stop, recursive=False):
+                if await asyncio.to_thread(self.refresh):
+                    self._changed()
+            return
+        await super().watch(stop)
+
+
+class DatabaseTranslationStore(BaseTranslationStore):
+    """
+    Idiomas en la tabla `translations` (una fila por idioma y clave), para
+    varios workers o réplicas. Cada proceso sirve su copia en memoria y la
+    revalida con una sola consulta a `translation_versions`: solo vuelve a
+    leer las claves de los idiomas cuya versión cambió.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session], on_change: Optional[Callable[[], None]] = None):
+        super().__init__(on_change)
+        self.session_factory = session_factory
+
+    def _versions(self, db: Session) -> Dict[str, int]:
+        return dict(db.execute(select(TranslationVersion.lang, TranslationVersion.version)).all())
+
+    def _read(self, db: Session, lang: str, version: int) -> LanguageFile:
+        data = dict(db.execute(
+            select(Translation.key, Translation.value)
+            .where(Translation.lang == lang)
+            .order_by(Translation.id)
+        ).all())
+        return LanguageFile(data=data, body=serialize(data), mtime_ns=0, version=version)
+
+    def _load_changed(
+        self, db: Session, current: Dict[str, LanguageFile], versions: Dict[str, int]
+    ) -> Dict[str, LanguageFile]:
+        files = {}
+        for lang, version in versions.items():
+            entry = current.get(lang)
+            files[lang] = entry if entry is not None and entry.version == version else self._read(db, lang, version)
+        return files
+
+    def load(self) -> None:
+        with self.session_factory() as db, self._lock:
+            self._files = self._load_changed(db, {}, self._versions(db))
+
+    def refresh(self) -> bool:
+        """Vuelve a leer los idiomas cuya versión cambió. Devuelve True si hubo cambios."""
+        with self.session_factory() as db, self._lock:
+            current = self._files or {}
+            versions = self._versions(db)
+            if {lang: entry.version for lang, entry in current.items()} == versions:
+                return False
+            self._files = self._load_changed(db, current, versions)
+            return True
+
+    def _bump(self, db: Session, lang: str) -> int:
+        """
+        Sube la versión del idioma (la crea si no existe) y devuelve la nueva.
+        Es lo primero que hace una escritura: el UPDATE bloquea la fila (o la
+        base de datos en SQLite) hasta el commit, así que dos escrituras del
+        mismo idioma nunca se solapan, estén en el worker que estén.
+        """
+        version = db.execute(
+            update(TranslationVersion)
+            .where(TranslationVersion.lang == lang)
+            .values(version=TranslationVersion.version + 1)
+            .returning(TranslationVersion.version)
+        ).scalar()
+        if version is None:
+            version = 1
+            db.execute(insert(TranslationVersion).values(lang=lang, version=version))
+        return version
+
+    def write(
+        self,
+        lang: str,
+        change: Callable[[Dict[str, Any]], Dict[str, Any]],
+        if_match: Optional[str] = None,
+    ) -> LanguageFile:
+        """
+        Lee, modifica con `change` y guarda un idioma en una transacción. Solo
+        se escriben las claves añadidas, cambiadas o borradas. Con `if_match`
+        falla (412) si el idioma cambió entretanto, también desde otro worker.
+        """
+        for attempt in range(2):
+            with self.session_factory() as db:
+                try:
+                    version = self._bump(db, lang)
+                    current = self._read(db, lang, version - 1) if version > 1 else None
+                    if if_match is not None and not (current and etag_matches(if_match, current.etag)):
+                        raise HTTPException(
+                            status_code=status.HTTP_412_PRECONDITION_FAILED,
+                            detail=f"Language '{lang}' was modified by another request.",
+                        )
+                    old = current.data if current else {}
+                    data = change(dict(old))
+                    self._apply(db, lang, old, data)
+                    db.commit()
+                except IntegrityError:
+                    # Otro worker creó el mismo idioma a la vez: se repite como actualización
+                    db.rollback()
+                    if attempt:
+                        raise
+                    continue
+                except BaseException:
+                    db.rollback()
+                    raise
+            break
+
+        # Mismo orden que devolverá _read en los demás workers: las claves nuevas van al final
+        stored = {key: data[key] for key in old if key in data}
+        stored.update((key, value) for key, value in data.items() if key not in old)
+        language = LanguageFile(data=stored, body=serialize(stored), mtime_ns=0, version=version)
+        with self._lock:
+            files = dict(self._files or {})
+            files[lang] = language
+            self._files = files
+        return language
+
+    def _apply(self, db: Session, lang: str, old: Dict[str, Any], data: Dict[str, Any]) -> None:
+        removed = [key for key in old if key not in data]
+        changed = [
+            {"b_key": key, "b_value": value}
+            for key, value in data.items()
+            if key in old and old[key] != value
+        ]
+        added = [{"lang": lang, "key": key, "value": value} for key, value in data.items() if key not in old]
+        table = Translation.__table__
+        if removed:
+            db.execute(delete(table).where(table.c.lang == lang, table.c.key.in_(removed)))
+        if changed:
+            db.execute(
+                update(table)
+                .where(table.c.lang == lang, table.c.key == bindparam("b_key"))
+                .values(value=bindparam("b_value")),
+                changed,
+            )
+        if added:
+            db.execute(insert(table), added)
+
+
+def copy_translations(
+    source: BaseTranslationStore, target: BaseTranslationStore, langs: Optional[List[str]] = None
+) -> Dict[str, int]:
+    """
+    Sustituye en `target` los idiomas de `source` (todos o solo `langs`).
+    Sirve para importar los JSON a la base de datos y para exportarlos.
+    Devuelve idioma -> número de claves copiadas.
+    """
+    copied = {}
+    for lang in langs or source.languages():
+        language = source.get(lang)
+        if language is None:
+            raise ValueError(f"Language '{lang}' not found.")
+        target.write(lang, lambda current, data=language.data: dict(data))
+        copied[lang] = len(language.data)
+    return copied
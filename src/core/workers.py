@@ -0,0 +1,94 @@
+import logging
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class WorkerPoolBusyError(RuntimeError):
+    pass
+
+
+class WorkerPoolBrokenError(RuntimeError):
+    """Un proceso del pool murió (p. ej. por falta de memoria) también al reintentar."""
+
+
+class WorkerPool:
+    """
+    Pool de procesos para trabajo CPU-bound (p. ej. Pillow) con una cola acotada.
+
+    Las rutas síncronas se ejecutan en el threadpool de Starlette, así que un
+    hilo que espera a un proceso sigue ocupando su hueco. Por eso solo se admiten
+    `max_pending` tareas a la vez y el resto espera como mucho `queue_timeout`
+    segundos antes de fallar con `WorkerPoolBusyError`: una ráfaga de subidas
+    nunca puede acaparar los hilos que atienden el tráfico público.
+
+    Si un proceso muere, el pool entero queda inservible (`BrokenProcessPool`):
+    se descarta, se crea otro y la tarea se reintenta una vez.
+
+    Con `max_workers=0` las tareas se ejecutan en el propio hilo.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, queue_timeout: float):
+        self.max_workers = max_workers
+        self.max_pending = max(1, max_pending)
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(self.max_pending)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                # 'spawn' evita heredar hilos y conexiones del proceso del servidor
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+                logger.info(f"Pool de procesos iniciado con {self.max_workers} workers.")
+            return self._executor
+
+    def run(self, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """Ejecuta `fn` en el pool y espera su resultado."""
+        if self.max_workers <= 0:
+            return fn(*args, **kwargs)
+
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            raise WorkerPoolBusyError("La cola de procesamiento está llena.")
+        try:
+            for attempt in range(2):
+                executor = self._get_executor()
+                try:
+                    return executor.submit(fn, *args, **kwargs).result()
+                except BrokenProcessPool as e:
+                    self._discard(executor)
+                    if attempt:
+                        raise WorkerPoolBrokenError("El pool de procesos falló dos veces seguidas.") from e
+                    logger.warning("Un proceso del pool murió; se reinicia el pool y se reintenta la tarea.")
+        finally:
+            self._slots.release()
+
+    def _discard(self, executor: ProcessPoolExecutor) -> None:
+        """Olvida un executor roto; otro hilo puede haberlo sustituido ya."""
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+image_workers = WorkerPool(
+    max_workers=settings.IMAGE_WORKERS,
+    max_pending=settings.IMAGE_WORKER_QUEUE_SIZE,
+    queue_timeout=settings.IMAGE_WORKER_QUEUE_TIMEOUT,
+)
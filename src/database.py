@@ -1,7 +1,10 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
-from src.core.config import settings
+from sqlalchemy.pool import NullPool
+from src.core.config import settings, Settings
 
 if settings.DATABASE_URL.startswith("sqlite"):
     # Configuración para SQLite (Desarrollo)
@@ -9,18 +12,124 @@ if settings.DATABASE_URL.startswith("sqlite"):
     db_path = os.path.join(os.path.dirname(__file__), '..', settings.DATABASE_NAME)
     db_path = os.path.normpath(db_path)
     SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL + db_path
-    connect_args = {"check_same_thread": False}
 else:
     # Configuración para PostgreSQL (Producción)
     # En Postgres la URL ya viene completa, no necesitamos concatenar rutas de archivo
     SQLALCHEMY_DATABASE_URL = settings.DATABASE_URL
+
+
+def engine_options(url: str, config: Settings = settings) -> dict:
+    """
+    Argumentos de `create_engine` según el motor y la configuración:
+    pool y timeouts para PostgreSQL, acceso multihilo para SQLite.
+    """
+    if url.startswith("sqlite"):
+        # El pool por defecto de SQLite (un archivo local) ya es adecuado
+        return {"connect_args": {"check_same_thread": False}}
+
     connect_args = {}
+    if config.DB_STATEMENT_TIMEOUT_MS > 0:
+        if url.startswith("postgresql+asyncpg"):
+            connect_args["server_settings"] = {"statement_timeout": str(config.DB_STATEMENT_TIMEOUT_MS)}
+        else:
+            connect_args["options"] = f"-c statement_timeout={config.DB_STATEMENT_TIMEOUT_MS}"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, 
-    connect_args=connect_args
-)
+    if config.DB_USE_NULL_POOL:
+        # Con PgBouncer el pool vive fuera de la app: cada sesión abre y cierra su conexión
+        return {"connect_args": connect_args, "poolclass": NullPool}
+
+    return {
+        "connect_args": connect_args,
+        "pool_size": config.DB_POOL_SIZE,
+        "max_overflow": config.DB_MAX_OVERFLOW,
+        "pool_timeout": config.DB_POOL_TIMEOUT,
+        "pool_recycle": config.DB_POOL_RECYCLE,
+        "pool_pre_ping": config.DB_POOL_PRE_PING,
+    }
+
+
+def register_sqlite_pragmas(bind: Engine, config: Settings = settings) -> None:
+    """
+    Aplica los PRAGMA de SQLite en cada conexión nueva. WAL permite lecturas
+    concurrentes con una escritura en curso y `synchronous=NORMAL` es seguro
+    en modo WAL con muchos menos fsync.
+    """
+    @event.listens_for(bind, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        if config.SQLITE_JOURNAL_MODE:
+            cursor.execute(f"PRAGMA journal_mode={config.SQLITE_JOURNAL_MODE}")
+        if config.SQLITE_SYNCHRONOUS:
+            cursor.execute(f"PRAGMA synchronous={config.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(config.SQLITE_BUSY_TIMEOUT_MS)}")
+        cursor.close()
+
+
+def create_db_engine(url: str = SQLALCHEMY_DATABASE_URL, config: Settings = settings) -> Engine:
+    bind = create_engine(url, **engine_options(url, config))
+    if bind.dialect.name == "sqlite":
+        register_sqlite_pragmas(bind, config)
+    return bind
+
+
+# Drivers asíncronos para cada motor (DB_ASYNC=true)
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def async_database_url(url: str) -> str:
+    """`sqlite:///x.db` -> `sqlite+aiosqlite:///x.db`, `postgresql://...` -> `postgresql+asyncpg://...`"""
+    scheme, separator, rest = url.partition("://")
+    return ASYNC_DRIVERS.get(scheme.split("+")[0], scheme) + separator + rest
+
+
+def create_async_db_engine(url: str = SQLALCHEMY_DATABASE_URL, config: Settings = settings) -> AsyncEngine:
+    url = async_database_url(url)
+    bind = create_async_engine(url, **engine_options(url, config))
+    if bind.dialect.name == "sqlite":
+        register_sqlite_pragmas(bind.sync_engine, config)
+    return bind
+
+
+engine = create_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-Base = declarative_base()
\ No newline at end of file
+# El engine asíncrono solo se crea si se activa, así aiosqlite/asyncpg son opcionales
+async_engine = create_async_db_engine() if settings.DB_ASYNC else None
+
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if async_engine is not None
+    else None
+)
+
+Base = declarative_base()
+
+
+def upgrade_schema(bind=engine):
+    """
+    Añade a las tablas existentes las columnas nuevas de los modelos.
+    `create_all` solo crea tablas que no existen, así que las bases de datos
+    ya desplegadas necesitan este paso para recibir columnas añadidas después.
+    Las columnas nuevas deben ser nullable para poder añadirse sin valor por defecto.
+    También crea los índices declarados en los modelos que aún no existan.
+    """
+    inspector = inspect(bind)
+    preparer = bind.dialect.identifier_preparer
+    with bind.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            if not inspector.has_table(table.name):
+                continue
+            existing = {column["name"] for column in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                column_type = column.type.compile(dialect=bind.dialect)
+                conn.execute(text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ADD COLUMN {preparer.format_column(column)} {column_type}"
+                ))
+            indexes = {index["name"] for index in inspector.get_indexes(table.name)}
+            for index in table.indexes:
+                if index.name not in indexes:
+                    index.create(conn)
@@ -1,12 +1,15 @@
 # src/dependencies.py
 
 from fastapi import Depends, HTTPException, status
+from anyio import CapacityLimiter, to_thread
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.models.user import User          # Importación absoluta del modelo
-from src.database import SessionLocal     # Importación absoluta de la base de datos
+from src.database import SessionLocal, AsyncSessionLocal  # Importación absoluta de la base de datos
 from src.core.config import settings      # Importación absoluta de la configuración
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="login") # Nota: la ruta completa es /auth/login
@@ -18,6 +21,37 @@ def get_db():
     finally:
         db.close()
 
+# Tipo de la sesión que entrega `get_read_db`
+ReadSession = AsyncSession | Session
+
+async def get_read_db():
+    """
+    Sesión para las rutas de lectura `async def`: una `AsyncSession` si
+    DB_ASYNC está activo, o la `Session` síncrona de siempre.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as db:
+            yield db
+        return
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        # Limitador propio, como hace FastAPI al cerrar dependencias síncronas:
+        # con el threadpool lleno de consultas esperando una conexión del pool,
+        # el cierre que la libera no puede quedar en la misma cola.
+        await to_thread.run_sync(db.close, limiter=CapacityLimiter(1))
+
+async def run_db(db: AsyncSession | Session, fn, /, *args, **kwargs):
+    """
+    Ejecuta una función de servicio síncrona `fn(db, ...)` sin bloquear el
+    event loop: con `AsyncSession.run_sync` la E/S va por el driver asíncrono;
+    con una `Session` normal se usa el threadpool.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
+
 def get_current_admin_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
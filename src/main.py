@@ -1,19 +1,19 @@
 import os
+import asyncio
 import logging
 
 from contextlib import asynccontextmanager
-from fastapi import FastAPI, HTTPException, Depends, Response
+from fastapi import FastAPI
 from starlette.middleware.cors import CORSMiddleware
 from starlette.staticfiles import StaticFiles
-from sqlalchemy.orm import Session
 from src.core.logging import setup_logging
-from src.database import engine, Base
-from src.dependencies import get_db
-from src.models.media import Media
+from src.database import engine, async_engine, Base, upgrade_schema
+from src.models.project_search import ensure_project_search
 from src.core.config import settings, SRC_DIR
-from src.routes import auth, i18n, certificates, projects, technologies, jobs, socials, tags
-# from src.routes import cv
-from src.utils import create_admin_user_on_startup
+from src.core.workers import image_workers
+from src.routes import auth, i18n, certificates, projects, technologies, jobs, socials, tags, media, metrics, portfolio, cv
+from src.utils import create_admin_user_on_startup, backfill_media_metadata
+from src.services import i18n_service
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -25,9 +25,22 @@ async def lifespan(app: FastAPI):
     # Asegurarse de que el directorio estático exista
     (SRC_DIR / "static").mkdir(exist_ok=True)
     Base.metadata.create_all(bind=engine)
+    upgrade_schema(engine)
+    ensure_project_search(engine)
     create_admin_user_on_startup()
+    backfill_media_metadata()
+    # Los idiomas se cargan una vez y se recargan si cambian sus archivos
+    i18n_service.store.load()
+    stop_watching = asyncio.Event()
+    watcher = asyncio.create_task(i18n_service.store.watch(stop_watching)) if settings.I18N_WATCH else None
     yield
     logger.info("Apagando aplicación...")
+    if watcher is not None:
+        stop_watching.set()
+        await watcher
+    image_workers.shutdown()
+    if async_engine is not None:
+        await async_engine.dispose()
 
 
 app = FastAPI(
@@ -46,13 +59,8 @@ app.add_middleware(
     expose_headers=settings.ALLOWED_EXPOSED_HEADERS,
 )
 
-# Ruta para servir imágenes desde la Base de Datos
-@app.get("/static/images/{filename}")
-def get_image(filename: str, db: Session = Depends(get_db)):
-    media = db.query(Media).filter(Media.filename == filename).first()
-    if not media:
-        raise HTTPException(status_code=404, detail="Image not found")
-    return Response(content=media.data, media_type=media.content_type)
+# Ruta para servir imágenes desde la Base de Datos (debe registrarse antes del montaje de /static)
+app.include_router(media.router)
 
 # ruta para archivos estáticos
 app.mount("/static", StaticFiles(directory=(SRC_DIR / "static")), name="static")
@@ -64,6 +72,8 @@ app.include_router(certificates.router)
 app.include_router(projects.router)
 app.include_router(technologies.router)
 app.include_router(jobs.router)
-# app.include_router(cv.router)
+app.include_router(cv.router)
 app.include_router(socials.router)
 app.include_router(tags.router)
+app.include_router(portfolio.router)
+app.include_router(metrics.router)
@@ -4,4 +4,6 @@ from .technology import Technology
 from .job import Job
 from .social import Social
 from .media import Media
-from .tag import Tag
\ No newline at end of file
+from .tag import Tag
+from . import project_search
+from .translation import Translation, TranslationVersion
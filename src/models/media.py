@@ -1,5 +1,8 @@
 # src/models/media.py
-from sqlalchemy import Column, Integer, String, LargeBinary
+from datetime import datetime, timezone
+
+from sqlalchemy import Column, Integer, String, LargeBinary, DateTime
+from sqlalchemy.orm import deferred
 from src.database import Base
 
 class Media(Base):
@@ -8,4 +11,19 @@ class Media(Base):
     id = Column(Integer, primary_key=True, index=True)
     filename = Column(String, unique=True, index=True)
     content_type = Column(String)
-    data = Column(LargeBinary)
+    # Diferida: las consultas sobre Media nunca traen los bytes salvo que se acceda a `data`
+    data = deferred(Column(LargeBinary))
+    # Backend que guarda los bytes ("database" si es NULL, ver src/core/storage.py)
+    storage = Column(String, nullable=True)
+
+    # Metadatos calculados una sola vez al guardar (ETag, Content-Length, Last-Modified)
+    content_hash = Column(String(64), nullable=True, index=True)
+    size = Column(Integer, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=True, default=lambda: datetime.now(timezone.utc))
+
+    # Número de registros que usan esta imagen (almacenamiento deduplicado por hash)
+    ref_count = Column(Integer, nullable=True, default=1)
+
+    # Variantes responsivas: apuntan al filename de la imagen original
+    variant_of = Column(String, nullable=True, index=True)
+    width = Column(Integer, nullable=True)
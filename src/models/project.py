@@ -17,12 +17,15 @@ class Project(Base):
     project_url = Column(String, nullable=True)
     repo_url = Column(String, nullable=True)
     
+    # Relationships are loaded per query (see projects_service) instead of
+    # eagerly on every Project load, which cascaded through the back-references.
+
     # Many-to-many relationship with technologies
     technologies = relationship(
         "Technology",
         secondary=project_technologies,
         back_populates="projects",
-        lazy="selectin"
+        lazy="select"
     )
 
     # Many-to-many relationship with tags
@@ -30,6 +33,6 @@ class Project(Base):
         "Tag",
         secondary=project_tags,
         back_populates="projects",
-        lazy="selectin"
+        lazy="select"
     )
     
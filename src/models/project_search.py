@@ -0,0 +1,62 @@
+"""
+Índice de búsqueda de texto completo de los proyectos.
+
+- SQLite: tabla virtual FTS5 `projects_fts` (rowid = id del proyecto) que
+  `search_service` mantiene al crear, actualizar y borrar proyectos.
+- PostgreSQL: columnas `tsvector` generadas por idioma (`search_en` con la
+  configuración `english`, `search_es` con `spanish`) e índices GIN; la
+  propia base de datos las mantiene al día.
+"""
+from sqlalchemy import DDL, event, inspect, text
+
+from .project import Project
+
+FTS_TABLE = "projects_fts"
+
+# Configuración de búsqueda de PostgreSQL para cada columna traducida
+SEARCH_CONFIGS = {"en": "english", "es": "spanish"}
+
+SQLITE_CREATE = (
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "title, description_en, description_es, tokenize = 'unicode61 remove_diacritics 2')"
+)
+
+POSTGRES_CREATE = [
+    statement
+    for lang, config in SEARCH_CONFIGS.items()
+    for statement in (
+        f"ALTER TABLE projects ADD COLUMN IF NOT EXISTS search_{lang} tsvector "
+        f"GENERATED ALWAYS AS (to_tsvector('{config}', coalesce(title, '') || ' ' || "
+        f"coalesce(description_{lang}, ''))) STORED",
+        f"CREATE INDEX IF NOT EXISTS ix_projects_search_{lang} ON projects USING GIN (search_{lang})",
+    )
+]
+
+# Las tablas nuevas reciben el índice en el mismo `create_all`
+event.listen(Project.__table__, "after_create", DDL(SQLITE_CREATE).execute_if(dialect="sqlite"))
+event.listen(Project.__table__, "before_drop", DDL(f"DROP TABLE IF EXISTS {FTS_TABLE}").execute_if(dialect="sqlite"))
+for _statement in POSTGRES_CREATE:
+    event.listen(Project.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+def ensure_project_search(bind) -> None:
+    """
+    Crea el índice en bases de datos ya desplegadas y, en SQLite, lo
+    reconstruye si no tiene las mismas filas que `projects`.
+    """
+    if not inspect(bind).has_table("projects"):
+        return
+    with bind.begin() as conn:
+        if bind.dialect.name == "sqlite":
+            conn.execute(text(SQLITE_CREATE))
+            indexed = conn.execute(text(f"SELECT count(*) FROM {FTS_TABLE}")).scalar()
+            projects = conn.execute(text("SELECT count(*) FROM projects")).scalar()
+            if indexed != projects:
+                conn.execute(text(f"DELETE FROM {FTS_TABLE}"))
+                conn.execute(text(
+                    f"INSERT INTO {FTS_TABLE} (rowid, title, description_en, description_es) "
+                    "SELECT id, title, description_en, description_es FROM projects"
+                ))
+        elif bind.dialect.name == "postgresql":
+            for statement in POSTGRES_CREATE:
+                conn.execute(text(statement))
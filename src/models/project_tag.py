@@ -1,9 +1,12 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Integer, ForeignKey, Index
 from src.database import Base
 
 project_tags = Table(
     'project_tags',
     Base.metadata,
     Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
-    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True)
+    Column('tag_id', Integer, ForeignKey('tags.id'), primary_key=True),
+    # The primary key only serves project-first lookups; filtering projects
+    # by tag needs the reverse direction.
+    Index('ix_project_tags_tag_id_project_id', 'tag_id', 'project_id'),
 )
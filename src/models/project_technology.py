@@ -1,9 +1,12 @@
-from sqlalchemy import Table, Column, Integer, ForeignKey
+from sqlalchemy import Table, Column, Integer, ForeignKey, Index
 from src.database import Base
 
 project_technologies = Table(
     'project_technologies',
     Base.metadata,
     Column('project_id', Integer, ForeignKey('projects.id'), primary_key=True),
-    Column('technology_id', Integer, ForeignKey('technologies.id'), primary_key=True)
+    Column('technology_id', Integer, ForeignKey('technologies.id'), primary_key=True),
+    # The primary key only serves project-first lookups; filtering projects
+    # by technology needs the reverse direction.
+    Index('ix_project_technologies_technology_id_project_id', 'technology_id', 'project_id'),
 )
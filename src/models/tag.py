@@ -1,5 +1,5 @@
 from sqlalchemy import Column, Integer, String
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import query_expression, relationship
 from src.database import Base
 
 class Tag(Base):
@@ -8,10 +8,15 @@ class Tag(Base):
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, unique=True)
     
-    # Back-reference to projects
+    # Back-reference to projects. Loaded only on access (e.g. when deleting, to
+    # clean up the association rows); list endpoints never need it.
     projects = relationship(
         "Project",
         secondary="project_tags",
         back_populates="tags",
-        lazy="selectin"
+        lazy="select"
     )
+
+    # Number of projects using it; only filled in by queries that ask for it
+    # (see core.facets.with_project_counts), None otherwise.
+    project_count = query_expression()
@@ -0,0 +1,25 @@
+# src/models/translation.py
+from sqlalchemy import JSON, Column, Integer, String, UniqueConstraint
+from src.database import Base
+
+class Translation(Base):
+    """Una clave de un idioma (I18N_BACKEND=database)."""
+    __tablename__ = "translations"
+
+    # El orden de inserción es el orden de las claves en el JSON servido
+    id = Column(Integer, primary_key=True)
+    lang = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    value = Column(JSON, nullable=False)
+
+    __table_args__ = (UniqueConstraint("lang", "key", name="uq_translations_lang_key"),)
+
+class TranslationVersion(Base):
+    """
+    Versión de cada idioma: sube en cada escritura. Los workers comparan solo
+    esta tabla para saber qué idiomas deben volver a leer.
+    """
+    __tablename__ = "translation_versions"
+
+    lang = Column(String, primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from src.schemas import certificate as certificate_schema
 from src.services import certificates_service
-from src.dependencies import get_db, get_current_admin_user
+from src.core.cache import cached_json
+from src.core.pagination import load_page
+from src.core.fields import list_adapter, select_fields
+from src.dependencies import get_db, get_read_db, run_db, ReadSession, get_current_admin_user
 
 router = APIRouter(prefix="/certificates", tags=["Certificates"])
 
@@ -35,21 +38,31 @@ def create_certificate(
 
 
 @router.get("/", response_model=List[certificate_schema.Certificate])
-def read_certificates(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_certificates(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    fields: Optional[str] = None,
+    db: ReadSession = Depends(get_read_db),
+):
     """
     Obtiene una lista de todos los certificados.
     """
-    return certificates_service.get_certificates(db, skip=skip, limit=limit)
+    selected = select_fields(certificate_schema.Certificate, fields)
+    return await cached_json(request, list_adapter(certificate_schema.Certificate, selected), lambda: load_page(
+        request, db, certificates_service.get_certificates, certificates_service.count_certificates,
+        skip=skip, limit=limit, cursor=cursor, include_total=include_total, fields=selected,
+    ))
 
 
 @router.get("/{certificate_id}", response_model=certificate_schema.Certificate)
-def read_certificate(certificate_id: int, db: Session = Depends(get_db)):
+async def read_certificate(certificate_id: int, db: ReadSession = Depends(get_read_db)):
     """
     Obtiene un certificado por su ID.
     """
-    db_certificate = certificates_service.get_certificate(
-        db, certificate_id=certificate_id
-    )
+    db_certificate = await run_db(db, certificates_service.get_certificate, certificate_id=certificate_id)
     if db_certificate is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Certificate not found"
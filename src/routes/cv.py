@@ -1,8 +1,7 @@
 from typing import Literal
-from fastapi import APIRouter, Depends, UploadFile, File, status
-from starlette.responses import StreamingResponse
-import io
+from fastapi import APIRouter, Depends, Request, Response, UploadFile, File, status
 from src.services import cv_service
+from src.core.http import is_not_modified
 from src.dependencies import get_current_admin_user
 
 
@@ -16,20 +15,25 @@ SUPPORTED_LANGUAGES = Literal["en", "es"]
     summary="Download CV as PDF",
     description="Generates and downloads a PDF version of the CV in the specified language.",
 )
-def download_cv(lang_code: SUPPORTED_LANGUAGES):
+def download_cv(lang_code: SUPPORTED_LANGUAGES, request: Request):
     """
     Endpoint to download the CV in PDF format.
 
     - **lang_code**: Specify the language of the CV. Supported: `en`, `es`.
+
+    The PDF is only generated when its Markdown or stylesheet changes; it is
+    served from cache with an `ETag` (If-None-Match -> 304) and `Content-Length`.
     """
-    pdf_bytes = cv_service.generate_cv_pdf(lang_code=lang_code)
+    cv = cv_service.get_cv_pdf(lang_code=lang_code)
     filename = f"CV_Joaquin_{lang_code.upper()}.pdf"
-    
-    return StreamingResponse(
-        io.BytesIO(pdf_bytes),
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
-    )
+    headers = {
+        "Content-Disposition": f"attachment; filename={filename}",
+        "ETag": cv.etag,
+        "Cache-Control": "no-cache",
+    }
+    if is_not_modified(request, cv.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=cv.pdf, media_type="application/pdf", headers=headers)
 
 
 @router.put(
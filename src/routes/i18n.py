@@ -1,14 +1,16 @@
-from fastapi import APIRouter, HTTPException, Depends, Body
-from typing import Dict, Any, List
+from fastapi import APIRouter, HTTPException, Depends, Body, Header, Request, Response
+from typing import Dict, Any, List, Optional
 
 # Importamos nuestro nuevo servicio y las dependencias de autenticación
 from src.services import i18n_service
+from src.core.http import is_not_modified
+from src.core.translations import LanguageFile
 from src.dependencies import get_current_admin_user
 
 router = APIRouter(prefix="/i18n", tags=["Internationalization (i18n)"])
 
 @router.get("/", response_model=List[str])
-def list_available_languages():
+async def list_available_languages():
     """
     Endpoint público para obtener la lista de códigos de idioma disponibles.
     Ej: ["en", "es"]
@@ -16,24 +18,62 @@ def list_available_languages():
     return i18n_service.get_available_languages()
 
 @router.get("/{lang_code}")
-def get_language_file(lang_code: str):
+async def get_language_file(lang_code: str, request: Request, ns: Optional[str] = None):
     """
     Endpoint público para obtener el JSON completo de un idioma.
     Astro usaría este endpoint para buscar las traducciones.
+    Con `ns=navbar,contact.form` solo se devuelven las claves bajo esos
+    prefijos, con un ETag propio que no cambia al editar otras claves.
+    Se sirve desde memoria con el JSON ya serializado (If-None-Match -> 304).
     """
-    translations = i18n_service.get_translations(lang_code)
-    if translations is None:
+    language = i18n_service.get_language_file(lang_code)
+    if language is None:
         raise HTTPException(status_code=404, detail=f"Language '{lang_code}' not found.")
-    return translations
+    namespaces = i18n_service.parse_namespaces(ns)
+    body, etag = (language.body, language.etag)
+    if namespaces:
+        subset = language.subset(namespaces)
+        body, etag = subset.body, subset.etag
+    headers = {"ETag": etag, "X-Translations-Version": str(language.version)}
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def write_response(response: Response, lang_code: str, language: LanguageFile) -> Dict[str, Any]:
+    response.headers["ETag"] = language.etag
+    return {
+        "message": f"Language '{lang_code}' updated successfully.",
+        "version": language.version,
+        "data": language.data,
+    }
 
 @router.put("/{lang_code}", dependencies=[Depends(get_current_admin_user)])
-def update_language_file(lang_code: str, data: Dict[str, Any] = Body(...)):
+def update_language_file(
+    lang_code: str,
+    response: Response,
+    data: Dict[str, Any] = Body(...),
+    if_match: Optional[str] = Header(None),
+):
     """
     Endpoint protegido para actualizar o añadir una o más claves a un archivo
-    de idioma. Requiere autenticación de administrador.
+    de idioma. Requiere autenticación de administrador. Con If-Match (el ETag
+    leído antes) falla con 412 si otro administrador lo cambió entretanto.
     """
-    updated_translations = i18n_service.update_translations(lang_code, data)
-    return {
-        "message": f"Language '{lang_code}' updated successfully.",
-        "data": updated_translations
-    }
\ No newline at end of file
+    language = i18n_service.update_translations(lang_code, data, if_match)
+    return write_response(response, lang_code, language)
+
+@router.patch("/{lang_code}", dependencies=[Depends(get_current_admin_user)])
+def patch_language_file(
+    lang_code: str,
+    response: Response,
+    patch: Any = Body(...),
+    content_type: str = Header("application/merge-patch+json"),
+    if_match: Optional[str] = Header(None),
+):
+    """
+    Endpoint protegido para modificar claves sueltas de un idioma:
+    `application/merge-patch+json` (un valor `null` borra la clave) o
+    `application/json-patch+json` (operaciones RFC 6902). Admite If-Match.
+    """
+    language = i18n_service.patch_translations(lang_code, patch, content_type, if_match)
+    return write_response(response, lang_code, language)
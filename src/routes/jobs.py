@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from src.schemas import job as job_schema
 from src.services import jobs_service
-from src.dependencies import get_db, get_current_admin_user
+from src.core.cache import cached_json
+from src.core.pagination import load_page
+from src.core.fields import list_adapter, select_fields
+from src.dependencies import get_db, get_read_db, run_db, ReadSession, get_current_admin_user
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 
@@ -31,13 +34,25 @@ def create_job(
 
 
 @router.get("/", response_model=List[job_schema.Job])
-def read_jobs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return jobs_service.get_jobs(db=db, skip=skip, limit=limit)
+async def read_jobs(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    fields: Optional[str] = None,
+    db: ReadSession = Depends(get_read_db),
+):
+    selected = select_fields(job_schema.Job, fields)
+    return await cached_json(request, list_adapter(job_schema.Job, selected), lambda: load_page(
+        request, db, jobs_service.get_jobs, jobs_service.count_jobs,
+        skip=skip, limit=limit, cursor=cursor, include_total=include_total, fields=selected,
+    ))
 
 
 @router.get("/{job_id}", response_model=job_schema.Job)
-def read_job(job_id: int, db: Session = Depends(get_db)):
-    db_job = jobs_service.get_job(db=db, job_id=job_id)
+async def read_job(job_id: int, db: ReadSession = Depends(get_read_db)):
+    db_job = await run_db(db, jobs_service.get_job, job_id=job_id)
 
     if db_job is None:
         raise HTTPException(
@@ -0,0 +1,116 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from starlette.responses import FileResponse, StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.core.http import make_etag, http_date, is_not_modified
+from src.core.storage import storage_of
+from src.services import media_service
+from src.dependencies import get_db
+
+router = APIRouter(tags=["Media"])
+
+# Los nombres de archivo son UUIDs: el contenido de una URL nunca cambia
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _cache_headers(media) -> dict:
+    # La variante servida depende de Accept, así que las cachés deben distinguirla
+    headers = {"Cache-Control": IMMUTABLE_CACHE_CONTROL, "Vary": "Accept"}
+    if media.content_hash:
+        headers["ETag"] = make_etag(media.content_hash)
+    if media.created_at:
+        headers["Last-Modified"] = http_date(media.created_at)
+    return headers
+
+
+def _cached_response(request: Request, cached) -> Response:
+    headers = _cache_headers(cached)
+    if is_not_modified(request, headers.get("ETag"), cached.created_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=cached.data, media_type=cached.content_type, headers=headers)
+
+
+def _resolve_variant(db: Session, filename: str, w: Optional[int], request: Request) -> str:
+    candidates = media_service.get_media_variants(db, filename)
+    if not candidates:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+    return media_service.select_variant(candidates, w, request.headers.get("accept")).filename
+
+
+# Ruta para servir imágenes desde la Base de Datos
+@router.get("/static/images/{filename}")
+def get_image(
+    filename: str,
+    request: Request,
+    w: Optional[int] = Query(None, ge=1, description="Ancho deseado en píxeles"),
+    db: Session = Depends(get_db),
+):
+    """
+    Sirve una imagen almacenada en la base de datos, eligiendo la variante
+    responsiva según `?w=` y los formatos anunciados en `Accept` (WebP/AVIF).
+
+    Las imágenes pequeñas se sirven desde la caché en memoria sin tocar la BD;
+    el resto se sirve directamente desde disco (almacenamiento en sistema de
+    archivos) o se transmite en bloques para no cargar el BLOB completo en memoria.
+    Responde 304 a las peticiones condicionales sin leer el contenido binario.
+    """
+    filename = _resolve_variant(db, filename, w, request)
+
+    cached = media_service.media_cache.get(filename)
+    if cached is not None:
+        return _cached_response(request, cached)
+
+    media = media_service.get_media_info(db, filename)
+    if media is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+
+    headers = _cache_headers(media)
+    if is_not_modified(request, headers.get("ETag"), media.created_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    cached = media_service.load_cached_media(db, filename, media)
+    if cached is not None:
+        return _cached_response(request, cached)
+
+    path = storage_of(media).path(filename)
+    if path is not None:
+        return FileResponse(path, media_type=media.content_type, headers=headers)
+
+    return StreamingResponse(
+        media_service.iter_media_chunks(db, media),
+        media_type=media.content_type,
+        headers={**headers, "Content-Length": str(media.size)},
+    )
+
+
+@router.head("/static/images/{filename}")
+def head_image(
+    filename: str,
+    request: Request,
+    w: Optional[int] = Query(None, ge=1, description="Ancho deseado en píxeles"),
+    db: Session = Depends(get_db),
+):
+    """
+    Devuelve las cabeceras de la imagen (Content-Length, Content-Type, ETag...)
+    a partir de sus metadatos, sin leer nunca el contenido binario.
+    """
+    filename = _resolve_variant(db, filename, w, request)
+
+    media = media_service.media_cache.get(filename)
+    size = len(media.data) if media is not None else None
+    if media is None:
+        media = media_service.get_media_info(db, filename)
+        if media is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Image not found")
+        size = media.size
+
+    headers = _cache_headers(media)
+    if is_not_modified(request, headers.get("ETag"), media.created_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    headers["Content-Length"] = str(size)
+    if media.content_type:
+        headers["Content-Type"] = media.content_type
+    return Response(headers=headers)
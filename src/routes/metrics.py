@@ -0,0 +1,20 @@
+from fastapi import APIRouter
+from typing import Dict, Any
+
+from src.core.cache import response_cache
+from src.services import media_service
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/cache")
+def read_cache_metrics() -> Dict[str, Any]:
+    """
+    Endpoint público con los contadores de las cachés en memoria del proceso
+    (aciertos, fallos, expulsiones y bytes ocupados) para monitorización.
+    """
+    return {
+        "media": media_service.media_cache.stats(),
+        "media_variants": media_service.variant_index.stats(),
+        "responses": response_cache.stats(),
+    }
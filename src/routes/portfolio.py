@@ -0,0 +1,26 @@
+from fastapi import APIRouter, Depends, Request
+from pydantic import TypeAdapter
+from typing import Optional
+
+from src.schemas import portfolio as portfolio_schema
+from src.services import portfolio_service
+from src.core.cache import cached_json
+from src.dependencies import get_read_db, run_db, ReadSession
+
+router = APIRouter(prefix="/portfolio", tags=["Portfolio"])
+
+# Serializes the snapshot stored in the response cache
+PORTFOLIO = TypeAdapter(portfolio_schema.Portfolio)
+
+
+@router.get("", response_model=portfolio_schema.Portfolio)
+async def read_portfolio(request: Request, lang: Optional[str] = None, db: ReadSession = Depends(get_read_db)):
+    """
+    Get every public collection (projects, technologies, tags, jobs,
+    certificates and socials) and, with `?lang=`, that language's
+    translations in a single response. The snapshot is cached as one blob
+    and invalidated by any admin write.
+    """
+    return await cached_json(
+        request, PORTFOLIO, lambda: run_db(db, portfolio_service.get_portfolio, lang=lang)
+    )
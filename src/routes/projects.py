@@ -6,14 +6,24 @@ from fastapi import (
     File,
     UploadFile,
     status,
+    Query,
     Request,
+    Response,
 )
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from functools import lru_cache
+from typing import List, Literal, Optional, Tuple
+from pydantic import TypeAdapter, create_model
 
 from src.schemas import project as project_schema
+from src.schemas.bulk import BulkResult
 from src.services import projects_service
-from src.dependencies import get_db, get_current_admin_user
+from src.core.cache import cached_json
+from src.core.pagination import load_page
+from src.core.bulk import bundle_files, parse_payload
+from src.core.fields import item_adapter, list_adapter, partial_model, select_fields, supported_languages
+from src.core.http import preferred_language
+from src.dependencies import get_db, get_read_db, run_db, ReadSession, get_current_admin_user
 
 router = APIRouter(prefix="/projects", tags=["Projects"])
 
@@ -78,19 +88,127 @@ def create_project(
     )
 
 
+@router.post(
+    "/bulk",
+    response_model=BulkResult,
+    dependencies=[Depends(get_current_admin_user)],
+)
+def bulk_projects(
+    payload: str = Form(...),
+    files: List[UploadFile] = File([]),
+    db: Session = Depends(get_db),
+):
+    """
+    Create, update and delete projects in one request. `payload` is a JSON
+    object with `create`, `update` and `delete` lists; images are referenced
+    by the file name of one of the uploaded `files`. The whole batch is
+    validated first and applied in a single transaction.
+    """
+    bulk = parse_payload(project_schema.ProjectBulk, payload)
+    return {"results": projects_service.bulk_projects(db=db, bulk=bulk, files=bundle_files(files))}
+
+
+# Languages with a localized description column (description_en, description_es)
+PROJECT_LANGUAGES = supported_languages(project_schema.Project)
+
+
+def response_language(request: Request, lang: Optional[str]) -> Optional[str]:
+    """`?lang=` wins; otherwise the best Accept-Language match, or None for every language."""
+    if lang:
+        return lang
+    return preferred_language(request.headers.get("accept-language"), PROJECT_LANGUAGES)
+
+
+def with_language_headers(response: Response, language: Optional[str]) -> Response:
+    # The body depends on Accept-Language, so shared HTTP caches must key on it
+    response.headers.add_vary_header("Accept-Language")
+    if language:
+        response.headers["Content-Language"] = language
+    return response
+
+
 @router.get("/", response_model=List[project_schema.Project])
-def read_projects(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get all projects with their technologies."""
-    return projects_service.get_projects(db=db, skip=skip, limit=limit)
+async def read_projects(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    fields: Optional[str] = None,
+    lang: Optional[str] = None,
+    technology: List[str] = Query([]),
+    tag: List[str] = Query([]),
+    match: Literal["all", "any"] = "all",
+    db: ReadSession = Depends(get_read_db),
+):
+    """
+    Get all projects with their technologies. `fields=` returns (and loads)
+    only the listed fields; `lang=` or `Accept-Language` keeps only that
+    language's description. `technology=` and `tag=` (repeatable, by name)
+    keep the projects having all of them, or any of them with `match=any`.
+    """
+    language = response_language(request, lang)
+    selected = select_fields(project_schema.Project, fields, language)
+    response = await cached_json(request, list_adapter(project_schema.Project, selected), lambda: load_page(
+        request, db, projects_service.get_projects, projects_service.count_projects,
+        skip=skip, limit=limit, cursor=cursor, include_total=include_total, fields=selected,
+        technologies=technology, tags=tag, match=match,
+    ), f"lang={language}")
+    return with_language_headers(response, language)
+
+
+@lru_cache(maxsize=16)
+def search_adapter(fields: Optional[Tuple[str, ...]]) -> TypeAdapter:
+    """Search results whose nested project is trimmed to `fields`."""
+    result = create_model(
+        "ProjectSearchResultFields",
+        __base__=project_schema.ProjectSearchResult,
+        project=(partial_model(project_schema.Project, fields), ...),
+    )
+    return TypeAdapter(List[result])
+
+
+# Declared before /{project_id} so "search" is not taken as an id
+@router.get("/search", response_model=List[project_schema.ProjectSearchResult])
+async def search_projects(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    lang: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    db: ReadSession = Depends(get_read_db),
+):
+    """
+    Full-text search over titles and descriptions, ranked by relevance.
+    With `lang=` or `Accept-Language` only that language's description is
+    searched and returned.
+    """
+    language = response_language(request, lang)
+    selected = select_fields(project_schema.Project, None, language)
+    response = await cached_json(request, search_adapter(selected), lambda: run_db(
+        db, projects_service.search_projects, q=q, lang=language, limit=limit, fields=selected,
+    ), f"lang={language}")
+    return with_language_headers(response, language)
 
 
 @router.get("/{project_id}", response_model=project_schema.Project)
-def read_project(project_id: int, db: Session = Depends(get_db)):
-    """Get a single project with its technologies."""
-    db_project = projects_service.get_project(db=db, project_id=project_id)
-    if db_project is None:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
-    return db_project
+async def read_project(
+    request: Request,
+    project_id: int,
+    lang: Optional[str] = None,
+    db: ReadSession = Depends(get_read_db),
+):
+    """Get a single project with its technologies, in one language with `lang=` or `Accept-Language`."""
+    language = response_language(request, lang)
+    selected = select_fields(project_schema.Project, None, language)
+
+    async def load():
+        db_project = await run_db(db, projects_service.get_project, project_id=project_id, fields=selected)
+        if db_project is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+        return db_project
+
+    response = await cached_json(request, item_adapter(project_schema.Project, selected), load, f"lang={language}")
+    return with_language_headers(response, language)
 
 
 @router.put(
@@ -1,10 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status, Request
 from sqlalchemy.orm import Session
 from typing import List, Optional
 
 from src.schemas import social as social_schema
 from src.services import socials_service
-from src.dependencies import get_db, get_current_admin_user
+from src.core.cache import cached_json
+from src.core.pagination import load_page
+from src.core.fields import list_adapter, select_fields
+from src.dependencies import get_db, get_read_db, run_db, ReadSession, get_current_admin_user
 
 router = APIRouter(prefix="/socials", tags=["Socials"])
 
@@ -35,21 +38,33 @@ def create_social(
 @router.get(
     "/", response_model=List[social_schema.Social], summary="Get all social profiles"
 )
-def read_socials(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+async def read_socials(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    fields: Optional[str] = None,
+    db: ReadSession = Depends(get_read_db),
+):
     """
     Gets a list of all social profiles.
     """
-    return socials_service.get_socials(db, skip=skip, limit=limit)
+    selected = select_fields(social_schema.Social, fields)
+    return await cached_json(request, list_adapter(social_schema.Social, selected), lambda: load_page(
+        request, db, socials_service.get_socials, socials_service.count_socials,
+        skip=skip, limit=limit, cursor=cursor, include_total=include_total, fields=selected,
+    ))
 
 
 @router.get(
     "/{social_id}", response_model=social_schema.Social, summary="Get a single social profile"
 )
-def read_social(social_id: int, db: Session = Depends(get_db)):
+async def read_social(social_id: int, db: ReadSession = Depends(get_read_db)):
     """
     Gets a social profile by its ID.
     """
-    db_social = socials_service.get_social(db, social_id=social_id)
+    db_social = await run_db(db, socials_service.get_social, social_id=social_id)
     if db_social is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Social profile not found"
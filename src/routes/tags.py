@@ -1,10 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Request
 from sqlalchemy.orm import Session
-from typing import List
+from functools import partial
+from typing import List, Optional
 
 from src.schemas import tag as tag_schema
+from src.schemas.bulk import BulkResult
 from src.services import tags_service
-from src.dependencies import get_db, get_current_admin_user
+from src.core.cache import cached_json
+from src.core.pagination import load_page
+from src.core.fields import list_adapter, select_fields
+from src.dependencies import get_db, get_read_db, run_db, ReadSession, get_current_admin_user
 
 router = APIRouter(prefix="/tags", tags=["Tags"])
 
@@ -12,13 +17,33 @@ router = APIRouter(prefix="/tags", tags=["Tags"])
 def create_tag(tag: tag_schema.TagCreate, db: Session = Depends(get_db)):
     return tags_service.create_tag(db=db, tag=tag)
 
-@router.get("/", response_model=List[tag_schema.Tag])
-def read_tags(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return tags_service.get_tags(db=db, skip=skip, limit=limit)
+@router.post("/bulk", response_model=BulkResult, dependencies=[Depends(get_current_admin_user)])
+def bulk_tags(bulk: tag_schema.TagBulk, db: Session = Depends(get_db)):
+    """Create, rename and delete tags in a single transaction (all or nothing)."""
+    return {"results": tags_service.bulk_tags(db=db, bulk=bulk)}
+
+@router.get("/", response_model=List[tag_schema.Tag | tag_schema.TagWithCount])
+async def read_tags(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    fields: Optional[str] = None,
+    with_counts: bool = False,
+    db: ReadSession = Depends(get_read_db),
+):
+    # with_counts=true adds project_count, computed with one GROUP BY
+    schema = tag_schema.TagWithCount if with_counts else tag_schema.Tag
+    selected = select_fields(schema, fields)
+    return await cached_json(request, list_adapter(schema, selected), lambda: load_page(
+        request, db, partial(tags_service.get_tags, with_counts=with_counts), tags_service.count_tags,
+        skip=skip, limit=limit, cursor=cursor, include_total=include_total, fields=selected,
+    ))
 
 @router.get("/{tag_id}", response_model=tag_schema.Tag)
-def read_tag(tag_id: int, db: Session = Depends(get_db)):
-    db_tag = tags_service.get_tag(db=db, tag_id=tag_id)
+async def read_tag(tag_id: int, db: ReadSession = Depends(get_read_db)):
+    db_tag = await run_db(db, tags_service.get_tag, tag_id=tag_id)
     if db_tag is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Tag not found")
     return db_tag
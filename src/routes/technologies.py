@@ -1,10 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status
+from fastapi import APIRouter, Depends, HTTPException, Form, File, UploadFile, status, Request
 from sqlalchemy.orm import Session
+from functools import partial
 from typing import List, Optional
 
 from src.schemas import technology as technology_schema
+from src.schemas.bulk import BulkResult
 from src.services import technology_service
-from src.dependencies import get_db, get_current_admin_user
+from src.core.cache import cached_json
+from src.core.pagination import load_page
+from src.core.bulk import bundle_files, parse_payload
+from src.core.fields import list_adapter, select_fields
+from src.dependencies import get_db, get_read_db, run_db, ReadSession, get_current_admin_user
 
 router = APIRouter(prefix="/technologies", tags=["Technologies"])
 
@@ -29,20 +35,56 @@ def create_technology(
     )
 
 
-@router.get("/", response_model=List[technology_schema.Technology], summary="Get all technologies")
-def read_technologies(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+@router.post(
+    "/bulk",
+    response_model=BulkResult,
+    dependencies=[Depends(get_current_admin_user)],
+    summary="Create, update and delete technologies in one request",
+    description=(
+        "`payload` is a JSON object with `create`, `update` and `delete` lists; icons are "
+        "referenced by the file name of one of the uploaded `files`. The whole batch is "
+        "validated first and applied in a single transaction. Requires admin authentication."
+    ),
+)
+def bulk_technologies(
+    payload: str = Form(...),
+    files: List[UploadFile] = File([]),
+    db: Session = Depends(get_db),
+):
+    bulk = parse_payload(technology_schema.TechnologyBulk, payload)
+    return {"results": technology_service.bulk_technologies(db=db, bulk=bulk, files=bundle_files(files))}
+
+
+@router.get("/", response_model=List[technology_schema.Technology | technology_schema.TechnologyWithCount], summary="Get all technologies")
+async def read_technologies(
+    request: Request,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
+    fields: Optional[str] = None,
+    with_counts: bool = False,
+    db: ReadSession = Depends(get_read_db),
+):
     """
-    Retrieves a list of all available technologies.
+    Retrieves a list of all available technologies. With `with_counts=true`
+    each one also carries `project_count`, computed with a single GROUP BY.
     """
-    return technology_service.get_technologies(db=db, skip=skip, limit=limit)
+    schema = technology_schema.TechnologyWithCount if with_counts else technology_schema.Technology
+    selected = select_fields(schema, fields)
+    return await cached_json(request, list_adapter(schema, selected), lambda: load_page(
+        request, db, partial(technology_service.get_technologies, with_counts=with_counts),
+        technology_service.count_technologies,
+        skip=skip, limit=limit, cursor=cursor, include_total=include_total, fields=selected,
+    ))
 
 
 @router.get("/{technology_id}", response_model=technology_schema.Technology, summary="Get a single technology by ID")
-def read_technology(technology_id: int, db: Session = Depends(get_db)):
+async def read_technology(technology_id: int, db: ReadSession = Depends(get_read_db)):
     """
     Retrieves the details of a specific technology by its ID.
     """
-    db_technology = technology_service.get_technology(db=db, technology_id=technology_id)
+    db_technology = await run_db(db, technology_service.get_technology, technology_id=technology_id)
     if db_technology is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
     return db_technology
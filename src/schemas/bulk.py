@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+from typing import List, Literal
+
+
+class BulkItemResult(BaseModel):
+    op: Literal["create", "update", "delete"]
+    # Position of the item in its create/update/delete list
+    index: int
+    id: int
+
+
+class BulkResult(BaseModel):
+    results: List[BulkItemResult]
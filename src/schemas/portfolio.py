@@ -0,0 +1,21 @@
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, List, Optional
+
+from .project import Project
+from .technology import Technology
+from .tag import Tag
+from .job import Job
+from .certificate import Certificate
+from .social import Social
+
+
+class Portfolio(BaseModel):
+    projects: List[Project] = []
+    technologies: List[Technology] = []
+    tags: List[Tag] = []
+    jobs: List[Job] = []
+    certificates: List[Certificate] = []
+    socials: List[Social] = []
+    lang: Optional[str] = None
+    translations: Optional[Dict[str, Any]] = None
+    model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from .technology import Technology
 from .tag import Tag
@@ -34,3 +34,26 @@ class ProjectUpdate(BaseModel):
     image_route: Optional[str] = None
     technology_ids: Optional[List[int]] = None
     tag_ids: Optional[List[int]] = None
+
+
+class ProjectSearchResult(BaseModel):
+    project: Project
+    rank: float
+    # Matching fragments with <mark> around the hits; the rest of the text is HTML-escaped
+    highlights: Dict[str, str]
+
+
+class ProjectBulkCreate(ProjectCreate):
+    # Name of the uploaded file (in the same request) to use as image
+    image: str
+
+
+class ProjectBulkUpdate(ProjectUpdate):
+    id: int
+    image: Optional[str] = None
+
+
+class ProjectBulk(BaseModel):
+    create: List[ProjectBulkCreate] = []
+    update: List[ProjectBulkUpdate] = []
+    delete: List[int] = []
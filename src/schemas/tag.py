@@ -1,5 +1,5 @@
 from pydantic import BaseModel, ConfigDict
-from typing import Optional
+from typing import List, Optional
 
 class TagBase(BaseModel):
     name: str
@@ -13,3 +13,14 @@ class TagUpdate(BaseModel):
 class Tag(TagBase):
     id: int
     model_config = ConfigDict(from_attributes=True)
+
+class TagWithCount(Tag):
+    project_count: int
+
+class TagBulkUpdate(TagUpdate):
+    id: int
+
+class TagBulk(BaseModel):
+    create: List[TagCreate] = []
+    update: List[TagBulkUpdate] = []
+    delete: List[int] = []
@@ -16,6 +16,27 @@ class Technology(TechnologyBase):
     model_config = ConfigDict(from_attributes=True)
 
 
+class TechnologyWithCount(Technology):
+    project_count: int
+
+
 class TechnologyUpdate(BaseModel):
     name: Optional[str] = None
     icon: Optional[str] = None
+
+
+class TechnologyBulkCreate(TechnologyCreate):
+    # Name of the uploaded file (in the same request) to use as icon
+    icon: str
+
+
+class TechnologyBulkUpdate(BaseModel):
+    id: int
+    name: Optional[str] = None
+    icon: Optional[str] = None
+
+
+class TechnologyBulk(BaseModel):
+    create: List[TechnologyBulkCreate] = []
+    update: List[TechnologyBulkUpdate] = []
+    delete: List[int] = []
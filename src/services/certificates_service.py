@@ -1,16 +1,29 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.models.certificate import Certificate
 from src.schemas import certificate as certificate_schema
 from src.utils import save_image, delete_image
+from src.core.cache import response_cache
+from src.core.pagination import keyset
+from src.core.fields import load_only_fields
 
 def get_certificate(db: Session, certificate_id: int):
     return db.query(Certificate).filter(Certificate.id == certificate_id).first()
 
-def get_certificates(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Certificate).offset(skip).limit(limit).all()
+def get_certificates(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+):
+    return keyset(db.query(Certificate).options(*load_only_fields(Certificate, fields)), Certificate.id, skip, limit, after).all()
+
+def count_certificates(db: Session) -> int:
+    return db.query(func.count(Certificate.id)).scalar()
 
 def create_certificate(db: Session, certificate_data: certificate_schema.CertificateCreate, image_file: UploadFile) -> Certificate:
     """
@@ -28,6 +41,7 @@ def create_certificate(db: Session, certificate_data: certificate_schema.Certifi
     # 3. Guardar en la base de datos
     db.add(db_certificate)
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_certificate)
     return db_certificate
 
@@ -62,6 +76,7 @@ def update_certificate(
         db_certificate.image_route = new_image_route
 
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_certificate)
     return db_certificate
 
@@ -80,4 +95,5 @@ def delete_certificate(db: Session, certificate_id: int) -> Optional[Certificate
     # 2. Borrar el registro de la base de datos
     db.delete(db_certificate)
     db.commit()
+    response_cache.bump_version()
     return db_certificate
\ No newline at end of file
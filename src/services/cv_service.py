@@ -1,11 +1,18 @@
+import hashlib
 import logging
-from typing import Literal
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Literal, Optional
 
 import markdown2
 from fastapi import HTTPException, status, UploadFile
-from weasyprint import CSS, HTML
+from fastapi.concurrency import run_in_threadpool
 
-from src.core.config import SRC_DIR
+from src.core.config import SRC_DIR, settings
+from src.core.http import make_etag
 
 logger = logging.getLogger(__name__)
 
@@ -13,24 +20,34 @@ CV_DIR = SRC_DIR / "static" / "others"
 SUPPORTED_LANGUAGES = Literal["en", "es"]
 
 
-def generate_cv_pdf(lang_code: SUPPORTED_LANGUAGES) -> bytes:
-    """
-    Generates a PDF version of the CV from a Markdown file.
+@dataclass(frozen=True)
+class RenderedCV:
+    """A generated PDF and the hash of the Markdown + CSS it was built from."""
+    key: str
+    pdf: bytes
 
-    Args:
-        lang_code: The language code ('en' or 'es').
+    @property
+    def etag(self) -> str:
+        return make_etag(self.key[:32])
 
-    Returns:
-        The generated PDF as bytes.
+
+# Último PDF generado de cada idioma (solo hay uno vigente por idioma)
+cv_cache: Dict[str, RenderedCV] = {}
+# Evita que varias descargas simultáneas generen el mismo PDF a la vez
+_render_locks: Dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
+
+
+def _sources(lang_code: str) -> tuple[Path, Path]:
+    """
+    Paths of the Markdown and CSS files of a CV.
 
     Raises:
         HTTPException: If the Markdown or CSS file is not found.
     """
-    md_filename = f"cv_{lang_code}.md"
-    md_filepath = CV_DIR / md_filename
+    md_filepath = CV_DIR / f"cv_{lang_code}.md"
     css_filepath = CV_DIR / "style.css"
 
-    # 1. Verify that the required files exist
     if not md_filepath.exists():
         logger.error(f"Markdown file not found: {md_filepath}")
         raise HTTPException(
@@ -43,22 +60,106 @@ def generate_cv_pdf(lang_code: SUPPORTED_LANGUAGES) -> bytes:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="CV stylesheet is missing.",
         )
+    return md_filepath, css_filepath
 
+
+def render_pdf(markdown_text: str, css_text: str) -> bytes:
+    """Converts Markdown to HTML with markdown2 and lays it out as a PDF with WeasyPrint."""
+    # Import diferido: WeasyPrint necesita Pango del sistema y la app debe arrancar sin él
+    from weasyprint import CSS, HTML
+
+    html_content = markdown2.markdown(markdown_text, extras=["tables", "fenced-code-blocks"])
+    return HTML(string=html_content).write_pdf(
+        stylesheets=[CSS(string=css_text, base_url=str(CV_DIR))]
+    )
+
+
+def _cache_path(lang_code: str, key: str) -> Path:
+    return settings.CV_CACHE_DIR / f"cv_{lang_code}-{key}.pdf"
+
+
+def _read_cached(lang_code: str, key: str) -> Optional[bytes]:
     try:
-        # 2. Read Markdown and CSS content and convert to HTML
-        html_content = markdown2.markdown(
-            md_filepath.read_text(encoding="utf-8"),
-            extras=["tables", "fenced-code-blocks"],
-        )
+        return _cache_path(lang_code, key).read_bytes()
+    except OSError:
+        return None
+
+
+def _write_cached(lang_code: str, key: str, pdf: bytes) -> None:
+    """Saves the PDF atomically and removes the older ones of the same language."""
+    directory = settings.CV_CACHE_DIR
+    try:
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".cv_{lang_code}.", suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(pdf)
+        os.replace(tmp_path, _cache_path(lang_code, key))
+        for old in directory.glob(f"cv_{lang_code}-*.pdf"):
+            if old.name != _cache_path(lang_code, key).name:
+                old.unlink(missing_ok=True)
+    except OSError as e:
+        # Sin caché en disco se sigue sirviendo desde memoria
+        logger.warning(f"Could not write the cached CV '{lang_code}': {e}")
+
+
+def get_cv_pdf(lang_code: SUPPORTED_LANGUAGES) -> RenderedCV:
+    """
+    Returns the PDF of the CV, generating it only when the Markdown or the
+    stylesheet changed. The cache key is the SHA-256 of both files, so
+    edits made by hand are picked up too. Lookups go memory -> disk
+    (CV_CACHE_DIR, shared by workers and kept across restarts) -> WeasyPrint.
+
+    Raises:
+        HTTPException: If a source file is missing or the PDF can't be generated.
+    """
+    md_filepath, css_filepath = _sources(lang_code)
+    markdown_bytes = md_filepath.read_bytes()
+    css_bytes = css_filepath.read_bytes()
+    key = hashlib.sha256(markdown_bytes + b"\0" + css_bytes).hexdigest()
+
+    cached = cv_cache.get(lang_code)
+    if cached is not None and cached.key == key:
+        return cached
+
+    with _locks_guard:
+        lock = _render_locks.setdefault(lang_code, threading.Lock())
+    with lock:
+        cached = cv_cache.get(lang_code)
+        if cached is not None and cached.key == key:
+            return cached
+
+        pdf = _read_cached(lang_code, key)
+        if pdf is None:
+            pdf = generate_cv_pdf(lang_code, markdown_bytes.decode("utf-8"), css_bytes.decode("utf-8"))
+            _write_cached(lang_code, key, pdf)
+        rendered = RenderedCV(key=key, pdf=pdf)
+        cv_cache[lang_code] = rendered
+        return rendered
+
+
+def generate_cv_pdf(lang_code: SUPPORTED_LANGUAGES, markdown_text: str, css_text: str) -> bytes:
+    """
+    Generates a PDF version of the CV from its Markdown and CSS.
 
-        # 3. Generate PDF using WeasyPrint
-        html = HTML(string=html_content)
-        css = CSS(css_filepath)
-        pdf_bytes = html.write_pdf(stylesheets=[css])
+    Args:
+        lang_code: The language code ('en' or 'es').
+        markdown_text: Content of `cv_{lang_code}.md`.
+        css_text: Content of `style.css`.
 
-        logger.info(f"Successfully generated PDF for CV in '{lang_code}'.")
-        return pdf_bytes
+    Returns:
+        The generated PDF as bytes.
 
+    Raises:
+        HTTPException: If WeasyPrint is not available or the PDF can't be generated.
+    """
+    try:
+        pdf_bytes = render_pdf(markdown_text, css_text)
+    except (ImportError, OSError) as e:
+        logger.error(f"WeasyPrint is not available: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="PDF generation is not available on this server.",
+        )
     except Exception as e:
         logger.exception(f"Failed to generate PDF for CV '{lang_code}': {e}")
         raise HTTPException(
@@ -66,10 +167,14 @@ def generate_cv_pdf(lang_code: SUPPORTED_LANGUAGES) -> bytes:
             detail="Could not generate the PDF file.",
         )
 
+    logger.info(f"Successfully generated PDF for CV in '{lang_code}'.")
+    return pdf_bytes
+
 
 async def update_cv_md(lang_code: SUPPORTED_LANGUAGES, file: UploadFile):
     """
-    Updates a CV's Markdown file with the content of an uploaded file.
+    Updates a CV's Markdown file with the content of an uploaded file and
+    regenerates its PDF right away, so the next download is served from cache.
 
     Args:
         lang_code: The language code ('en' or 'es').
@@ -96,4 +201,10 @@ async def update_cv_md(lang_code: SUPPORTED_LANGUAGES, file: UploadFile):
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Could not save the CV file.",
-        )
\ No newline at end of file
+        )
+
+    try:
+        await run_in_threadpool(get_cv_pdf, lang_code)
+    except HTTPException as e:
+        # El Markdown ya está guardado; la descarga lo volverá a intentar
+        logger.warning(f"Could not pre-render the CV '{lang_code}': {e.detail}")
@@ -1,56 +1,99 @@
-import json
-import os
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
+
+from fastapi import HTTPException
+
+from src.core.cache import response_cache
+from src.core.config import settings
+from src.core.jsonpatch import PatchConflict, PatchError, json_patch, merge_patch
+from src.core.translations import BaseTranslationStore, DatabaseTranslationStore, LanguageFile, TranslationStore
+from src.database import SessionLocal
 
 # Ruta al directorio donde guardamos los archivos de idioma
 I18N_DIR = "src/i18n"
 
+def create_store(backend: str = settings.I18N_BACKEND) -> BaseTranslationStore:
+    """
+    Idiomas en memoria; los endpoints de lectura no tocan el disco ni la base
+    de datos. Si otro proceso los cambia, el snapshot de /portfolio también caduca.
+    """
+    if backend == "database":
+        return DatabaseTranslationStore(SessionLocal, on_change=response_cache.bump_version)
+    return TranslationStore(I18N_DIR, on_change=response_cache.bump_version)
+
+store = create_store()
+
 def get_available_languages() -> List[str]:
     """
-    Escanea el directorio i18n y devuelve una lista de los idiomas disponibles
-    (basado en los nombres de archivo .json).
+    Devuelve la lista de los idiomas disponibles (los archivos .json del
+    directorio i18n o los de la tabla `translations`, ya cargados en memoria).
     """
-    langs = []
-    if not os.path.exists(I18N_DIR):
-        return []
-        
-    for filename in os.listdir(I18N_DIR):
-        if filename.endswith(".json"):
-            langs.append(filename[:-5])  # Elimina la extensión '.json'
-    return sorted(langs)
+    return store.languages()
+
+def get_language_file(lang_code: str) -> LanguageFile | None:
+    """Idioma cargado en memoria, con su JSON ya serializado. None si no existe."""
+    return store.get(lang_code)
+
+def parse_namespaces(ns: Optional[str]) -> Tuple[str, ...]:
+    """`?ns=navbar,contact.form` -> ("contact.form", "navbar"); vacío si no se filtra."""
+    if not ns:
+        return ()
+    return tuple(sorted({namespace.strip() for namespace in ns.split(",") if namespace.strip()}))
 
 def get_translations(lang_code: str) -> Dict[str, Any] | None:
     """
-    Lee y devuelve el contenido de un archivo de idioma específico.
+    Devuelve el contenido de un archivo de idioma específico.
     Devuelve None si el archivo no existe.
     """
-    filepath = os.path.join(I18N_DIR, f"{lang_code}.json")
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None
-
-def update_translations(lang_code: str, new_data: Dict[str, Any]) -> Dict[str, Any]:
-    """
-    Actualiza un archivo de idioma. Carga los datos existentes, los fusiona
-    con los nuevos datos y guarda el archivo completo.
-    Crea el archivo si no existe.
-    """
-    filepath = os.path.join(I18N_DIR, f"{lang_code}.json")
-    
-    # Asegurarse de que el directorio i18n exista
-    if not os.path.exists(I18N_DIR):
-        os.makedirs(I18N_DIR)
-
-    current_data = get_translations(lang_code) or {}
-    
-    # Fusiona los datos viejos con los nuevos
-    current_data.update(new_data)
-    
-    # Escribe el archivo actualizado de vuelta al disco
-    with open(filepath, 'w', encoding='utf-8') as f:
-        # indent=2 para que el JSON sea legible. ensure_ascii=False para acentos.
-        json.dump(current_data, f, ensure_ascii=False, indent=2)
-        
-    return current_data
\ No newline at end of file
+    language = store.get(lang_code)
+    return language.data if language else None
+
+def update_translations(
+    lang_code: str, new_data: Dict[str, Any], if_match: Optional[str] = None
+) -> LanguageFile:
+    """
+    Actualiza un archivo de idioma fusionando las claves nuevas con las
+    existentes. Crea el archivo si no existe.
+    """
+    language = store.write(lang_code, lambda current: {**current, **new_data}, if_match)
+    # El snapshot de /portfolio incluye las traducciones
+    response_cache.bump_version()
+    return language
+
+# Tipos de contenido aceptados por PATCH
+MERGE_PATCH = "application/merge-patch+json"
+JSON_PATCH = "application/json-patch+json"
+
+def patch_translations(
+    lang_code: str, patch: Any, content_type: str, if_match: Optional[str] = None
+) -> LanguageFile:
+    """
+    Aplica un parche a un idioma existente: JSON Merge Patch (una clave con
+    `null` se borra) o JSON Patch (lista de operaciones add/remove/replace/
+    move/copy/test). El parche se aplica entero o no se aplica.
+    """
+    if store.get(lang_code) is None:
+        raise HTTPException(status_code=404, detail=f"Language '{lang_code}' not found.")
+    media_type = content_type.split(";")[0].strip().lower()
+    if media_type == JSON_PATCH:
+        apply = json_patch
+    elif media_type in (MERGE_PATCH, "application/json"):
+        apply = merge_patch
+    else:
+        raise HTTPException(
+            status_code=415, detail=f"Use {MERGE_PATCH} or {JSON_PATCH}."
+        )
+
+    def change(current: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            patched = apply(current, patch)
+        except PatchConflict as e:
+            raise HTTPException(status_code=409, detail=str(e))
+        except PatchError as e:
+            raise HTTPException(status_code=422, detail=str(e))
+        if not isinstance(patched, dict):
+            raise HTTPException(status_code=422, detail="A language file must be a JSON object.")
+        return patched
+
+    language = store.write(lang_code, change, if_match)
+    response_cache.bump_version()
+    return language
@@ -0,0 +1,130 @@
+import io
+import logging
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+from PIL import Image, ImageOps, features
+
+logger = logging.getLogger(__name__)
+
+# Formatos que se pueden generar como variantes y cómo se guardan
+VARIANT_FORMATS = {
+    "webp": {"format": "WEBP", "content_type": "image/webp", "params": {"quality": 80, "method": 4}},
+    "avif": {"format": "AVIF", "content_type": "image/avif", "params": {"quality": 60}},
+}
+# Formatos originales que también se redimensionan en su propia codificación
+RESIZABLE_FORMATS = {
+    "JPEG": {"quality": 85, "optimize": True},
+    "PNG": {"optimize": True},
+    "WEBP": {"quality": 80},
+}
+
+
+class InvalidImageError(ValueError):
+    pass
+
+
+@dataclass
+class ImageVariant:
+    width: int
+    extension: str
+    content_type: str
+    data: bytes
+
+
+@dataclass
+class ProcessedImage:
+    format: str
+    content_type: str
+    width: int
+    height: int
+    variants: List[ImageVariant] = field(default_factory=list)
+
+
+def _encode(img: Image.Image, image_format: str, params: dict) -> bytes:
+    if image_format == "JPEG" and img.mode not in ("RGB", "L"):
+        img = img.convert("RGB")
+    elif img.mode not in ("RGB", "RGBA", "L", "LA"):
+        img = img.convert("RGBA")
+    buffer = io.BytesIO()
+    img.save(buffer, image_format, **params)
+    return buffer.getvalue()
+
+
+def process_image(
+    data: bytes,
+    widths: Sequence[int] = (),
+    formats: Sequence[str] = (),
+    extension: Optional[str] = None,
+) -> ProcessedImage:
+    """
+    Valida una imagen y genera sus variantes responsivas: una copia por cada
+    ancho menor que el original en su propia codificación, y una por cada
+    ancho (incluido el original) en cada formato moderno de `formats`.
+
+    Es una función pura sobre bytes para poder ejecutarse fuera del proceso
+    que atiende las peticiones.
+
+    Raises:
+        InvalidImageError: si los bytes no son una imagen válida.
+    """
+    try:
+        Image.open(io.BytesIO(data)).verify()
+        img = Image.open(io.BytesIO(data))
+        img.load()
+    except Exception as e:
+        raise InvalidImageError(str(e)) from e
+
+    processed = ProcessedImage(
+        format=img.format,
+        content_type=Image.MIME.get(img.format, "application/octet-stream"),
+        width=img.width,
+        height=img.height,
+    )
+
+    # Las imágenes animadas se sirven tal cual para no perder fotogramas
+    if getattr(img, "is_animated", False):
+        return processed
+
+    # exif_transpose devuelve una copia sin `format`: se conserva el del original
+    source_format = img.format
+    img = ImageOps.exif_transpose(img)
+    processed.width, processed.height = img.width, img.height
+
+    variant_formats = []
+    for name in formats:
+        spec = VARIANT_FORMATS.get(name)
+        if spec is None or spec["format"] == source_format:
+            continue
+        if not features.check(name):
+            logger.warning(f"Pillow no soporta el formato '{name}'; se omiten sus variantes.")
+            continue
+        variant_formats.append((name, spec))
+
+    target_widths = sorted({w for w in widths if 0 < w < img.width})
+    extension = (extension or f".{source_format.lower()}").lstrip(".")
+
+    for width in target_widths + [img.width]:
+        if width == img.width:
+            resized = img
+        else:
+            height = max(1, round(img.height * width / img.width))
+            resized = img.resize((width, height), Image.Resampling.LANCZOS)
+
+        if width != img.width and source_format in RESIZABLE_FORMATS:
+            processed.variants.append(ImageVariant(
+                width=width,
+                extension=extension,
+                content_type=processed.content_type,
+                data=_encode(resized, source_format, RESIZABLE_FORMATS[source_format]),
+            ))
+
+        for name, spec in variant_formats:
+            processed.variants.append(ImageVariant(
+                width=width,
+                extension=name,
+                content_type=spec["content_type"],
+                data=_encode(resized, spec["format"], spec["params"]),
+            ))
+
+    return processed
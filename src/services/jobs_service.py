@@ -1,18 +1,32 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
-from typing import Optional
+from typing import Optional, Tuple
 
 from src.models.job import Job
 from src.schemas import job as job_schema
 from src.utils import save_image, delete_image
+from src.core.cache import response_cache
+from src.core.pagination import keyset
+from src.core.fields import load_only_fields
 
 
 def get_job(db: Session, job_id: int):
     return db.query(Job).filter(Job.id == job_id).first()
 
 
-def get_jobs(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Job).offset(skip).limit(limit).all()
+def get_jobs(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+):
+    return keyset(db.query(Job).options(*load_only_fields(Job, fields)), Job.id, skip, limit, after).all()
+
+
+def count_jobs(db: Session) -> int:
+    return db.query(func.count(Job.id)).scalar()
 
 
 def create_job(
@@ -24,6 +38,7 @@ def create_job(
 
     db.add(db_job)
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_job)
     return db_job
 
@@ -53,6 +68,7 @@ def update_job(
         db_job.image_route = new_image_route
 
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_job)
     return db_job
 
@@ -69,4 +85,5 @@ def delete_job(db: Session, job_id: int) -> Optional[Job]:
 
     db.delete(db_job)
     db.commit()
+    response_cache.bump_version()
     return db_job
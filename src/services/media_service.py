@@ -0,0 +1,153 @@
+import logging
+import sys
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Iterator, Optional, Sequence, Tuple
+
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session
+
+from src.models.media import Media
+from src.core.cache import LRUByteCache
+from src.core.config import settings
+from src.core.http import accepts_media_type
+from src.core.storage import storage_of
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CachedMedia:
+    content_type: str
+    content_hash: Optional[str]
+    created_at: Optional[datetime]
+    data: bytes
+
+
+@dataclass(frozen=True)
+class MediaCandidate:
+    filename: str
+    content_type: Optional[str]
+    width: Optional[int]
+    size: int
+
+
+# Formatos modernos que solo se sirven si el cliente los anuncia en Accept
+NEGOTIATED_CONTENT_TYPES = {"image/webp", "image/avif"}
+
+# Caché de proceso para las imágenes más solicitadas, indexada por Media.filename.
+# Cada worker de uvicorn mantiene la suya.
+media_cache = LRUByteCache(
+    max_bytes=settings.MEDIA_CACHE_MAX_BYTES,
+    max_item_bytes=settings.MEDIA_CACHE_MAX_ITEM_BYTES,
+)
+# Variantes disponibles por imagen original, acotado por número de imágenes
+VARIANT_INDEX_MAX_ENTRIES = 4096
+variant_index = LRUByteCache(max_items=VARIANT_INDEX_MAX_ENTRIES)
+
+
+def get_media_variants(db: Session, filename: str) -> Tuple[MediaCandidate, ...]:
+    """
+    Devuelve la imagen pedida y sus variantes (solo metadatos).
+    La lista se cachea para que las imágenes frecuentes no consulten la BD.
+    """
+    candidates = variant_index.get(filename)
+    if candidates is not None:
+        return candidates
+
+    rows = (
+        db.query(
+            Media.filename,
+            Media.content_type,
+            Media.width,
+            func.coalesce(Media.size, 0),
+        )
+        .filter(or_(Media.filename == filename, Media.variant_of == filename))
+        .all()
+    )
+    candidates = tuple(MediaCandidate(*row) for row in rows)
+    if candidates:
+        variant_index.set(filename, candidates)
+    return candidates
+
+
+def select_variant(
+    candidates: Sequence[MediaCandidate], width: Optional[int] = None, accept: Optional[str] = None
+) -> MediaCandidate:
+    """
+    Elige la variante a servir: la de menor ancho que cubra `width` (o la
+    mayor si ninguna lo cubre, o la de tamaño original si no se pide ancho)
+    entre los formatos que acepta el cliente y, a igual ancho, la más ligera.
+    """
+    acceptable = [
+        candidate for candidate in candidates
+        if candidate.content_type not in NEGOTIATED_CONTENT_TYPES
+        or accepts_media_type(accept, candidate.content_type)
+    ] or list(candidates)
+
+    def effective_width(candidate: MediaCandidate) -> int:
+        return candidate.width if candidate.width is not None else sys.maxsize
+
+    fitting = [c for c in acceptable if width and effective_width(c) >= width]
+    if fitting:
+        target = min(effective_width(c) for c in fitting)
+    else:
+        target = max(effective_width(c) for c in acceptable)
+
+    return min(
+        (c for c in acceptable if effective_width(c) == target),
+        key=lambda candidate: candidate.size,
+    )
+
+
+def get_media_info(db: Session, filename: str):
+    """
+    Devuelve los metadatos de una imagen (id, backend, tipo, tamaño, hash y
+    fecha de creación) con una consulta que nunca lee la columna binaria.
+    Devuelve None si no existe.
+    """
+    return (
+        db.query(
+            Media.id,
+            Media.filename,
+            Media.storage,
+            Media.content_type,
+            func.coalesce(Media.size, 0).label("size"),
+            Media.content_hash,
+            Media.created_at,
+        )
+        .filter(Media.filename == filename)
+        .first()
+    )
+
+
+def iter_media_chunks(db: Session, media, chunk_size: Optional[int] = None) -> Iterator[bytes]:
+    """
+    Lee el contenido de una imagen en bloques de tamaño fijo desde su backend
+    de almacenamiento, para no cargarla completa en memoria.
+    """
+    return storage_of(media).iter_chunks(db, media, chunk_size or settings.MEDIA_CHUNK_SIZE)
+
+
+def load_cached_media(db: Session, filename: str, media) -> Optional[CachedMedia]:
+    """
+    Lee una imagen completa y la guarda en la caché si su tamaño lo permite.
+    Devuelve None si es demasiado grande y debe transmitirse por bloques.
+    """
+    if not media_cache.accepts(media.size):
+        return None
+
+    cached = CachedMedia(
+        content_type=media.content_type,
+        content_hash=media.content_hash,
+        created_at=media.created_at,
+        data=b"".join(iter_media_chunks(db, media)),
+    )
+    media_cache.set(filename, cached)
+    return cached
+
+
+def invalidate_media(*filenames: str) -> None:
+    for filename in filenames:
+        media_cache.invalidate(filename)
+        variant_index.invalidate(filename)
@@ -0,0 +1,39 @@
+from sqlalchemy.orm import Session
+from fastapi import HTTPException, status
+from typing import Any, Dict, Optional
+
+from src.models.project import Project
+from src.models.technology import Technology
+from src.models.tag import Tag
+from src.models.job import Job
+from src.models.certificate import Certificate
+from src.models.social import Social
+from src.services import i18n_service
+from src.services.projects_service import PROJECT_RESPONSE_OPTIONS
+
+
+def get_portfolio(db: Session, lang: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Reúne todas las colecciones públicas en una sola sesión: una consulta
+    por colección más las dos de las relaciones de los proyectos. Con `lang`
+    se añaden las traducciones de ese idioma.
+    """
+    translations = None
+    if lang is not None:
+        translations = i18n_service.get_translations(lang)
+        if translations is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Language '{lang}' not found.",
+            )
+
+    return {
+        "projects": db.query(Project).options(*PROJECT_RESPONSE_OPTIONS).order_by(Project.id).all(),
+        "technologies": db.query(Technology).order_by(Technology.id).all(),
+        "tags": db.query(Tag).order_by(Tag.id).all(),
+        "jobs": db.query(Job).order_by(Job.id).all(),
+        "certificates": db.query(Certificate).order_by(Certificate.id).all(),
+        "socials": db.query(Social).order_by(Social.id).all(),
+        "lang": lang,
+        "translations": translations,
+    }
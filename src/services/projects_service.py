@@ -1,21 +1,137 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import delete, func, insert, or_, select, update
+from sqlalchemy.orm import Session, selectinload
 from fastapi import UploadFile, HTTPException, status
-from typing import Optional, List
+from typing import Dict, Iterable, Literal, Optional, List, Sequence, Tuple
 
 from src.models.project import Project
 from src.models.technology import Technology
 from src.models.tag import Tag
+from src.models.project_technology import project_technologies
+from src.models.project_tag import project_tags
 from src.schemas import project as project_schema
 
 from src.utils import save_image, delete_image
+from src.services import search_service
+from src.core.cache import response_cache
+from src.core.pagination import keyset
+from src.core.fields import load_only_fields
+from src.core.bulk import BulkErrors, check_files, check_ids, save_bundle
 
-def get_project(db: Session, project_id: int):
+# Relationships serialized by the Project response schema: one extra SELECT
+# each for the whole page of projects, regardless of how many rows it has.
+PROJECT_RESPONSE_OPTIONS = (
+    selectinload(Project.technologies),
+    selectinload(Project.tags),
+)
+
+def get_project(db: Session, project_id: int, fields: Optional[Tuple[str, ...]] = None):
     """Get a single project with its technologies loaded."""
-    return db.query(Project).filter(Project.id == project_id).first()
+    return (
+        db.query(Project)
+        .options(*project_options(fields))
+        .filter(Project.id == project_id)
+        .first()
+    )
+
+def project_options(fields: Optional[Tuple[str, ...]] = None) -> tuple:
+    """
+    Loader options for a (possibly trimmed) Project response: only the
+    requested columns, and only the relationships that will be serialized.
+    """
+    if fields is None:
+        return PROJECT_RESPONSE_OPTIONS
+    return (
+        *load_only_fields(Project, fields),
+        *(selectinload(getattr(Project, name)) for name in ("technologies", "tags") if name in fields),
+    )
+
+def _projects_with(association, column, model, names: Sequence[str], match: str):
+    """
+    Ids of projects linked to the named technologies/tags. The lookup walks the
+    (technology_id|tag_id, project_id) index instead of scanning the projects;
+    with match="all" a project must be linked to every one of the names.
+    """
+    names = set(names)
+    query = (
+        select(association.c.project_id)
+        .join(model, model.id == association.c[column])
+        .where(model.name.in_(names))
+    )
+    if match == "all":
+        query = query.group_by(association.c.project_id).having(
+            func.count(association.c[column]) == len(names)
+        )
+    return query
+
+def filter_projects(
+    query,
+    technologies: Sequence[str] = (),
+    tags: Sequence[str] = (),
+    match: Literal["all", "any"] = "all",
+):
+    """
+    Keep the projects using the given technologies and tags (by name).
+    match="all" requires every listed technology and tag; match="any" at least one of them.
+    """
+    conditions = [
+        Project.id.in_(_projects_with(association, column, model, names, match))
+        for association, column, model, names in (
+            (project_technologies, "technology_id", Technology, technologies),
+            (project_tags, "tag_id", Tag, tags),
+        )
+        if names
+    ]
+    if not conditions:
+        return query
+    if match == "any":
+        return query.filter(or_(*conditions))
+    return query.filter(*conditions)
 
-def get_projects(db: Session, skip: int = 0, limit: int = 100):
-    """Get all projects with their technologies loaded."""
-    return db.query(Project).offset(skip).limit(limit).all()
+def get_projects(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    technologies: Sequence[str] = (),
+    tags: Sequence[str] = (),
+    match: Literal["all", "any"] = "all",
+):
+    """Get all projects with their technologies loaded, optionally filtered by technology and tag."""
+    query = filter_projects(db.query(Project).options(*project_options(fields)), technologies, tags, match)
+    return keyset(query, Project.id, skip, limit, after).all()
+
+def count_projects(
+    db: Session,
+    technologies: Sequence[str] = (),
+    tags: Sequence[str] = (),
+    match: Literal["all", "any"] = "all",
+) -> int:
+    """Count all projects matching the same filters as get_projects."""
+    return filter_projects(db.query(func.count(Project.id)), technologies, tags, match).scalar()
+
+def search_projects(
+    db: Session,
+    q: str,
+    lang: Optional[str] = None,
+    limit: int = 20,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> List[dict]:
+    """Full-text search: ranked projects with their highlighted matches."""
+    hits = search_service.search_projects(db, q, lang=lang, limit=limit)
+    if not hits:
+        return []
+    projects = {
+        project.id: project
+        for project in db.query(Project)
+        .options(*project_options(fields))
+        .filter(Project.id.in_([hit["id"] for hit in hits]))
+    }
+    return [
+        {"project": projects[hit["id"]], "rank": hit["rank"], "highlights": hit["highlights"]}
+        for hit in hits
+        if hit["id"] in projects
+    ]
 
 def validate_technology_ids(db: Session, technology_ids: List[int]) -> List[Technology]:
     """Validate that all technology IDs exist and return the technology objects."""
@@ -77,7 +193,9 @@ def create_project(
     db_project.tags = tags
     
     db.add(db_project)
+    search_service.index_project(db, db_project)
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_project)
     return db_project
 
@@ -122,7 +240,9 @@ def update_project(
         new_image_route = save_image(db, image_file)
         db_project.image_route = new_image_route
     
+    search_service.index_project(db, db_project)
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_project)
     return db_project
 
@@ -138,6 +258,115 @@ def delete_project(db: Session, project_id: int) -> Optional[Project]:
     if db_project.image_route:
         delete_image(db, db_project.image_route)
         
+    search_service.remove_project(db, db_project.id)
     db.delete(db_project)
     db.commit()
+    response_cache.bump_version()
     return db_project
+
+def _check_related_ids(errors: BulkErrors, db: Session, items: Iterable[Tuple[str, int, object]]) -> None:
+    """Every technology and tag id referenced by the batch must exist (one query each)."""
+    items = list(items)
+    for model, attribute in ((Technology, "technology_ids"), (Tag, "tag_ids")):
+        wanted = {id_ for _, _, item in items for id_ in getattr(item, attribute) or ()}
+        found = {id_ for (id_,) in db.query(model.id).filter(model.id.in_(wanted))} if wanted else set()
+        for op, index, item in items:
+            missing = sorted(set(getattr(item, attribute) or ()) - found)
+            if missing:
+                errors.add(op, index, f"Unknown {model.__name__.lower()} ids: {missing}")
+
+def _link(db: Session, project_ids: Sequence[int], items: Sequence, replace: bool = False) -> None:
+    """(Re)write the technology and tag association rows of several projects with executemany."""
+    for association, column, attribute in (
+        (project_technologies, "technology_id", "technology_ids"),
+        (project_tags, "tag_id", "tag_ids"),
+    ):
+        pairs = [
+            (project_id, getattr(item, attribute))
+            for project_id, item in zip(project_ids, items)
+            if getattr(item, attribute) is not None
+        ]
+        if replace and pairs:
+            db.execute(delete(association).where(association.c.project_id.in_([p for p, _ in pairs])))
+        rows = [
+            {"project_id": project_id, column: related_id}
+            for project_id, related_ids in pairs
+            for related_id in dict.fromkeys(related_ids)
+        ]
+        if rows:
+            db.execute(insert(association), rows)
+
+def bulk_projects(
+    db: Session, bulk: project_schema.ProjectBulk, files: Dict[str, UploadFile]
+) -> List[dict]:
+    """
+    Create, update and delete projects in one transaction. Images are
+    referenced by file name within `files` and each file is stored once.
+    Everything is validated first; any error aborts the whole batch.
+    """
+    errors = BulkErrors()
+    check_ids(errors, db, Project, [item.id for item in bulk.update], bulk.delete)
+    _check_related_ids(errors, db, [
+        *(("create", index, item) for index, item in enumerate(bulk.create)),
+        *(("update", index, item) for index, item in enumerate(bulk.update)),
+    ])
+    for op, items in (("create", bulk.create), ("update", bulk.update)):
+        for index, item in enumerate(items):
+            check_files(errors, op, index, item.image, files)
+    errors.raise_if_any()
+
+    try:
+        routes = save_bundle(db, files, [item.image for item in (*bulk.create, *bulk.update)])
+        old_images = dict(
+            db.query(Project.id, Project.image_route).filter(
+                Project.id.in_([*bulk.delete, *(item.id for item in bulk.update if item.image)])
+            )
+        )
+
+        results = []
+        if bulk.delete:
+            for project_id in bulk.delete:
+                delete_image(db, old_images[project_id], commit=False)
+            for association in (project_technologies, project_tags):
+                db.execute(delete(association).where(association.c.project_id.in_(bulk.delete)))
+            search_service.remove_projects(db, bulk.delete)
+            db.execute(delete(Project).where(Project.id.in_(bulk.delete)))
+            results += [{"op": "delete", "index": i, "id": id_} for i, id_ in enumerate(bulk.delete)]
+
+        changes = []
+        for item in bulk.update:
+            # image_route solo cambia a través de `image`, que lleva la cuenta de referencias
+            values = item.model_dump(exclude_none=True, exclude={"technology_ids", "tag_ids", "image", "image_route"})
+            if item.image:
+                delete_image(db, old_images[item.id], commit=False)
+                values["image_route"] = routes[item.image]
+            if len(values) > 1:
+                changes.append(values)
+        if changes:
+            db.execute(update(Project), changes)
+        updated = [item.id for item in bulk.update]
+        _link(db, updated, bulk.update, replace=True)
+        results += [{"op": "update", "index": i, "id": id_} for i, id_ in enumerate(updated)]
+
+        created = []
+        if bulk.create:
+            created = db.scalars(
+                insert(Project).returning(Project.id, sort_by_parameter_order=True),
+                [
+                    {
+                        **item.model_dump(exclude={"technology_ids", "tag_ids", "image"}),
+                        "image_route": routes[item.image],
+                    }
+                    for item in bulk.create
+                ],
+            ).all()
+            _link(db, created, bulk.create)
+            results += [{"op": "create", "index": i, "id": id_} for i, id_ in enumerate(created)]
+
+        search_service.index_projects(db, [*updated, *created])
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    response_cache.bump_version()
+    return results
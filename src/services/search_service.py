@@ -0,0 +1,152 @@
+import html
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.orm import Session
+
+from src.models.project import Project
+from src.models.project_search import FTS_TABLE, SEARCH_CONFIGS
+
+# Marcadores que el motor pone alrededor de cada coincidencia; el texto se
+# escapa como HTML y luego se sustituyen por <mark>, así los highlights son seguros.
+MARK_START, MARK_END = "\x02", "\x03"
+MAX_TERMS = 16
+
+
+def _dialect(db: Session) -> str:
+    return db.get_bind().dialect.name
+
+
+def search_terms(q: str) -> List[str]:
+    """Palabras de la búsqueda; se descarta la sintaxis propia de FTS5/tsquery."""
+    return re.findall(r"\w+", q.lower())[:MAX_TERMS]
+
+
+def highlight(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return html.escape(value).replace(MARK_START, "<mark>").replace(MARK_END, "</mark>")
+
+
+def index_project(db: Session, project: Project) -> None:
+    """Añade o actualiza un proyecto en el índice FTS5 (en PostgreSQL las columnas son generadas)."""
+    if _dialect(db) != "sqlite":
+        return
+    db.flush()
+    remove_project(db, project.id)
+    db.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description_en, description_es) "
+            "VALUES (:id, :title, :description_en, :description_es)"
+        ),
+        {
+            "id": project.id,
+            "title": project.title,
+            "description_en": project.description_en,
+            "description_es": project.description_es,
+        },
+    )
+
+
+def remove_project(db: Session, project_id: int) -> None:
+    if _dialect(db) != "sqlite":
+        return
+    db.execute(text(f"DELETE FROM {FTS_TABLE} WHERE rowid = :id"), {"id": project_id})
+
+
+def index_projects(db: Session, project_ids: Sequence[int]) -> None:
+    """Reindexa varios proyectos leyendo sus filas (p. ej. tras una escritura en lote)."""
+    if _dialect(db) != "sqlite" or not project_ids:
+        return
+    db.flush()
+    remove_projects(db, project_ids)
+    db.execute(
+        text(
+            f"INSERT INTO {FTS_TABLE} (rowid, title, description_en, description_es) "
+            "SELECT id, title, description_en, description_es FROM projects WHERE id IN :ids"
+        ).bindparams(bindparam("ids", expanding=True)),
+        {"ids": list(project_ids)},
+    )
+
+
+def remove_projects(db: Session, project_ids: Sequence[int]) -> None:
+    if _dialect(db) != "sqlite" or not project_ids:
+        return
+    db.execute(
+        text(f"DELETE FROM {FTS_TABLE} WHERE rowid IN :ids").bindparams(bindparam("ids", expanding=True)),
+        {"ids": list(project_ids)},
+    )
+
+
+def _search_sqlite(db: Session, terms: List[str], lang: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    match = " ".join(f'"{term}"*' for term in terms)
+    columns = ["description_en", "description_es"] if lang is None else [f"description_{lang}"]
+    if lang is not None:
+        match = f"{{title {' '.join(columns)}}} : ({match})"
+    snippets = ", ".join(
+        f"snippet({FTS_TABLE}, {index}, :start, :end, '…', 24) AS {column}"
+        for index, column in enumerate(["title", "description_en", "description_es"])
+        if column == "title" or column in columns
+    )
+    rows = db.execute(
+        text(
+            f"SELECT rowid AS id, -bm25({FTS_TABLE}, 5.0, 1.0, 1.0) AS rank, {snippets} "
+            f"FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH :match "
+            "ORDER BY rank DESC, rowid LIMIT :limit"
+        ),
+        {"match": match, "start": MARK_START, "end": MARK_END, "limit": limit},
+    ).mappings()
+    return [dict(row) for row in rows]
+
+
+def _search_postgres(db: Session, terms: List[str], lang: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    languages = list(SEARCH_CONFIGS) if lang is None else [lang]
+    tsquery = " & ".join(f"{term}:*" for term in terms)
+    queries = ", ".join(f"to_tsquery('{SEARCH_CONFIGS[code]}', :tsquery) AS q_{code}" for code in languages)
+    matches = " OR ".join(f"p.search_{code} @@ q_{code}" for code in languages)
+    rank = " + ".join(f"ts_rank_cd(p.search_{code}, q_{code})" for code in languages)
+    title_lang = languages[0]
+    options = f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=24, MinWords=8"
+    headlines = ", ".join(
+        [f"ts_headline('{SEARCH_CONFIGS[title_lang]}', p.title, q_{title_lang}, :options) AS title"]
+        + [
+            f"ts_headline('{SEARCH_CONFIGS[code]}', p.description_{code}, q_{code}, :options) AS description_{code}"
+            for code in languages
+        ]
+    )
+    # Los headlines son caros: se calculan solo para las filas de la página
+    rows = db.execute(
+        text(
+            f"SELECT ranked.id, ranked.rank, {headlines} FROM ("
+            f"  SELECT p.id, {rank} AS rank FROM projects p, {queries}"
+            f"  WHERE {matches} ORDER BY rank DESC, p.id LIMIT :limit"
+            f") ranked JOIN projects p ON p.id = ranked.id, {queries} "
+            "ORDER BY ranked.rank DESC, ranked.id"
+        ),
+        {"tsquery": tsquery, "options": options, "limit": limit},
+    ).mappings()
+    return [dict(row) for row in rows]
+
+
+def search_projects(db: Session, q: str, lang: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Busca en el título y las descripciones (en `lang`, o en todos los
+    idiomas). Devuelve `id`, `rank` y los fragmentos coincidentes resaltados
+    con <mark>, de mayor a menor relevancia.
+    """
+    terms = search_terms(q)
+    if not terms:
+        return []
+    if _dialect(db) == "postgresql":
+        rows = _search_postgres(db, terms, lang, limit)
+    else:
+        rows = _search_sqlite(db, terms, lang, limit)
+    return [
+        {
+            "id": row["id"],
+            "rank": float(row["rank"]),
+            "highlights": {key: highlight(value) for key, value in row.items() if key not in ("id", "rank")},
+        }
+        for row in rows
+    ]
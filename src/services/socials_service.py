@@ -1,10 +1,14 @@
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 from fastapi import UploadFile
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from src.models.social import Social
 from src.schemas import social as social_schema
 from src.utils import save_image, delete_image
+from src.core.cache import response_cache
+from src.core.pagination import keyset
+from src.core.fields import load_only_fields
 
 
 def get_social(db: Session, social_id: int) -> Optional[Social]:
@@ -12,9 +16,20 @@ def get_social(db: Session, social_id: int) -> Optional[Social]:
     return db.query(Social).filter(Social.id == social_id).first()
 
 
-def get_socials(db: Session, skip: int = 0, limit: int = 100) -> List[Social]:
+def get_socials(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+) -> List[Social]:
     """Get all social profiles."""
-    return db.query(Social).offset(skip).limit(limit).all()
+    return keyset(db.query(Social).options(*load_only_fields(Social, fields)), Social.id, skip, limit, after).all()
+
+
+def count_socials(db: Session) -> int:
+    """Count all social profiles."""
+    return db.query(func.count(Social.id)).scalar()
 
 
 def create_social(
@@ -29,6 +44,7 @@ def create_social(
 
     db.add(db_social)
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_social)
     return db_social
 
@@ -60,6 +76,7 @@ def update_social(
         db_social.image_route = new_image_route
 
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_social)
     return db_social
 
@@ -75,4 +92,5 @@ def delete_social(db: Session, social_id: int) -> Optional[Social]:
 
     db.delete(db_social)
     db.commit()
+    response_cache.bump_version()
     return db_social
\ No newline at end of file
@@ -1,21 +1,42 @@
+from sqlalchemy import delete, func, insert, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError
 from fastapi import HTTPException, status
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from src.models.tag import Tag
+from src.models.project_tag import project_tags
 from src.schemas import tag as tag_schema
+from src.core.bulk import BulkErrors, check_ids, check_unique_names
+from src.core.cache import response_cache
+from src.core.pagination import keyset
+from src.core.fields import load_only_fields
+from src.core.facets import with_project_counts
 
 def get_tag(db: Session, tag_id: int):
     return db.query(Tag).filter(Tag.id == tag_id).first()
 
-def get_tags(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Tag).offset(skip).limit(limit).all()
+def get_tags(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    with_counts: bool = False,
+):
+    query = db.query(Tag).options(*load_only_fields(Tag, fields))
+    if with_counts:
+        query = with_project_counts(query, Tag, project_tags, "tag_id")
+    return keyset(query, Tag.id, skip, limit, after).all()
+
+def count_tags(db: Session) -> int:
+    return db.query(func.count(Tag.id)).scalar()
 
 def create_tag(db: Session, tag: tag_schema.TagCreate) -> Tag:
     db_tag = Tag(**tag.model_dump())
     db.add(db_tag)
     try:
         db.commit()
+        response_cache.bump_version()
         db.refresh(db_tag)
         return db_tag
     except IntegrityError:
@@ -35,6 +56,7 @@ def update_tag(db: Session, tag_id: int, tag_data: tag_schema.TagUpdate) -> Opti
         setattr(db_tag, key, value)
 
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_tag)
     return db_tag
 
@@ -44,4 +66,50 @@ def delete_tag(db: Session, tag_id: int) -> Optional[Tag]:
         return None
     db.delete(db_tag)
     db.commit()
+    response_cache.bump_version()
     return db_tag
+
+def bulk_tags(db: Session, bulk: tag_schema.TagBulk) -> List[dict]:
+    """
+    Creates, renames and deletes tags in one transaction. Everything is
+    validated first; any error aborts the whole batch with per-item details.
+    """
+    errors = BulkErrors()
+    check_ids(errors, db, Tag, [item.id for item in bulk.update], bulk.delete)
+    check_unique_names(
+        errors, db, Tag,
+        [item.name for item in bulk.create],
+        [(index, item.id, item.name) for index, item in enumerate(bulk.update)],
+        bulk.delete,
+    )
+    errors.raise_if_any()
+
+    try:
+        results = []
+        if bulk.delete:
+            db.execute(delete(project_tags).where(project_tags.c.tag_id.in_(bulk.delete)))
+            db.execute(delete(Tag).where(Tag.id.in_(bulk.delete)))
+            results += [{"op": "delete", "index": i, "id": id_} for i, id_ in enumerate(bulk.delete)]
+        renames = [{"id": item.id, "name": item.name} for item in bulk.update if item.name is not None]
+        if renames:
+            db.execute(update(Tag), renames)
+        results += [{"op": "update", "index": i, "id": item.id} for i, item in enumerate(bulk.update)]
+        if bulk.create:
+            ids = db.scalars(
+                insert(Tag).returning(Tag.id, sort_by_parameter_order=True),
+                [item.model_dump() for item in bulk.create],
+            ).all()
+            results += [{"op": "create", "index": i, "id": id_} for i, id_ in enumerate(ids)]
+        db.commit()
+    except IntegrityError:
+        # Otra petición usó el mismo nombre entretanto
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Tag with this name already exists"
+        )
+    except Exception:
+        db.rollback()
+        raise
+    response_cache.bump_version()
+    return results
@@ -1,18 +1,40 @@
+from sqlalchemy import delete, func, insert, update
 from sqlalchemy.orm import Session
-from fastapi import UploadFile
-from typing import Optional
+from sqlalchemy.exc import IntegrityError
+from fastapi import HTTPException, UploadFile, status
+from typing import Dict, List, Optional, Tuple
 
 from src.models.technology import Technology
+from src.models.project_technology import project_technologies
 from src.schemas import technology as technology_schema
 
 from src.utils import save_image, delete_image
+from src.core.cache import response_cache
+from src.core.pagination import keyset
+from src.core.fields import load_only_fields
+from src.core.facets import with_project_counts
+from src.core.bulk import BulkErrors, check_files, check_ids, check_unique_names, save_bundle
 
 def get_technology(db: Session, technology_id: int):
     return db.query(Technology).filter(Technology.id == technology_id).first()
 
 
-def get_technologies(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(Technology).offset(skip).limit(limit).all()
+def get_technologies(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[int] = None,
+    fields: Optional[Tuple[str, ...]] = None,
+    with_counts: bool = False,
+):
+    query = db.query(Technology).options(*load_only_fields(Technology, fields))
+    if with_counts:
+        query = with_project_counts(query, Technology, project_technologies, "technology_id")
+    return keyset(query, Technology.id, skip, limit, after).all()
+
+
+def count_technologies(db: Session) -> int:
+    return db.query(func.count(Technology.id)).scalar()
 
 
 def create_technology(
@@ -33,6 +55,7 @@ def create_technology(
     # Guardar en la base de datos
     db.add(db_technology)
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_technology)
     return db_technology
 
@@ -67,6 +90,7 @@ def update_technology(
         db_technology.icon = new_image_route
 
     db.commit()
+    response_cache.bump_version()
     db.refresh(db_technology)
     return db_technology
 
@@ -85,4 +109,76 @@ def delete_technology(db: Session, technology_id: int) -> Optional[Technology]:
     # Borrar el registro de la base de datos
     db.delete(db_technology)
     db.commit()
+    response_cache.bump_version()
     return db_technology
+
+
+def bulk_technologies(
+    db: Session, bulk: technology_schema.TechnologyBulk, files: Dict[str, UploadFile]
+) -> List[dict]:
+    """
+    Crea, actualiza y elimina tecnologías en una sola transacción. Los iconos
+    se referencian por nombre de archivo dentro de `files`; cada archivo se
+    procesa una sola vez aunque lo usen varias tecnologías. Todo se valida
+    antes de escribir: cualquier error cancela el lote completo.
+    """
+    errors = BulkErrors()
+    check_ids(errors, db, Technology, [item.id for item in bulk.update], bulk.delete)
+    check_unique_names(
+        errors, db, Technology,
+        [item.name for item in bulk.create],
+        [(index, item.id, item.name) for index, item in enumerate(bulk.update)],
+        bulk.delete,
+    )
+    for op, items in (("create", bulk.create), ("update", bulk.update)):
+        for index, item in enumerate(items):
+            check_files(errors, op, index, item.icon, files)
+    errors.raise_if_any()
+
+    try:
+        routes = save_bundle(db, files, [item.icon for item in (*bulk.create, *bulk.update)])
+        old_icons = dict(
+            db.query(Technology.id, Technology.icon).filter(
+                Technology.id.in_([*bulk.delete, *(item.id for item in bulk.update if item.icon)])
+            )
+        )
+
+        results = []
+        if bulk.delete:
+            for id_ in bulk.delete:
+                delete_image(db, old_icons[id_], commit=False)
+            db.execute(delete(project_technologies).where(project_technologies.c.technology_id.in_(bulk.delete)))
+            db.execute(delete(Technology).where(Technology.id.in_(bulk.delete)))
+            results += [{"op": "delete", "index": i, "id": id_} for i, id_ in enumerate(bulk.delete)]
+
+        changes = []
+        for item in bulk.update:
+            values = item.model_dump(exclude_none=True)
+            if item.icon:
+                delete_image(db, old_icons[item.id], commit=False)
+                values["icon"] = routes[item.icon]
+            if len(values) > 1:
+                changes.append(values)
+        if changes:
+            db.execute(update(Technology), changes)
+        results += [{"op": "update", "index": i, "id": item.id} for i, item in enumerate(bulk.update)]
+
+        if bulk.create:
+            ids = db.scalars(
+                insert(Technology).returning(Technology.id, sort_by_parameter_order=True),
+                [{"name": item.name, "icon": routes[item.icon]} for item in bulk.create],
+            ).all()
+            results += [{"op": "create", "index": i, "id": id_} for i, id_ in enumerate(ids)]
+        db.commit()
+    except IntegrityError:
+        # Otra petición usó el mismo nombre entretanto
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Technology with this name already exists",
+        )
+    except Exception:
+        db.rollback()
+        raise
+    response_cache.bump_version()
+    return results
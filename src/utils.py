@@ -1,15 +1,29 @@
 import os
 import logging
-import uuid
+import hashlib
+from collections import Counter, defaultdict
+from datetime import datetime, timezone
+from typing import List, Optional
 
+from sqlalchemy import event, func, or_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from src.database import SessionLocal
 from src.models.user import User
 from src.models.media import Media
+from src.models.project import Project
+from src.models.certificate import Certificate
+from src.models.job import Job
+from src.models.social import Social
+from src.models.technology import Technology
+from src.services.media_service import invalidate_media
+from src.services.images_service import process_image, InvalidImageError
+from src.core.workers import image_workers, WorkerPoolBrokenError, WorkerPoolBusyError
+from src.core.storage import DatabaseStorage, MediaStorage, get_storage, storage_of
+from src.core.cache import response_cache
 from src.core.config import settings, SRC_DIR
 from src.core.security import get_password_hash
 from fastapi import UploadFile, HTTPException
-from PIL import Image
 
 logger = logging.getLogger(__name__)
 
@@ -52,52 +66,267 @@ def create_admin_user_on_startup():
         db.close()
 
 
-def save_image(db: Session, file: UploadFile) -> str:
+def backfill_media_metadata():
+    """
+    Calcula el hash y el tamaño de las imágenes guardadas antes de que
+    existieran esas columnas. Se llama desde el evento 'lifespan' en main.py.
+    """
+    db: Session = SessionLocal()
 
-    # 2. Validar que el archivo es una imagen usando Pillow
     try:
-        img = Image.open(file.file)
-        img.verify()  # Intenta verificar la integridad de la imagen
-        # Volver al inicio del archivo después de verificar
-        file.file.seek(0)
-    except Exception as e:
+        pending_ids = [
+            media_id for (media_id,) in db.query(Media.id).filter(Media.content_hash.is_(None))
+        ]
+        # Se procesa una imagen a la vez para no cargar todos los BLOBs en memoria
+        for media_id in pending_ids:
+            media = db.get(Media, media_id)
+            data = media.data or b""
+            media.content_hash = hashlib.sha256(data).hexdigest()
+            media.size = len(data)
+            if media.created_at is None:
+                media.created_at = datetime.now(timezone.utc)
+            db.commit()
+            db.expunge(media)
+        if pending_ids:
+            logger.info(f"Metadatos calculados para {len(pending_ids)} imágenes existentes.")
+    finally:
+        db.close()
+
+
+def _store_media(
+    db: Session, storage: MediaStorage, filename: str, content_type: str, data: bytes, **extra
+) -> Media:
+    media = Media(
+        filename=filename,
+        content_type=content_type,
+        storage=storage.name,
+        content_hash=hashlib.sha256(data).hexdigest(),
+        size=len(data),
+        **extra,
+    )
+    storage.write(media, data)
+    _track_written(db, storage, filename)
+    db.add(media)
+    return media
+
+
+def _track_written(db: Session, storage: MediaStorage, filename: str) -> None:
+    # Archivo escrito antes del commit: si la transacción no se confirma, se borra
+    if not isinstance(storage, DatabaseStorage):
+        db.info.setdefault("written_files", []).append((storage.name, filename))
+
+
+def _remove_unreferenced(db: Session, storage: MediaStorage, filenames: List[str]) -> None:
+    """
+    Borra los bytes de `filenames` en `storage` salvo los que alguna fila de
+    `media` sigue guardando ahí: los nombres dependen del contenido, así que
+    otra petición puede haber vuelto a subir la misma imagen entretanto. La
+    comprobación usa una sesión aparte porque se llama desde los eventos de
+    fin de transacción, donde la propia sesión no puede ejecutar SQL.
+    """
+    if isinstance(storage, DatabaseStorage) or not filenames:
+        return
+    with Session(bind=db.get_bind()) as check:
+        kept = {
+            filename
+            for (filename,) in check.query(Media.filename).filter(
+                Media.filename.in_(filenames),
+                func.coalesce(Media.storage, DatabaseStorage.name) == storage.name,
+            )
+        }
+    storage.remove([filename for filename in filenames if filename not in kept])
+
+
+def _commit(db: Session, commit: bool) -> None:
+    # Las operaciones en lote confirman una sola vez al final; mientras tanto basta con flush
+    if commit:
+        db.commit()
+    else:
+        db.flush()
+
+
+@event.listens_for(Session, "after_commit")
+def _run_after_commit(session: Session) -> None:
+    session.info.pop("written_files", None)
+    for action in session.info.pop("after_commit", []):
+        action()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_after_commit(session: Session) -> None:
+    session.info.pop("after_commit", None)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_written_files(session: Session, transaction) -> None:
+    # Rollback o sesión cerrada sin commit: los archivos escritos quedarían huérfanos
+    written = session.info.pop("written_files", None) if transaction.parent is None else None
+    if written:
+        by_storage = defaultdict(list)
+        for storage, filename in written:
+            by_storage[storage].append(filename)
+        for storage, filenames in by_storage.items():
+            _remove_unreferenced(session, get_storage(storage), filenames)
+
+
+def _remove_media_rows(db: Session, filenames: List[str], commit: bool = True) -> None:
+    """Borra filas de `media` y, tras confirmar, los bytes en su backend."""
+    by_storage = defaultdict(list)
+    for filename, storage in db.query(Media.filename, Media.storage).filter(
+        Media.filename.in_(filenames)
+    ):
+        by_storage[storage].append(filename)
+    db.query(Media).filter(Media.filename.in_(filenames)).delete(synchronize_session=False)
+
+    def remove_bytes():
+        for storage, names in by_storage.items():
+            _remove_unreferenced(db, get_storage(storage or "database"), names)
+        invalidate_media(*filenames)
+
+    if commit:
+        db.commit()
+        remove_bytes()
+    else:
+        # Si la transacción en lote se deshace, los bytes siguen siendo necesarios
+        db.flush()
+        db.info.setdefault("after_commit", []).append(remove_bytes)
+
+
+def image_route_for(filename: str) -> str:
+    return f"/static/images/{filename}"
+
+
+def _find_original_by_hash(db: Session, content_hash: str) -> Optional[str]:
+    row = (
+        db.query(Media.filename)
+        .filter(Media.content_hash == content_hash, Media.variant_of.is_(None))
+        .first()
+    )
+    return row[0] if row else None
+
+
+def _add_reference(db: Session, filename: str, count: int = 1) -> None:
+    db.query(Media).filter(Media.filename == filename).update(
+        {Media.ref_count: func.coalesce(Media.ref_count, 1) + count},
+        synchronize_session=False,
+    )
+
+
+def save_image(db: Session, file: UploadFile, commit: bool = True, references: int = 1) -> str:
+    """
+    Guarda una imagen con direccionamiento por contenido: si ya existe una
+    imagen con el mismo hash SHA-256 solo se incrementa su contador de
+    referencias y se devuelve su ruta, sin volver a procesarla ni guardarla.
+    Con `commit=False` deja los cambios en la transacción en curso;
+    `references` es el número de elementos que van a usar la imagen.
+    """
+    data = file.file.read()
+    content_hash = hashlib.sha256(data).hexdigest()
+
+    # 1. Reutilizar la imagen si el contenido ya está almacenado
+    existing = _find_original_by_hash(db, content_hash)
+    if existing:
+        _add_reference(db, existing, references)
+        _commit(db, commit)
+        logger.info(f"Imagen duplicada; se reutiliza '{existing}'")
+        return image_route_for(existing)
+
+    # 2. Validar que el archivo es una imagen y generar sus variantes responsivas
+    #    (trabajo CPU-bound que se ejecuta en el pool de procesos)
+    file_extension = os.path.splitext(file.filename)[1]
+    try:
+        processed = image_workers.run(
+            process_image,
+            data,
+            widths=settings.MEDIA_VARIANT_WIDTHS,
+            formats=settings.MEDIA_VARIANT_FORMATS,
+            extension=file_extension,
+        )
+    except InvalidImageError as e:
         logger.error(f"Error al validar la imagen: {e}")
         raise HTTPException(
             status_code=400, detail="El archivo proporcionado no es una imagen válida."
         )
+    except WorkerPoolBusyError:
+        logger.warning("Cola de procesamiento de imágenes llena; se rechaza la subida.")
+        raise HTTPException(
+            status_code=503,
+            detail="El servidor está procesando otras imágenes. Inténtalo de nuevo.",
+            headers={"Retry-After": "1"},
+        )
+    except WorkerPoolBrokenError as e:
+        # El siguiente intento usa un pool nuevo
+        logger.error(f"El pool de procesamiento de imágenes falló: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail="El procesamiento de imágenes no está disponible. Inténtalo de nuevo.",
+            headers={"Retry-After": "1"},
+        )
 
-    # 3. Generar un nombre de archivo único para evitar colisiones
-    file_extension = os.path.splitext(file.filename)[1]
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
+    # 3. El nombre del archivo es el hash del contenido
+    unique_filename = f"{content_hash}{file_extension}"
 
-    # 4. Guardar el archivo en la Base de Datos
+    # 4. Guardar el original y sus variantes en el backend configurado
+    storage = get_storage()
     try:
-        new_image = Media(
-            filename=unique_filename,
-            content_type=file.content_type,
-            data=file.file.read()
+        _store_media(
+            db,
+            storage,
+            unique_filename,
+            file.content_type or processed.content_type,
+            data,
+            width=processed.width,
+            ref_count=references,
         )
-        db.add(new_image)
+        for variant in processed.variants:
+            _store_media(
+                db,
+                storage,
+                f"{content_hash}_w{variant.width}.{variant.extension}",
+                variant.content_type,
+                variant.data,
+                width=variant.width,
+                variant_of=unique_filename,
+            )
+        _commit(db, commit)
+        invalidate_media(unique_filename)
+    except IntegrityError:
+        # Otra petición guardó el mismo contenido a la vez: se reutiliza el suyo
+        db.rollback()
+        if not commit:
+            # El rollback también deshizo el resto del lote: no se puede continuar
+            raise HTTPException(
+                status_code=409,
+                detail="Otra petición guardó la misma imagen a la vez. Inténtalo de nuevo.",
+            )
+        existing = _find_original_by_hash(db, content_hash)
+        if not existing:
+            raise HTTPException(status_code=500, detail="No se pudo guardar la imagen.")
+        _add_reference(db, existing)
         db.commit()
-        db.refresh(new_image)
+        return image_route_for(existing)
     except Exception as e:
+        db.rollback()
         logger.error(f"No se pudo guardar la imagen en la BD: {e}")
         raise HTTPException(
             status_code=500, detail="No se pudo guardar la imagen."
         )
 
     # 5. Devolver la ruta pública
-    public_url_path = f"/static/images/{unique_filename}"
+    public_url_path = image_route_for(unique_filename)
     logger.info(
-        f"Imagen '{unique_filename}' guardada exitosamente en '{public_url_path}'"
+        f"Imagen '{unique_filename}' guardada exitosamente en '{public_url_path}' "
+        f"con {len(processed.variants)} variantes"
     )
 
     return public_url_path
 
 
-def delete_image(db: Session, image_route: str) -> None:
+def delete_image(db: Session, image_route: str, commit: bool = True) -> None:
     """
-    Elimina una imagen de la base de datos.
+    Libera una referencia a una imagen. Los datos (original y variantes) solo
+    se eliminan de la base de datos cuando desaparece la última referencia.
+    Con `commit=False` deja los cambios en la transacción en curso.
     """
     if not image_route.startswith("/static/images/"):
         logger.warning(
@@ -106,12 +335,126 @@ def delete_image(db: Session, image_route: str) -> None:
         return
 
     filename = image_route.split("/")[-1]
-    
-    media = db.query(Media).filter(Media.filename == filename).first()
-    
-    if media:
-        db.delete(media)
-        db.commit()
-        logger.info(f"Imagen '{filename}' eliminada de la BD exitosamente.")
+
+    # Si quedan otras referencias solo se decrementa el contador
+    released = db.query(Media).filter(
+        Media.filename == filename, Media.ref_count > 1
+    ).update({Media.ref_count: Media.ref_count - 1}, synchronize_session=False)
+    if released:
+        _commit(db, commit)
+        logger.info(f"Referencia a la imagen '{filename}' liberada.")
+        return
+
+    # Solo se consultan los nombres: no hace falta leer los BLOBs para borrarlos
+    filenames = [
+        name for (name,) in db.query(Media.filename).filter(
+            or_(Media.filename == filename, Media.variant_of == filename)
+        )
+    ]
+
+    if filename in filenames:
+        _remove_media_rows(db, filenames, commit)
+        logger.info(f"Imagen '{filename}' y sus variantes eliminadas de la BD exitosamente.")
     else:
         logger.warning(f"Se intentó eliminar una imagen que no existe en BD: {filename}")
+
+
+# Columnas de los modelos que guardan rutas de imágenes
+IMAGE_REFERENCES = [
+    (Project, Project.image_route),
+    (Certificate, Certificate.image_route),
+    (Job, Job.image_route),
+    (Social, Social.image_route),
+    (Technology, Technology.icon),
+]
+
+
+def deduplicate_media(db: Session) -> dict:
+    """
+    Migración única: fusiona las imágenes con el mismo contenido en un solo
+    registro, reescribe las rutas que apuntaban a los duplicados y recalcula
+    los contadores de referencias. Requiere que `content_hash` esté calculado
+    (ver `backfill_media_metadata`).
+    """
+    duplicated_hashes = [
+        content_hash for (content_hash,) in db.query(Media.content_hash)
+        .filter(Media.variant_of.is_(None), Media.content_hash.isnot(None))
+        .group_by(Media.content_hash)
+        .having(func.count(Media.id) > 1)
+    ]
+
+    removed = []
+    for content_hash in duplicated_hashes:
+        canonical, *duplicates = [
+            name for (name,) in db.query(Media.filename)
+            .filter(Media.content_hash == content_hash, Media.variant_of.is_(None))
+            .order_by(Media.id)
+        ]
+        for duplicate in duplicates:
+            for model, column in IMAGE_REFERENCES:
+                db.query(model).filter(column == image_route_for(duplicate)).update(
+                    {column: image_route_for(canonical)}, synchronize_session=False
+                )
+            removed.extend(
+                name for (name,) in db.query(Media.filename).filter(
+                    or_(Media.filename == duplicate, Media.variant_of == duplicate)
+                )
+            )
+    if removed:
+        _remove_media_rows(db, removed)
+
+    # Recalcular los contadores a partir de las referencias reales
+    references = Counter()
+    for model, column in IMAGE_REFERENCES:
+        for (route,) in db.query(column).filter(column.like("/static/images/%")):
+            references[route.split("/")[-1]] += 1
+    orphans = 0
+    for (filename,) in db.query(Media.filename).filter(Media.variant_of.is_(None)):
+        if references[filename]:
+            db.query(Media).filter(Media.filename == filename).update(
+                {Media.ref_count: references[filename]}, synchronize_session=False
+            )
+        else:
+            orphans += 1
+
+    db.commit()
+    # Las rutas de imagen de los listados cambiaron
+    response_cache.bump_version()
+    result = {
+        "duplicate_groups": len(duplicated_hashes),
+        "removed_rows": len(removed),
+        "orphans": orphans,
+    }
+    logger.info(f"Deduplicación de imágenes completada: {result}")
+    return result
+
+
+def migrate_media_storage(db: Session, target: str) -> int:
+    """
+    Mueve los bytes de todas las imágenes al backend `target`, una a una para
+    no cargar más de un BLOB en memoria. Cada imagen se confirma por separado,
+    así que la migración puede interrumpirse y reanudarse.
+    Devuelve el número de imágenes movidas.
+    """
+    target_storage = get_storage(target)
+    pending = db.query(
+        Media.id,
+        Media.filename,
+        Media.storage,
+        func.coalesce(Media.size, 0).label("size"),
+    ).filter(func.coalesce(Media.storage, "database") != target_storage.name).all()
+
+    for row in pending:
+        source = storage_of(row)
+        data = b"".join(source.iter_chunks(db, row, settings.MEDIA_CHUNK_SIZE))
+        media = db.get(Media, row.id)
+        target_storage.write(media, data)
+        _track_written(db, target_storage, row.filename)
+        media.storage = target_storage.name
+        db.commit()
+        _remove_unreferenced(db, source, [row.filename])
+        # Liberar los bytes cargados antes de pasar a la siguiente imagen
+        db.expire(media)
+
+    logger.info(f"{len(pending)} imágenes movidas al almacenamiento '{target_storage.name}'.")
+    return len(pending)
@@ -1,14 +1,17 @@
 import pytest
-from typing import Generator, Callable
+from typing import Generator, Callable, List
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from src.database import Base
 from src.main import app
-from src.dependencies import get_db
+from src.dependencies import get_db, get_read_db
 from src.core.config import settings, SRC_DIR
+from src.core.cache import response_cache
 from src.core.security import create_access_token, get_password_hash
 from src.models.user import User
+from src.services import media_service, i18n_service
+from src.core.translations import TranslationStore
 import os
 import shutil
 import io
@@ -50,6 +53,7 @@ def client(db_session: Generator) -> Generator:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
     
     test_images_dir = SRC_DIR / "static" / "images"
     if test_images_dir.exists():
@@ -61,6 +65,40 @@ def client(db_session: Generator) -> Generator:
     
     app.dependency_overrides.clear()
 
+# --- Fixture para registrar las sentencias SQL ejecutadas ---
+@pytest.fixture(scope="function")
+def captured_sql() -> Generator[List[str], None, None]:
+    """Devuelve una lista que acumula cada sentencia SQL ejecutada durante la prueba."""
+    statements: List[str] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    yield statements
+    event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+# --- Las cachés de proceso no deben compartir estado entre pruebas ---
+@pytest.fixture(autouse=True)
+def clear_caches():
+    media_service.media_cache.clear()
+    media_service.variant_index.clear()
+    response_cache.clear()
+    yield
+    media_service.media_cache.clear()
+    media_service.variant_index.clear()
+    response_cache.clear()
+
+# --- Los archivos de idioma se copian a un directorio temporal por prueba ---
+@pytest.fixture(autouse=True)
+def i18n_store(tmp_path_factory, monkeypatch) -> TranslationStore:
+    directory = tmp_path_factory.mktemp("i18n")
+    for path in (SRC_DIR / "i18n").glob("*.json"):
+        shutil.copy(path, directory)
+    store = TranslationStore(directory, on_change=response_cache.bump_version)
+    monkeypatch.setattr(i18n_service, "store", store)
+    return store
+
 # --- Fixture para obtener un Token de Autenticación de Administrador ---
 @pytest.fixture(scope="function")
 def admin_user(db_session: Session) -> User:
@@ -85,9 +123,9 @@ def admin_auth_headers(admin_user: User) -> dict[str, str]:
 @pytest.fixture(scope="function")
 def create_test_image() -> Callable:
     """Returns a function to create a dummy image file for uploads."""
-    def _create_image(filename: str = "test.jpg"):
+    def _create_image(filename: str = "test.jpg", color: str = "red"):
         file = io.BytesIO()
-        image = Image.new('RGB', (100, 100), 'red')
+        image = Image.new('RGB', (100, 100), color)
         image.save(file, 'jpeg')
         file.seek(0)
         return (filename, file, 'image/jpeg')
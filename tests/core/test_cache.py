@@ -0,0 +1,123 @@
+# tests/core/test_cache.py
+
+import asyncio
+import threading
+
+from pydantic import TypeAdapter
+from starlette.requests import Request
+
+from src.core import cache as cache_module
+from src.core.cache import LRUByteCache, MemoryCacheBackend, ResponseCache, cached_json
+
+
+def test_lru_evicts_by_total_bytes():
+    """Test that the least recently used entries are evicted when the byte budget is exceeded."""
+    cache = LRUByteCache(max_bytes=10)
+    cache.set("a", b"1234")
+    cache.set("b", b"1234")
+    assert cache.get("a") == b"1234"  # 'a' pasa a ser la más reciente
+
+    cache.set("c", b"1234")
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1234"
+    assert cache.get("c") == b"1234"
+
+    stats = cache.stats()
+    assert stats["bytes"] == 8
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_lru_rejects_oversized_items():
+    """Test that items larger than the per-item limit are not cached."""
+    cache = LRUByteCache(max_bytes=100, max_item_bytes=5)
+    assert cache.set("big", b"123456") is False
+    assert cache.get("big") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_lru_bounded_by_item_count():
+    """Test that max_items evicts by number of entries when bytes aren't measured."""
+    cache = LRUByteCache(max_items=2)
+    cache.set("a", ("x",) * 1000)
+    cache.set("b", ("y",))
+    cache.get("a")
+    cache.set("c", ("z",))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["max_items"]) == (2, 0, 2)
+    assert stats["evictions"] == 1
+
+
+def test_lru_invalidate():
+    """Test that invalidated entries release their bytes."""
+    cache = LRUByteCache(max_bytes=100)
+    cache.set("a", b"12345")
+    cache.invalidate("a")
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_response_cache_version_bump_drops_entries():
+    """Test that bumping the content version makes previous responses unreachable."""
+    cache = ResponseCache(MemoryCacheBackend(max_bytes=1024))
+    cache.set("0:/tags/:", b"[]")
+    assert cache.get("0:/tags/:") == b"[]"
+
+    cache.bump_version()
+    assert cache.version() == 1
+    assert cache.get("0:/tags/:") is None
+
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_response_cache_without_backend_stores_nothing():
+    """Test that RESPONSE_CACHE_BACKEND=none disables caching."""
+    cache = ResponseCache()
+    cache.set("key", b"[]")
+    assert cache.get("key") is None
+    cache.bump_version()
+    assert cache.version() == 0
+
+
+class _BlockingBackend(MemoryCacheBackend):
+    """Memory backend that pretends to do network I/O and records the calling threads."""
+    blocking = True
+
+    def __init__(self):
+        super().__init__(max_bytes=1024)
+        self.threads = set()
+
+    def get(self, key):
+        self.threads.add(threading.get_ident())
+        return super().get(key)
+
+    def set(self, key, value):
+        self.threads.add(threading.get_ident())
+        super().set(key, value)
+
+
+def test_cached_json_runs_blocking_backends_off_the_event_loop(monkeypatch):
+    """Test that a network backend (Redis) is never called from the event loop thread."""
+    backend = _BlockingBackend()
+    monkeypatch.setattr(cache_module, "response_cache", ResponseCache(backend))
+    request = Request({"type": "http", "method": "GET", "path": "/tags/", "query_string": b"", "headers": []})
+
+    async def load():
+        return [1, 2]
+
+    async def scenario():
+        first = await cached_json(request, TypeAdapter(list), load)
+        second = await cached_json(request, TypeAdapter(list), load)
+        return threading.get_ident(), first, second
+
+    loop_thread, first, second = asyncio.run(scenario())
+    assert (first.headers["x-cache"], second.headers["x-cache"]) == ("MISS", "HIT")
+    assert second.body == b"[1,2]"
+    assert backend.threads and loop_thread not in backend.threads
@@ -0,0 +1,121 @@
+# tests/core/test_translation_database.py
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from src import cli
+from src.database import Base, create_db_engine
+from src.models.translation import Translation
+from src.core.translations import DatabaseTranslationStore, TranslationStore, copy_translations
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    # Un archivo SQLite propio: los "workers" de estas pruebas usan conexiones distintas
+    bind = create_db_engine(f"sqlite:///{tmp_path / 'translations.db'}")
+    Base.metadata.create_all(bind=bind)
+    yield sessionmaker(bind=bind, autoflush=False)
+    bind.dispose()
+
+
+def _files(directory, **languages):
+    directory.mkdir(exist_ok=True)
+    for lang, data in languages.items():
+        (directory / f"{lang}.json").write_text(json.dumps(data), encoding="utf-8")
+    return TranslationStore(directory)
+
+
+def test_import_and_serve_from_memory(tmp_path, session_factory):
+    """Test that imported languages keep their key order and are read once per version."""
+    files = _files(tmp_path / "i18n", en={"b": "B", "a": "A"}, es={"b": "Be"})
+    store = DatabaseTranslationStore(session_factory)
+
+    assert copy_translations(files, store) == {"en": 2, "es": 1}
+    assert store.languages() == ["en", "es"]
+    assert store.get("en").body == b'{"b":"B","a":"A"}'
+    assert store.get("en").version == 1
+
+    other = DatabaseTranslationStore(session_factory)
+    assert other.get("en").etag == store.get("en").etag
+    assert other.refresh() is False
+
+
+def test_refresh_rereads_only_changed_languages(tmp_path, session_factory):
+    """Test that a write in one worker reaches another after revalidating the versions."""
+    copy_translations(_files(tmp_path / "i18n", en={"a": "1"}, es={"a": "uno"}), DatabaseTranslationStore(session_factory))
+    worker_a = DatabaseTranslationStore(session_factory)
+    worker_b = DatabaseTranslationStore(session_factory)
+    es = worker_b.get("es")
+
+    written = worker_a.write("en", lambda data: {**data, "b": "2"})
+    assert worker_b.get("en").data == {"a": "1"}
+    assert worker_b.refresh() is True
+    assert worker_b.get("en").data == {"a": "1", "b": "2"}
+    assert worker_b.get("en").etag == written.etag
+    assert worker_b.get("es") is es
+
+
+def test_write_only_touches_changed_keys(tmp_path, session_factory):
+    """Test that unchanged rows keep their ids and removed keys are deleted."""
+    store = DatabaseTranslationStore(session_factory)
+    store.write("en", lambda data: {"a": "1", "b": "2", "c": "3"})
+    with session_factory() as db:
+        before = dict(db.execute(select(Translation.key, Translation.id)).all())
+
+    language = store.write("en", lambda data: {"d": "4", "c": "3!", "a": "1"})
+    assert list(language.data) == ["a", "c", "d"]
+    assert language.version == 2
+    with session_factory() as db:
+        after = dict(db.execute(select(Translation.key, Translation.id)).all())
+    assert after["a"] == before["a"] and after["c"] == before["c"]
+    assert "b" not in after
+    assert DatabaseTranslationStore(session_factory).get("en").body == language.body
+
+
+def test_if_match_across_workers(session_factory):
+    """Test that an ETag read from one worker is rejected after another worker writes."""
+    worker_a = DatabaseTranslationStore(session_factory)
+    worker_b = DatabaseTranslationStore(session_factory)
+    etag = worker_a.write("en", lambda data: {"a": "1"}).etag
+
+    worker_b.write("en", lambda data: {**data, "b": "2"}, if_match=etag)
+    with pytest.raises(HTTPException) as error:
+        worker_a.write("en", lambda data: {**data, "c": "3"}, if_match=etag)
+    assert error.value.status_code == 412
+    assert "c" not in DatabaseTranslationStore(session_factory).get("en").data
+
+
+def test_concurrent_writes_are_serialized(session_factory):
+    """Test that concurrent read-merge-writes from several stores don't lose updates."""
+    workers = [DatabaseTranslationStore(session_factory) for _ in range(4)]
+    workers[0].write("en", lambda data: {})
+
+    def add(i):
+        workers[i % 4].write("en", lambda data: {**data, f"key{i}": i})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(add, range(20)))
+
+    language = DatabaseTranslationStore(session_factory).get("en")
+    assert set(language.data) == {f"key{i}" for i in range(20)}
+    assert language.version == 21
+
+
+def test_cli_round_trip(tmp_path, session_factory, monkeypatch):
+    """Test that import-translations and export-translations copy the JSON files both ways."""
+    monkeypatch.setattr(cli, "SessionLocal", session_factory)
+    monkeypatch.setattr(cli, "prepare_database", lambda: None)
+    _files(tmp_path / "in", en={"navbar.home": "Home"}, es={"navbar.home": "Inicio"})
+
+    cli.main(["import-translations", "--dir", str(tmp_path / "in")])
+    DatabaseTranslationStore(session_factory).write("es", lambda data: {**data, "navbar.about": "Sobre mí"})
+    cli.main(["export-translations", "--dir", str(tmp_path / "out"), "--lang", "es"])
+
+    assert not (tmp_path / "out" / "en.json").exists()
+    exported = json.loads((tmp_path / "out" / "es.json").read_text(encoding="utf-8"))
+    assert exported == {"navbar.home": "Inicio", "navbar.about": "Sobre mí"}
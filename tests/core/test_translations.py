@@ -0,0 +1,150 @@
+# tests/core/test_translations.py
+
+import asyncio
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from src.core.translations import TranslationStore, fcntl, prefix_index
+
+
+def _write(path, data, mtime_ns=None):
+    path.write_text(json.dumps(data), encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_store_loads_once_and_serves_from_memory(tmp_path):
+    """Test that languages are read once and later reads don't touch the disk."""
+    _write(tmp_path / "en.json", {"navbar.home": "Home"})
+    _write(tmp_path / "es.json", {"navbar.home": "Inicio"})
+    store = TranslationStore(tmp_path)
+    store.load()
+
+    (tmp_path / "en.json").unlink()
+    assert store.languages() == ["en", "es"]
+    assert store.get("en").data == {"navbar.home": "Home"}
+    assert store.get("en").body == b'{"navbar.home":"Home"}'
+    assert store.get("fr") is None
+
+
+def test_refresh_reloads_only_changed_files(tmp_path):
+    """Test that refresh picks up modified, new and deleted files by mtime."""
+    _write(tmp_path / "en.json", {"a": "1"}, mtime_ns=1_000_000_000)
+    _write(tmp_path / "es.json", {"a": "uno"}, mtime_ns=1_000_000_000)
+    store = TranslationStore(tmp_path)
+    store.load()
+    es = store.get("es")
+
+    assert store.refresh() is False
+    _write(tmp_path / "en.json", {"a": "2"}, mtime_ns=2_000_000_000)
+    _write(tmp_path / "fr.json", {"a": "un"})
+    assert store.refresh() is True
+    assert store.get("en").data == {"a": "2"}
+    assert store.get("es") is es
+    assert store.languages() == ["en", "es", "fr"]
+
+    (tmp_path / "fr.json").unlink()
+    assert store.refresh() is True
+    assert store.languages() == ["en", "es"]
+
+
+def test_refresh_keeps_previous_version_of_invalid_file(tmp_path):
+    """Test that a half-written file doesn't replace the loaded language."""
+    _write(tmp_path / "en.json", {"a": "1"}, mtime_ns=1_000_000_000)
+    store = TranslationStore(tmp_path)
+    store.load()
+
+    (tmp_path / "en.json").write_text('{"a": ', encoding="utf-8")
+    store.refresh()
+    assert store.get("en").data == {"a": "1"}
+
+
+def test_watch_reloads_on_change(tmp_path):
+    """Test that the watcher reloads edited files and notifies on_change."""
+    _write(tmp_path / "en.json", {"a": "1"})
+    changes = []
+    store = TranslationStore(tmp_path, on_change=lambda: changes.append(True))
+    store.load()
+
+    async def scenario():
+        stop = asyncio.Event()
+        watcher = asyncio.create_task(store.watch(stop))
+        await asyncio.sleep(0.2)
+        _write(tmp_path / "en.json", {"a": "2"})
+        for _ in range(100):
+            if store.get("en").data == {"a": "2"}:
+                break
+            await asyncio.sleep(0.05)
+        stop.set()
+        await watcher
+
+    asyncio.run(scenario())
+    assert store.get("en").data == {"a": "2"}
+    assert changes
+
+
+def test_concurrent_writes_are_serialized(tmp_path):
+    """Test that concurrent read-merge-writes don't lose updates and readers never see a partial file."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    _write(tmp_path / "en.json", {"base": "x" * 10_000})
+    store = TranslationStore(tmp_path)
+    store.load()
+    stop = []
+
+    def read_file():
+        reads = 0
+        while not stop:
+            json.loads((tmp_path / "en.json").read_text(encoding="utf-8"))
+            reads += 1
+        return reads
+
+    with ThreadPoolExecutor(max_workers=9) as pool:
+        reader = pool.submit(read_file)
+        list(pool.map(lambda i: store.write("en", lambda data: {**data, f"key{i}": i}), range(40)))
+        stop.append(True)
+        assert reader.result() > 0
+
+    language = store.get("en")
+    assert all(language.data[f"key{i}"] == i for i in range(40))
+    assert language.version == 40
+    assert not list(tmp_path.glob("*.tmp"))
+    # Otro proceso ve la misma versión al cargar el directorio
+    other = TranslationStore(tmp_path)
+    assert other.get("en").version == 40
+    assert other.get("en").etag == language.etag
+
+
+def _write_keys(directory, worker):
+    store = TranslationStore(directory)
+    for i in range(10):
+        store.write("en", lambda data: {**data, f"w{worker}-{i}": i})
+
+
+@pytest.mark.skipif(fcntl is None, reason="needs fcntl for the cross-process lock")
+def test_writes_from_several_processes(tmp_path):
+    """Test that workers sharing the directory don't lose each other's writes."""
+    _write(tmp_path / "en.json", {})
+    context = multiprocessing.get_context("spawn")
+    processes = [context.Process(target=_write_keys, args=(tmp_path, worker)) for worker in range(4)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(timeout=60)
+        assert process.exitcode == 0
+
+    language = TranslationStore(tmp_path).get("en")
+    assert len(language.data) == 40
+    assert language.version == 40
+
+
+def test_prefix_index():
+    """Test that every dotted prefix indexes the keys under it, in file order."""
+    index = prefix_index({"a.b.c": 1, "a.d": 2, "ab": 3})
+    assert index["a"] == ("a.b.c", "a.d")
+    assert index["a.b"] == ("a.b.c",)
+    assert index["a.b.c"] == ("a.b.c",)
+    assert index["ab"] == ("ab",)
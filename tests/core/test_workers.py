@@ -0,0 +1,75 @@
+# tests/core/test_workers.py
+
+import io
+import os
+import signal
+import pytest
+from PIL import Image
+
+from src.core.workers import WorkerPool, WorkerPoolBrokenError, WorkerPoolBusyError
+from src.services.images_service import process_image, InvalidImageError
+
+
+def _png_bytes() -> bytes:
+    file = io.BytesIO()
+    Image.new("RGB", (800, 400), "blue").save(file, "png")
+    return file.getvalue()
+
+
+def test_worker_pool_runs_in_child_process():
+    """Test that image processing runs in the process pool and returns its result."""
+    pool = WorkerPool(max_workers=1, max_pending=1, queue_timeout=5)
+    try:
+        processed = pool.run(process_image, _png_bytes(), widths=[320], formats=["webp"])
+        assert processed.width == 800
+        assert {(v.width, v.content_type) for v in processed.variants} == {
+            (320, "image/png"), (320, "image/webp"), (800, "image/webp"),
+        }
+
+        with pytest.raises(InvalidImageError):
+            pool.run(process_image, b"not an image")
+    finally:
+        pool.shutdown()
+
+
+def test_worker_pool_rejects_when_queue_is_full():
+    """Test that tasks beyond the bounded queue fail fast instead of blocking."""
+    pool = WorkerPool(max_workers=1, max_pending=1, queue_timeout=0)
+    pool._slots.acquire()  # Simula una tarea en curso ocupando la cola
+    try:
+        with pytest.raises(WorkerPoolBusyError):
+            pool.run(process_image, _png_bytes())
+    finally:
+        pool._slots.release()
+        pool.shutdown()
+
+
+def _kill_workers(pool: WorkerPool) -> None:
+    for process in list(pool._executor._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+
+
+def test_worker_pool_recovers_from_dead_worker():
+    """Test that a killed worker process doesn't break every later task."""
+    pool = WorkerPool(max_workers=1, max_pending=1, queue_timeout=5)
+    try:
+        first = pool.run(os.getpid)
+        _kill_workers(pool)
+        second = pool.run(os.getpid)
+        assert second != first
+        assert pool.run(process_image, _png_bytes()).width == 800
+    finally:
+        pool.shutdown()
+
+
+def test_worker_pool_gives_up_after_one_retry(monkeypatch):
+    """Test that a pool that breaks again on the retry raises WorkerPoolBrokenError."""
+    pool = WorkerPool(max_workers=1, max_pending=1, queue_timeout=5)
+    try:
+        with pytest.raises(WorkerPoolBrokenError):
+            pool.run(os._exit, 1)
+        # El hueco de la cola se libera y el pool sigue funcionando
+        assert pool.run(os.getpid) != os.getpid()
+    finally:
+        pool.shutdown()
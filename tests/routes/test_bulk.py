@@ -0,0 +1,183 @@
+# tests/routes/test_bulk.py
+
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.models.media import Media
+from src.models.project import Project
+from src.models.tag import Tag
+from src.models.technology import Technology
+
+
+def test_bulk_tags(client: TestClient, db_session: Session, admin_auth_headers: dict):
+    """Test creating, renaming and deleting tags in one call, with per-item ids."""
+    old, gone = Tag(name="old"), Tag(name="gone")
+    db_session.add_all([old, gone])
+    db_session.commit()
+
+    response = client.post("/tags/bulk", headers=admin_auth_headers, json={
+        "create": [{"name": "a"}, {"name": "gone"}],
+        "update": [{"id": old.id, "name": "renamed"}],
+        "delete": [gone.id],
+    })
+    assert response.status_code == 200, response.text
+    results = response.json()["results"]
+    assert [(r["op"], r["index"]) for r in results] == [("delete", 0), ("update", 0), ("create", 0), ("create", 1)]
+
+    db_session.expire_all()
+    names = {tag.id: tag.name for tag in db_session.query(Tag)}
+    assert names[old.id] == "renamed"
+    # "gone" could be reused because its previous owner was deleted in the same batch
+    assert [names[r["id"]] for r in results if r["op"] == "create"] == ["a", "gone"]
+    assert sorted(names.values()) == ["a", "gone", "renamed"]
+
+
+def test_bulk_tags_reports_every_error_and_writes_nothing(
+    client: TestClient, db_session: Session, admin_auth_headers: dict
+):
+    """Test that validation collects all per-item errors and the batch is all or nothing."""
+    db_session.add(Tag(name="taken"))
+    db_session.commit()
+
+    response = client.post("/tags/bulk", headers=admin_auth_headers, json={
+        "create": [{"name": "fresh"}, {"name": "taken"}, {"name": "fresh"}],
+        "delete": [999],
+    })
+    assert response.status_code == 422
+    assert [(e["op"], e["index"]) for e in response.json()["detail"]] == [
+        ("delete", 0), ("create", 1), ("create", 2)
+    ]
+    assert db_session.query(Tag).filter(Tag.name == "fresh").count() == 0
+
+
+def test_bulk_tags_rejects_name_swap(client: TestClient, db_session: Session, admin_auth_headers: dict):
+    """Test that swapping names is a 422 (renames apply row by row), but creates may reuse a renamed name."""
+    a, b = Tag(name="swap-a"), Tag(name="swap-b")
+    db_session.add_all([a, b])
+    db_session.commit()
+
+    response = client.post("/tags/bulk", headers=admin_auth_headers, json={
+        "update": [{"id": a.id, "name": "swap-b"}, {"id": b.id, "name": "swap-a"}],
+    })
+    assert response.status_code == 422
+    assert [(e["op"], e["index"]) for e in response.json()["detail"]] == [("update", 0), ("update", 1)]
+
+    response = client.post("/tags/bulk", headers=admin_auth_headers, json={
+        "create": [{"name": "swap-a"}],
+        "update": [{"id": a.id, "name": "swap-c"}],
+    })
+    assert response.status_code == 200, response.text
+    db_session.expire_all()
+    assert sorted(tag.name for tag in db_session.query(Tag)) == ["swap-a", "swap-b", "swap-c"]
+
+
+def test_bulk_requires_admin(client: TestClient):
+    """Test that bulk endpoints are protected."""
+    assert client.post("/tags/bulk", json={}).status_code == 401
+
+
+def test_bulk_technologies_share_one_icon(
+    client: TestClient, db_session: Session, admin_auth_headers: dict, create_test_image
+):
+    """Test that an icon used by several technologies is stored once with one reference each."""
+    payload = {"create": [{"name": f"T{i}", "icon": "icon.jpg"} for i in range(3)]}
+    response = client.post(
+        "/technologies/bulk", headers=admin_auth_headers,
+        data={"payload": json.dumps(payload)}, files=[("files", create_test_image("icon.jpg"))],
+    )
+    assert response.status_code == 200, response.text
+    icons = {t.icon for t in db_session.query(Technology).filter(Technology.name.like("T%"))}
+    assert len(icons) == 1
+    filename = icons.pop().split("/")[-1]
+    original = db_session.query(Media).filter(Media.filename == filename).one()
+    assert original.ref_count == 3
+
+    # Deleting two of them releases two references; the image stays for the third
+    ids = [r["id"] for r in response.json()["results"]]
+    response = client.post(
+        "/technologies/bulk", headers=admin_auth_headers, data={"payload": json.dumps({"delete": ids[:2]})},
+    )
+    assert response.status_code == 200, response.text
+    db_session.expire_all()
+    assert original.ref_count == 1
+
+    response = client.post(
+        "/technologies/bulk", headers=admin_auth_headers, data={"payload": json.dumps({"delete": ids[2:]})},
+    )
+    assert response.status_code == 200, response.text
+    assert db_session.query(Media).filter(Media.filename == filename).count() == 0
+
+
+def test_bulk_technologies_missing_file(client: TestClient, admin_auth_headers: dict):
+    """Test that items must reference files from the bundle."""
+    payload = {"create": [{"name": "NoIcon", "icon": "missing.png"}]}
+    response = client.post("/technologies/bulk", headers=admin_auth_headers, data={"payload": json.dumps(payload)})
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["msg"] == "File 'missing.png' is not in the bundle"
+
+
+def test_bulk_projects(client: TestClient, db_session: Session, admin_auth_headers: dict, create_test_image):
+    """Test creating projects with relations, then updating and deleting them in bulk."""
+    tech, tag = Technology(name="BulkTech", icon="/i.png"), Tag(name="bulk-tag")
+    db_session.add_all([tech, tag])
+    db_session.commit()
+
+    payload = {"create": [
+        {"title": f"Bulk {i}", "description_en": "Seeded in bulk", "description_es": "es",
+         "image": "p.jpg", "technology_ids": [tech.id], "tag_ids": [tag.id]}
+        for i in range(3)
+    ]}
+    response = client.post(
+        "/projects/bulk", headers=admin_auth_headers,
+        data={"payload": json.dumps(payload)}, files=[("files", create_test_image("p.jpg"))],
+    )
+    assert response.status_code == 200, response.text
+    first, second, third = (r["id"] for r in response.json()["results"])
+    assert [p["title"] for p in client.get("/projects/?tag=bulk-tag").json()] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+    assert len(client.get("/projects/search?q=seeded").json()) == 3
+
+    payload = {"update": [{"id": first, "title": "Renamed", "tag_ids": []}], "delete": [second]}
+    response = client.post("/projects/bulk", headers=admin_auth_headers, data={"payload": json.dumps(payload)})
+    assert response.status_code == 200, response.text
+    assert [p["title"] for p in client.get("/projects/?tag=bulk-tag").json()] == ["Bulk 2"]
+    renamed = client.get(f"/projects/{first}").json()
+    assert renamed["title"] == "Renamed" and renamed["tags"] == []
+    assert [r["project"]["id"] for r in client.get("/projects/search?q=renamed").json()] == [first]
+    assert db_session.get(Project, second) is None
+    assert db_session.get(Project, third) is not None
+
+
+def test_bulk_projects_ignore_image_route(
+    client: TestClient, db_session: Session, admin_auth_headers: dict, create_test_image
+):
+    """Test that a bulk update can't point a project at an arbitrary image route."""
+    payload = {"create": [{"title": "Img", "description_en": "en", "description_es": "es", "image": "p.jpg"}]}
+    response = client.post(
+        "/projects/bulk", headers=admin_auth_headers,
+        data={"payload": json.dumps(payload)}, files=[("files", create_test_image("p.jpg"))],
+    )
+    project_id = response.json()["results"][0]["id"]
+    route = db_session.get(Project, project_id).image_route
+
+    payload = {"update": [{"id": project_id, "title": "Img 2", "image_route": "/static/images/evil.png"}]}
+    response = client.post("/projects/bulk", headers=admin_auth_headers, data={"payload": json.dumps(payload)})
+    assert response.status_code == 200, response.text
+    db_session.expire_all()
+    project = db_session.get(Project, project_id)
+    assert (project.title, project.image_route) == ("Img 2", route)
+
+
+def test_bulk_projects_unknown_relations(client: TestClient, admin_auth_headers: dict, create_test_image):
+    """Test that unknown technology and tag ids are reported per item."""
+    payload = {"create": [{"title": "X", "description_en": "en", "description_es": "es",
+                           "image": "p.jpg", "technology_ids": [999], "tag_ids": [998]}]}
+    response = client.post(
+        "/projects/bulk", headers=admin_auth_headers,
+        data={"payload": json.dumps(payload)}, files=[("files", create_test_image("p.jpg"))],
+    )
+    assert response.status_code == 422
+    assert [e["msg"] for e in response.json()["detail"]] == [
+        "Unknown technology ids: [999]", "Unknown tag ids: [998]"
+    ]
@@ -80,7 +80,7 @@ def test_update_certificate_image(client: TestClient, db_session: Session, admin
     cert = certificates_service.create_certificate(db_session, cert_schema, mock_upload_file)
     old_image_route = cert.image_route
 
-    new_image = create_test_image("new.jpg")
+    new_image = create_test_image("new.jpg", color="blue")
     response = client.put(
         f"/certificates/{cert.id}",
         headers=admin_auth_headers,
@@ -1,9 +1,29 @@
 import io
+import shutil
 import pytest
 from fastapi.testclient import TestClient
 from unittest.mock import patch
 
-pytestmark = pytest.mark.skip("CV service is currently deactivated")
+from src.core.config import settings
+from src.services import cv_service
+
+
+@pytest.fixture(autouse=True)
+def cv_files(tmp_path, monkeypatch):
+    """CV sources copied to a temp dir, a temp PDF cache and a fake (counted) WeasyPrint render."""
+    cv_dir = tmp_path / "others"
+    shutil.copytree(cv_service.CV_DIR, cv_dir)
+    monkeypatch.setattr(cv_service, "CV_DIR", cv_dir)
+    monkeypatch.setattr(settings, "CV_CACHE_DIR", tmp_path / "cache")
+    monkeypatch.setattr(cv_service, "cv_cache", {})
+    renders = []
+
+    def render_pdf(markdown_text, css_text):
+        renders.append(markdown_text)
+        return b"%PDF-1.7 " + markdown_text.encode("utf-8")
+
+    monkeypatch.setattr(cv_service, "render_pdf", render_pdf)
+    return renders
 
 def test_download_cv(client: TestClient):
     """Test downloading the CV PDF."""
@@ -38,4 +58,50 @@ def test_download_cv_file_not_found(client: TestClient):
     # Patch the 'exists' method to simulate a missing file
     with patch("pathlib.Path.exists", return_value=False):
         response = client.get("/cv/download/en")
-        assert response.status_code == 404
\ No newline at end of file
+        assert response.status_code == 404
+
+def test_download_cv_is_rendered_once(client: TestClient, cv_files: list):
+    """Test that the PDF is cached by content and revalidated with its ETag."""
+    first = client.get("/cv/download/en")
+    second = client.get("/cv/download/en")
+    assert first.content == second.content
+    assert len(cv_files) == 1
+    assert first.headers["content-length"] == str(len(first.content))
+
+    etag = first.headers["etag"]
+    response = client.get("/cv/download/en", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    # Editing the stylesheet by hand changes the key and the ETag
+    css = cv_service.CV_DIR / "style.css"
+    css.write_text(css.read_text(encoding="utf-8") + "\nbody { margin: 0; }", encoding="utf-8")
+    response = client.get("/cv/download/en", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(cv_files) == 2
+
+
+def test_download_cv_uses_disk_cache(client: TestClient, cv_files: list):
+    """Test that a new process (empty memory cache) reuses the PDF stored on disk."""
+    pdf = client.get("/cv/download/es").content
+    cv_service.cv_cache.clear()
+    assert client.get("/cv/download/es").content == pdf
+    assert len(cv_files) == 1
+    assert len(list(settings.CV_CACHE_DIR.glob("cv_es-*.pdf"))) == 1
+
+
+def test_upload_cv_renders_eagerly(client: TestClient, admin_auth_headers: dict, cv_files: list):
+    """Test that uploading a CV regenerates its PDF and replaces the old cached file."""
+    client.get("/cv/download/es")
+    response = client.put(
+        "/cv/upload/es",
+        headers=admin_auth_headers,
+        files={"file": ("cv_es.md", io.BytesIO(b"# Nuevo CV"), "text/markdown")},
+    )
+    assert response.status_code == 200
+    assert cv_files[-1] == "# Nuevo CV"
+
+    renders = len(cv_files)
+    assert client.get("/cv/download/es").content == b"%PDF-1.7 # Nuevo CV"
+    assert len(cv_files) == renders
+    assert len(list(settings.CV_CACHE_DIR.glob("cv_es-*.pdf"))) == 1
@@ -0,0 +1,60 @@
+# tests/routes/test_facets.py
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.models.project import Project
+from src.models.technology import Technology
+from src.models.tag import Tag
+
+
+def _seed(db: Session):
+    fastapi, react, go = (Technology(name=n, icon="/i.png") for n in ("FastAPI", "React", "Go"))
+    backend, frontend, unused = Tag(name="backend"), Tag(name="frontend"), Tag(name="unused")
+    db.add_all([go, unused])
+    for technologies, tags in [
+        ([fastapi], [backend]),
+        ([fastapi, react], [backend, frontend]),
+        ([react], [frontend]),
+    ]:
+        db.add(Project(
+            title="P", description_en="en", description_es="es",
+            image_route="/static/images/p.png", technologies=technologies, tags=tags,
+        ))
+    db.commit()
+
+
+@pytest.mark.parametrize("url, expected", [
+    ("/tags/?with_counts=true", {"backend": 2, "frontend": 2, "unused": 0}),
+    ("/technologies/?with_counts=true", {"FastAPI": 2, "React": 2, "Go": 0}),
+])
+def test_list_with_counts(client: TestClient, db_session: Session, url, expected):
+    """Test that with_counts adds each item's project count, including zero."""
+    _seed(db_session)
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert {item["name"]: item["project_count"] for item in response.json()} == expected
+
+
+def test_counts_are_opt_in(client: TestClient, db_session: Session):
+    """Test that plain lists keep their shape and counts combine with fields."""
+    _seed(db_session)
+
+    assert "project_count" not in client.get("/tags/").json()[0]
+    assert client.get("/tags/?fields=project_count").status_code == 400
+    assert client.get("/tags/?with_counts=true&fields=project_count&limit=1").json() == [
+        {"id": 1, "project_count": 0}
+    ]
+
+
+def test_counts_use_a_single_query(client: TestClient, db_session: Session, captured_sql):
+    """Test that counts come from one GROUP BY, not from loading Tag.projects."""
+    _seed(db_session)
+    captured_sql.clear()
+
+    client.get("/tags/?with_counts=true")
+    selects = [s for s in captured_sql if s.lstrip().upper().startswith("SELECT")]
+    assert len(selects) == 1
+    assert "GROUP BY" in selects[0]
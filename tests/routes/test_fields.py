@@ -0,0 +1,106 @@
+# tests/routes/test_fields.py
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.models.project import Project
+from src.models.technology import Technology
+from src.models.tag import Tag
+
+
+def _seed(db: Session):
+    db.add(Project(
+        title="Grid", description_en="Long English text", description_es="Texto largo",
+        image_route="/static/images/p.png",
+        technologies=[Technology(name="Python", icon="/static/images/t.png")],
+        tags=[Tag(name="Web")],
+    ))
+    db.commit()
+    db.expire_all()
+
+
+def _selects(captured_sql):
+    return [s for s in captured_sql if s.lstrip().upper().startswith("SELECT")]
+
+
+def test_fields_trim_response_and_query(client: TestClient, db_session: Session, captured_sql):
+    """Test that ?fields= returns only those fields and loads only those columns."""
+    _seed(db_session)
+    captured_sql.clear()
+    response = client.get("/projects/?fields=title,image_route")
+    assert response.status_code == 200
+    assert response.json() == [{"id": response.json()[0]["id"], "title": "Grid", "image_route": "/static/images/p.png"}]
+
+    selects = _selects(captured_sql)
+    assert len(selects) == 1  # sin cargar tecnologías ni tags
+    assert "description_en" not in selects[0]
+    assert "description_es" not in selects[0]
+
+
+def test_fields_with_relationship(client: TestClient, db_session: Session, captured_sql):
+    """Test that only the requested relationships are eager-loaded."""
+    _seed(db_session)
+    captured_sql.clear()
+    data = client.get("/projects/?fields=title,technologies").json()
+    assert data[0]["technologies"][0]["name"] == "Python"
+    assert "tags" not in data[0]
+    assert len(_selects(captured_sql)) == 2
+
+
+def test_lang_keeps_one_description(client: TestClient, db_session: Session, captured_sql):
+    """Test that ?lang= drops the other language's description from the query and the response."""
+    _seed(db_session)
+    captured_sql.clear()
+    project = client.get("/projects/?lang=es").json()[0]
+    assert project["description_es"] == "Texto largo"
+    assert "description_en" not in project
+    assert project["technologies"][0]["name"] == "Python"
+    assert "description_en" not in _selects(captured_sql)[0]
+
+
+def test_fields_on_other_routers(client: TestClient, admin_auth_headers: dict):
+    """Test that the other list endpoints accept fields= too."""
+    client.post("/tags/", json={"name": "Only"}, headers=admin_auth_headers)
+    assert list(client.get("/tags/?fields=name").json()[0]) == ["name", "id"]
+
+
+def test_invalid_fields_and_lang(client: TestClient):
+    """Test that unknown fields and unsupported languages are rejected."""
+    assert client.get("/projects/?fields=title,secret").status_code == 400
+    assert client.get("/projects/?lang=fr").status_code == 400
+
+
+def test_accept_language_selects_description(client: TestClient, db_session: Session):
+    """Test that Accept-Language picks the description and is part of the cache key."""
+    _seed(db_session)
+
+    spanish = client.get("/projects/", headers={"Accept-Language": "es-MX,es;q=0.9,en;q=0.8"})
+    assert spanish.headers["Content-Language"] == "es"
+    assert "Accept-Language" in spanish.headers["Vary"]
+    assert "description_en" not in spanish.json()[0]
+
+    english = client.get("/projects/", headers={"Accept-Language": "en-US"})
+    assert english.headers["X-Cache"] == "MISS"
+    assert english.json()[0]["description_en"] == "Long English text"
+    assert "description_es" not in english.json()[0]
+
+    # ?lang= gana sobre la cabecera; sin ninguno se devuelven ambos idiomas
+    assert "description_es" in client.get("/projects/?lang=es", headers={"Accept-Language": "en"}).json()[0]
+    both = client.get("/projects/", headers={"Accept-Language": "fr"})
+    assert {"description_en", "description_es"} <= set(both.json()[0])
+    assert "Content-Language" not in both.headers
+
+
+def test_project_detail_in_one_language(client: TestClient, db_session: Session, captured_sql):
+    """Test that GET /projects/{id} only loads the requested description column."""
+    _seed(db_session)
+    project_id = client.get("/projects/").json()[0]["id"]
+
+    captured_sql.clear()
+    response = client.get(f"/projects/{project_id}", headers={"Accept-Language": "es"})
+    assert response.status_code == 200
+    assert response.json()["description_es"] == "Texto largo"
+    assert "description_en" not in response.json()
+    assert "description_en" not in _selects(captured_sql)[0]
+
+    assert client.get("/projects/999999?lang=en").status_code == 404
@@ -45,4 +45,97 @@ def test_update_language_file(client: TestClient, admin_auth_headers: dict):
     data = response.json()["data"]
     assert data["new.key"] == "New Value"
     # Verify the original data is still there
-    assert data["navbar.home"] == "Home"
\ No newline at end of file
+    assert data["navbar.home"] == "Home"
+
+def test_translations_etag_and_not_modified(client: TestClient, admin_auth_headers: dict):
+    """Test that GET returns an ETag that changes with every write."""
+    response = client.get("/i18n/en")
+    etag = response.headers["ETag"]
+    assert client.get("/i18n/en", headers={"If-None-Match": etag}).status_code == 304
+
+    update = client.put("/i18n/en", headers=admin_auth_headers, json={"navbar.home": "Start"})
+    assert update.json()["version"] == int(response.headers["X-Translations-Version"]) + 1
+    assert update.headers["ETag"] != etag
+    assert client.get("/i18n/en", headers={"If-None-Match": etag}).status_code == 200
+
+def test_merge_patch_deletes_keys(client: TestClient, admin_auth_headers: dict):
+    """Test that a merge patch updates keys and removes the ones set to null."""
+    response = client.patch(
+        "/i18n/en",
+        headers={**admin_auth_headers, "Content-Type": "application/merge-patch+json"},
+        content=json.dumps({"navbar.home": "Start", "navbar.about": None}),
+    )
+    assert response.status_code == 200
+    data = client.get("/i18n/en").json()
+    assert data["navbar.home"] == "Start"
+    assert "navbar.about" not in data
+
+def test_json_patch(client: TestClient, admin_auth_headers: dict):
+    """Test JSON Patch operations, including escaped pointers and array items."""
+    headers = {**admin_auth_headers, "Content-Type": "application/json-patch+json"}
+    operations = [
+        {"op": "test", "path": "/navbar.home", "value": "Home"},
+        {"op": "replace", "path": "/navbar.home", "value": "Start"},
+        {"op": "add", "path": "/hero.skills/-", "value": "Gamer"},
+        {"op": "move", "from": "/navbar.work", "path": "/navbar.projects"},
+        {"op": "add", "path": "/a~1b", "value": "slash"},
+    ]
+    response = client.patch("/i18n/en", headers=headers, content=json.dumps(operations))
+    assert response.status_code == 200, response.text
+    data = response.json()["data"]
+    assert data["navbar.home"] == "Start"
+    assert data["hero.skills"][-1] == "Gamer"
+    assert "navbar.work" not in data and data["navbar.projects"] == "Work"
+    assert data["a/b"] == "slash"
+
+    # Un test fallido no aplica nada
+    failing = [{"op": "remove", "path": "/navbar.home"}, {"op": "test", "path": "/navbar.contact", "value": "x"}]
+    assert client.patch("/i18n/en", headers=headers, content=json.dumps(failing)).status_code == 409
+    assert client.get("/i18n/en").json()["navbar.home"] == "Start"
+
+    invalid = [{"op": "remove", "path": "/missing"}]
+    assert client.patch("/i18n/en", headers=headers, content=json.dumps(invalid)).status_code == 422
+
+def test_patch_rejects_unknown_language_and_media_type(client: TestClient, admin_auth_headers: dict):
+    """Test PATCH errors for missing languages and unsupported bodies."""
+    headers = {**admin_auth_headers, "Content-Type": "application/merge-patch+json"}
+    assert client.patch("/i18n/fr", headers=headers, content="{}").status_code == 404
+    headers["Content-Type"] = "text/plain"
+    assert client.patch("/i18n/en", headers=headers, content="{}").status_code == 415
+
+def test_write_with_stale_if_match_fails(client: TestClient, admin_auth_headers: dict):
+    """Test optimistic concurrency: a write based on an old ETag is rejected."""
+    etag = client.get("/i18n/en").headers["ETag"]
+    first = client.put("/i18n/en", headers={**admin_auth_headers, "If-Match": etag}, json={"a": "1"})
+    assert first.status_code == 200
+    second = client.put("/i18n/en", headers={**admin_auth_headers, "If-Match": etag}, json={"a": "2"})
+    assert second.status_code == 412
+    assert client.get("/i18n/en").json()["a"] == "1"
+
+def test_namespace_filtering(client: TestClient, admin_auth_headers: dict):
+    """Test that ns= returns only keys under the given dotted prefixes."""
+    client.put("/i18n/en", headers=admin_auth_headers, json={
+        "shop.form.name": "Name", "shop.form.email": "Email", "shop.title": "Shop", "shopping": "x",
+    })
+
+    data = client.get("/i18n/en?ns=navbar").json()
+    assert data and all(key.startswith("navbar.") for key in data)
+
+    assert client.get("/i18n/en?ns=shop.form").json() == {"shop.form.name": "Name", "shop.form.email": "Email"}
+    assert "shopping" not in client.get("/i18n/en?ns=shop").json()
+    both = client.get("/i18n/en?ns=shop.form, navbar").json()
+    assert "navbar.home" in both and "shop.form.name" in both and "shop.title" not in both
+    assert client.get("/i18n/en?ns=missing").json() == {}
+
+def test_namespace_etag_ignores_other_namespaces(client: TestClient, admin_auth_headers: dict):
+    """Test that a namespace ETag only changes when its own keys change."""
+    etag = client.get("/i18n/en?ns=navbar").headers["ETag"]
+    assert client.get("/i18n/en?ns=navbar", headers={"If-None-Match": etag}).status_code == 304
+
+    client.put("/i18n/en", headers=admin_auth_headers, json={"hero.welcome": "Hello"})
+    assert client.get("/i18n/en?ns=navbar", headers={"If-None-Match": etag}).status_code == 304
+
+    client.put("/i18n/en", headers=admin_auth_headers, json={"navbar.home": "Start"})
+    response = client.get("/i18n/en?ns=navbar", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["navbar.home"] == "Start"
@@ -0,0 +1,433 @@
+# tests/routes/test_media.py
+
+import io
+import pytest
+import hashlib
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+from PIL import Image
+
+from src.models.media import Media
+from src.services import media_service
+
+
+def _upload_icon(client: TestClient, admin_auth_headers: dict, create_test_image) -> str:
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "MediaTech"},
+        files={"icon": create_test_image("icon.jpg")},
+    )
+    assert response.status_code == 201, response.text
+    return response.json()["icon"]
+
+
+def test_get_image(client: TestClient, db_session: Session, admin_auth_headers: dict, create_test_image):
+    """Test that an uploaded image is streamed back intact."""
+    image_route = _upload_icon(client, admin_auth_headers, create_test_image)
+    filename = image_route.split("/")[-1]
+    stored = db_session.query(Media).filter(Media.filename == filename).first()
+
+    response = client.get(image_route)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.headers["content-length"] == str(len(stored.data))
+    assert response.content == stored.data
+    Image.open(io.BytesIO(response.content)).verify()
+
+
+def test_get_image_not_found(client: TestClient):
+    """Test requesting an image that does not exist."""
+    response = client.get("/static/images/does-not-exist.png")
+    assert response.status_code == 404
+
+
+def test_iter_media_chunks(db_session: Session):
+    """Test that chunked reads reassemble the original blob."""
+    payload = bytes(range(256)) * 40
+    media = Media(
+        filename="chunks.bin",
+        content_type="application/octet-stream",
+        data=payload,
+        size=len(payload),
+    )
+    db_session.add(media)
+    db_session.commit()
+
+    info = media_service.get_media_info(db_session, "chunks.bin")
+    assert info.size == len(payload)
+
+    chunks = list(media_service.iter_media_chunks(db_session, info, chunk_size=1000))
+    assert all(len(chunk) <= 1000 for chunk in chunks)
+    assert len(chunks) == 11
+    assert b"".join(chunks) == payload
+
+
+def test_get_image_cache_headers(client: TestClient, db_session: Session, admin_auth_headers: dict, create_test_image):
+    """Test that images are served with a strong ETag and immutable caching."""
+    image_route = _upload_icon(client, admin_auth_headers, create_test_image)
+    filename = image_route.split("/")[-1]
+    stored = db_session.query(Media).filter(Media.filename == filename).first()
+    assert stored.content_hash == hashlib.sha256(stored.data).hexdigest()
+    assert stored.size == len(stored.data)
+    assert stored.created_at is not None
+
+    response = client.get(image_route)
+    assert response.status_code == 200
+    assert response.headers["etag"] == f'"{stored.content_hash}"'
+    assert response.headers["cache-control"] == "public, max-age=31536000, immutable"
+    assert "last-modified" in response.headers
+
+
+def test_get_image_not_modified(client: TestClient, admin_auth_headers: dict, create_test_image):
+    """Test that conditional requests are answered with 304 and no body."""
+    image_route = _upload_icon(client, admin_auth_headers, create_test_image)
+    first = client.get(image_route)
+
+    response = client.get(image_route, headers={"If-None-Match": first.headers["etag"]})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == first.headers["etag"]
+
+    response = client.get(image_route, headers={"If-Modified-Since": first.headers["last-modified"]})
+    assert response.status_code == 304
+
+    response = client.get(image_route, headers={"If-None-Match": '"other"'})
+    assert response.status_code == 200
+
+
+def test_get_image_served_from_cache(client: TestClient, admin_auth_headers: dict, create_test_image, monkeypatch):
+    """Test that a hot image is served from memory without querying the DB."""
+    image_route = _upload_icon(client, admin_auth_headers, create_test_image)
+    first = client.get(image_route)
+    assert media_service.media_cache.stats()["entries"] == 1
+
+    def fail(*args, **kwargs):
+        raise AssertionError("the database should not be queried on a cache hit")
+
+    monkeypatch.setattr(media_service, "get_media_info", fail)
+    response = client.get(image_route)
+    assert response.status_code == 200
+    assert response.content == first.content
+    assert response.headers["etag"] == first.headers["etag"]
+
+    stats = client.get("/metrics/cache").json()["media"]
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+def test_delete_image_invalidates_cache(client: TestClient, admin_auth_headers: dict, create_test_image):
+    """Test that deleting the owner of an image evicts it from the cache."""
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "CachedTech"},
+        files={"icon": create_test_image("icon.jpg")},
+    )
+    technology = response.json()
+    assert client.get(technology["icon"]).status_code == 200
+
+    client.delete(f"/technologies/{technology['id']}", headers=admin_auth_headers)
+    assert media_service.media_cache.stats()["entries"] == 0
+    assert client.get(technology["icon"]).status_code == 404
+
+
+def _large_image(filename: str = "screenshot.png"):
+    file = io.BytesIO()
+    Image.linear_gradient("L").resize((1500, 1000)).convert("RGB").save(file, "png")
+    file.seek(0)
+    return (filename, file, "image/png")
+
+
+def test_upload_generates_variants(client: TestClient, db_session: Session, admin_auth_headers: dict):
+    """Test that uploads store resized and WebP variants next to the original."""
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "VariantTech"},
+        files={"icon": _large_image()},
+    )
+    assert response.status_code == 201, response.text
+    filename = response.json()["icon"].split("/")[-1]
+
+    variants = db_session.query(Media.width, Media.content_type).filter(Media.variant_of == filename).all()
+    assert sorted(variants) == sorted([
+        (320, "image/png"), (640, "image/png"), (1280, "image/png"),
+        (320, "image/webp"), (640, "image/webp"), (1280, "image/webp"), (1500, "image/webp"),
+    ])
+
+
+def test_get_image_variant_selection(client: TestClient, admin_auth_headers: dict):
+    """Test that ?w= and Accept select the best stored variant."""
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "ResponsiveTech"},
+        files={"icon": _large_image()},
+    )
+    image_route = response.json()["icon"]
+
+    response = client.get(f"{image_route}?w=300", headers={"Accept": "image/webp,image/*"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "image/webp"
+    assert "Accept" in response.headers["vary"]
+    assert Image.open(io.BytesIO(response.content)).width == 320
+
+    response = client.get(f"{image_route}?w=700", headers={"Accept": "image/png,image/*"})
+    assert response.headers["content-type"] == "image/png"
+    assert Image.open(io.BytesIO(response.content)).width == 1280
+
+    response = client.get(f"{image_route}?w=4000", headers={"Accept": "image/*"})
+    assert response.headers["content-type"] == "image/png"
+    assert Image.open(io.BytesIO(response.content)).width == 1500
+
+
+def test_delete_image_removes_variants(client: TestClient, db_session: Session, admin_auth_headers: dict):
+    """Test that deleting an image also deletes its variants."""
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "ShortLivedTech"},
+        files={"icon": _large_image()},
+    )
+    technology = response.json()
+    filename = technology["icon"].split("/")[-1]
+
+    client.delete(f"/technologies/{technology['id']}", headers=admin_auth_headers)
+    remaining = db_session.query(Media.id).filter(
+        (Media.filename == filename) | (Media.variant_of == filename)
+    ).count()
+    assert remaining == 0
+
+
+def test_upload_rejected_when_image_workers_busy(client: TestClient, admin_auth_headers: dict, create_test_image, monkeypatch):
+    """Test that uploads get a 503 with Retry-After when the image queue is full."""
+    from src.core.workers import image_workers, WorkerPoolBusyError
+
+    def busy(*args, **kwargs):
+        raise WorkerPoolBusyError()
+
+    monkeypatch.setattr(image_workers, "run", busy)
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "BusyTech"},
+        files={"icon": create_test_image("icon.jpg")},
+    )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+
+
+def test_upload_after_image_worker_crash(client: TestClient, admin_auth_headers: dict, create_test_image):
+    """Test that uploads keep working after an image worker process is killed."""
+    import os
+    import signal
+    from src.core.workers import image_workers
+
+    _upload_icon(client, admin_auth_headers, create_test_image)
+    if image_workers._executor is None:
+        pytest.skip("IMAGE_WORKERS=0: images are processed in the request thread")
+    for process in list(image_workers._executor._processes.values()):
+        os.kill(process.pid, signal.SIGKILL)
+        process.join()
+
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "AfterCrashTech"},
+        files={"icon": create_test_image("other.jpg", color="blue")},
+    )
+    assert response.status_code == 201, response.text
+
+
+def test_identical_uploads_share_one_blob(client: TestClient, db_session: Session, admin_auth_headers: dict, create_test_image):
+    """Test that re-uploading the same content reuses the stored image with reference counting."""
+    routes = []
+    for name in ("DedupA", "DedupB"):
+        response = client.post(
+            "/technologies/",
+            headers=admin_auth_headers,
+            data={"name": name},
+            files={"icon": create_test_image("same.jpg")},
+        )
+        routes.append(response.json())
+    assert routes[0]["icon"] == routes[1]["icon"]
+
+    filename = routes[0]["icon"].split("/")[-1]
+    media = db_session.query(Media).filter(Media.filename == filename).one()
+    assert media.ref_count == 2
+    assert filename.startswith(media.content_hash)
+
+    # Borrar una referencia no elimina los datos
+    client.delete(f"/technologies/{routes[0]['id']}", headers=admin_auth_headers)
+    assert client.get(routes[1]["icon"]).status_code == 200
+
+    # Borrar la última sí
+    client.delete(f"/technologies/{routes[1]['id']}", headers=admin_auth_headers)
+    assert client.get(routes[1]["icon"]).status_code == 404
+
+
+def test_deduplicate_media(db_session: Session):
+    """Test the one-off migration that merges legacy duplicate media rows."""
+    from src.models.social import Social
+    from src.utils import deduplicate_media
+
+    payload = b"same-bytes"
+    digest = hashlib.sha256(payload).hexdigest()
+    for name in ("legacy-a.png", "legacy-b.png"):
+        db_session.add(Media(
+            filename=name, content_type="image/png", data=payload,
+            content_hash=digest, size=len(payload),
+        ))
+    db_session.add(Media(filename="legacy-b_w320.webp", variant_of="legacy-b.png", data=b"v"))
+    db_session.add_all([
+        Social(name="A", link="https://a", image_route="/static/images/legacy-a.png"),
+        Social(name="B", link="https://b", image_route="/static/images/legacy-b.png"),
+    ])
+    db_session.commit()
+
+    result = deduplicate_media(db_session)
+    assert result["duplicate_groups"] == 1
+    assert result["removed_rows"] == 2
+
+    routes = {social.image_route for social in db_session.query(Social).filter(Social.name.in_(["A", "B"]))}
+    assert routes == {"/static/images/legacy-a.png"}
+    kept = db_session.query(Media).filter(Media.content_hash == digest).one()
+    assert kept.filename == "legacy-a.png"
+    assert kept.ref_count == 2
+
+
+def test_filesystem_storage(client: TestClient, db_session: Session, admin_auth_headers: dict, tmp_path, monkeypatch):
+    """Test storing and serving images from the local-disk backend."""
+    from src.core.config import settings
+    from src.core.storage import STORAGES
+
+    monkeypatch.setattr(settings, "MEDIA_STORAGE", "filesystem")
+    monkeypatch.setattr(STORAGES["filesystem"], "root", tmp_path)
+    monkeypatch.setattr(media_service.media_cache, "max_bytes", 0)  # Forzar la lectura desde disco
+
+    response = client.post(
+        "/technologies/",
+        headers=admin_auth_headers,
+        data={"name": "DiskTech"},
+        files={"icon": _large_image()},
+    )
+    technology = response.json()
+    filename = technology["icon"].split("/")[-1]
+
+    media = db_session.query(Media).filter(Media.filename == filename).one()
+    assert media.storage == "filesystem"
+    assert media.data is None
+    assert (tmp_path / filename).read_bytes()[:4] == b"\x89PNG"
+    assert not list(tmp_path.glob(".tmp-*"))
+
+    response = client.get(technology["icon"])
+    assert response.status_code == 200
+    assert response.content == (tmp_path / filename).read_bytes()
+    assert response.headers["etag"] == f'"{media.content_hash}"'
+
+    client.delete(f"/technologies/{technology['id']}", headers=admin_auth_headers)
+    assert not list(tmp_path.iterdir())
+
+
+def test_migrate_media_storage(db_session: Session, tmp_path, monkeypatch):
+    """Test moving blobs from the database to disk and back."""
+    from src.core.storage import STORAGES
+    from src.utils import migrate_media_storage
+
+    monkeypatch.setattr(STORAGES["filesystem"], "root", tmp_path)
+    payload = b"blob-to-move" * 100
+    db_session.add(Media(filename="move.bin", data=payload, size=len(payload)))
+    db_session.commit()
+
+    assert migrate_media_storage(db_session, "filesystem") >= 1
+    media = db_session.query(Media).filter(Media.filename == "move.bin").one()
+    assert media.storage == "filesystem"
+    assert media.data is None
+    assert (tmp_path / "move.bin").read_bytes() == payload
+
+    assert migrate_media_storage(db_session, "database") >= 1
+    db_session.refresh(media)
+    assert media.storage == "database"
+    assert media.data == payload
+    assert not (tmp_path / "move.bin").exists()
+
+
+def _selects_blob(statements) -> bool:
+    return any("media.data" in statement for statement in statements)
+
+
+def test_head_image(client: TestClient, db_session: Session, admin_auth_headers: dict, create_test_image, captured_sql):
+    """Test that HEAD returns length and type from metadata without reading the blob."""
+    image_route = _upload_icon(client, admin_auth_headers, create_test_image)
+    filename = image_route.split("/")[-1]
+    media = db_session.query(Media).filter(Media.filename == filename).one()
+    captured_sql.clear()
+
+    response = client.head(image_route)
+    assert response.status_code == 200
+    assert response.content == b""
+    assert response.headers["content-length"] == str(media.size)
+    assert response.headers["content-type"] == "image/jpeg"
+    assert response.headers["etag"] == f'"{media.content_hash}"'
+    assert not _selects_blob(captured_sql)
+
+    assert client.head("/static/images/missing.png").status_code == 404
+
+
+def test_metadata_paths_never_load_blob(client: TestClient, admin_auth_headers: dict, captured_sql):
+    """Test that conditional GETs and deletions never select Media.data."""
+    response = client.post(
+        "/projects/",
+        headers=admin_auth_headers,
+        data={"title": "Big", "description_en": "en", "description_es": "es"},
+        files={"image": _large_image()},
+    )
+    project = response.json()
+    etag = client.head(project["image_route"]).headers["etag"]
+    captured_sql.clear()
+
+    assert client.get(project["image_route"], headers={"If-None-Match": etag}).status_code == 304
+    assert client.delete(f"/projects/{project['id']}", headers=admin_auth_headers).status_code == 204
+    assert not _selects_blob(captured_sql)
+
+
+def test_filesystem_write_removed_on_rollback(db_session: Session, tmp_path, monkeypatch):
+    """Test that files written in a transaction that never commits don't stay on disk."""
+    from fastapi import UploadFile
+    from starlette.datastructures import Headers
+    from src.core.config import settings
+    from src.core.storage import STORAGES
+    from src.utils import save_image
+
+    monkeypatch.setattr(settings, "MEDIA_STORAGE", "filesystem")
+    monkeypatch.setattr(STORAGES["filesystem"], "root", tmp_path)
+    filename, file, content_type = _large_image()
+    upload = UploadFile(file=file, filename=filename, headers=Headers({"content-type": content_type}))
+
+    save_image(db_session, upload, commit=False)
+    assert list(tmp_path.glob("*.png"))
+    db_session.rollback()
+    assert not list(tmp_path.iterdir())
+
+
+def test_filesystem_remove_keeps_referenced_files(db_session: Session, tmp_path, monkeypatch):
+    """Test that deleting a row doesn't unlink a file that a new row with the same content uses."""
+    from src.core.storage import STORAGES
+    from src.utils import _remove_media_rows
+
+    monkeypatch.setattr(STORAGES["filesystem"], "root", tmp_path)
+    (tmp_path / "same.png").write_bytes(b"png")
+    (tmp_path / "gone.png").write_bytes(b"png")
+    db_session.add_all([
+        Media(filename="same.png", storage="filesystem", size=3),
+        Media(filename="gone.png", storage="filesystem", size=3),
+    ])
+    db_session.commit()
+
+    _remove_media_rows(db_session, ["same.png", "gone.png"], commit=False)
+    # Otra subida con el mismo contenido vuelve a crear la fila antes de que se borren los bytes
+    db_session.add(Media(filename="same.png", storage="filesystem", size=3))
+    db_session.commit()
+    assert (tmp_path / "same.png").exists()
+    assert not (tmp_path / "gone.png").exists()
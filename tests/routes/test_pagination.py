@@ -0,0 +1,92 @@
+# tests/routes/test_pagination.py
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.models.tag import Tag
+from src.models.job import Job
+
+
+def _seed_tags(db: Session, n: int):
+    db.add_all(Tag(name=f"Page{i}") for i in range(n))
+    db.commit()
+
+
+def test_cursor_walks_every_row_once(client: TestClient, db_session: Session):
+    """Test that following X-Next-Cursor returns each row exactly once, ordered by id."""
+    _seed_tags(db_session, 7)
+
+    seen, cursor = [], None
+    while True:
+        response = client.get("/tags/", params={"limit": 3, **({"cursor": cursor} if cursor else {})})
+        assert response.status_code == 200
+        seen.extend(tag["id"] for tag in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+
+    assert seen == sorted(seen)
+    assert len(seen) == len(set(seen)) == 7
+
+
+def test_link_header_points_to_next_page(client: TestClient, db_session: Session):
+    """Test that a full page carries a rel="next" Link with the cursor."""
+    _seed_tags(db_session, 3)
+    response = client.get("/tags/?limit=2&skip=0")
+    link = response.headers["Link"]
+    assert link.startswith("</tags/?")
+    assert link.endswith('>; rel="next"')
+    assert f"cursor={response.headers['X-Next-Cursor']}" in link
+    assert "skip=" not in link
+
+    next_page = client.get(link[1:link.index(">")])
+    assert [tag["name"] for tag in next_page.json()] == ["Page2"]
+    assert "Link" not in next_page.headers
+
+
+def test_total_count_only_on_request(client: TestClient, db_session: Session, captured_sql):
+    """Test that X-Total-Count is computed only when include_total is set."""
+    db_session.add_all(
+        Job(title=f"J{i}", start_date="2020", current_job=False, image_route="/static/images/j.png")
+        for i in range(4)
+    )
+    db_session.commit()
+
+    captured_sql.clear()
+    response = client.get("/jobs/?limit=2")
+    assert "X-Total-Count" not in response.headers
+    assert not any("count(" in statement.lower() for statement in captured_sql)
+
+    response = client.get("/jobs/?limit=2&include_total=true")
+    assert response.headers["X-Total-Count"] == "4"
+    assert len(response.json()) == 2
+
+
+def test_pagination_headers_are_cached(client: TestClient, db_session: Session):
+    """Test that cache hits return the same pagination headers."""
+    _seed_tags(db_session, 3)
+    first = client.get("/tags/?limit=2")
+    second = client.get("/tags/?limit=2")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.headers["X-Next-Cursor"] == first.headers["X-Next-Cursor"]
+    assert second.headers["Link"] == first.headers["Link"]
+
+    # La clave de caché no incluye el host: el enlace no debe llevarlo
+    other_host = client.get("/tags/?limit=2", headers={"Host": "other.example"})
+    assert other_host.headers["X-Cache"] == "HIT"
+    assert "testserver" not in other_host.headers["Link"]
+
+
+def test_skip_limit_still_supported(client: TestClient, db_session: Session):
+    """Test that the legacy skip/limit parameters keep working, now with a stable order."""
+    _seed_tags(db_session, 4)
+    names = [tag["name"] for tag in client.get("/tags/?skip=1&limit=2").json()]
+    assert names == ["Page1", "Page2"]
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", "eyJmb28iOjF9", "bnVsbA"])
+def test_invalid_cursor(client: TestClient, cursor):
+    """Test that malformed cursors are rejected with a 400."""
+    response = client.get("/projects/", params={"cursor": cursor})
+    assert response.status_code == 400
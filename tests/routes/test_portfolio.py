@@ -0,0 +1,92 @@
+# tests/routes/test_portfolio.py
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.models.project import Project
+from src.models.technology import Technology
+from src.models.tag import Tag
+from src.models.job import Job
+from src.models.certificate import Certificate
+from src.models.social import Social
+
+
+def _seed(db: Session):
+    technology = Technology(name="FastAPI", icon="/static/images/t.png")
+    tag = Tag(name="Backend")
+    db.add_all([
+        Project(
+            title="Portfolio", description_en="en", description_es="es",
+            image_route="/static/images/p.png", technologies=[technology], tags=[tag],
+        ),
+        Job(title="Dev", start_date="2020", current_job=True, image_route="/static/images/j.png"),
+        Certificate(title="Cert", school="School", image_route="/static/images/c.png"),
+        Social(name="GitHub", link="https://github.com", image_route="/static/images/s.png"),
+    ])
+    db.commit()
+
+
+def test_portfolio_returns_every_collection(client: TestClient, db_session: Session):
+    """Test that the snapshot contains all public collections."""
+    _seed(db_session)
+    response = client.get("/portfolio")
+    assert response.status_code == 200
+    data = response.json()
+    assert [p["title"] for p in data["projects"]] == ["Portfolio"]
+    assert data["projects"][0]["technologies"][0]["name"] == "FastAPI"
+    assert data["projects"][0]["tags"][0]["name"] == "Backend"
+    assert [t["name"] for t in data["technologies"]] == ["FastAPI"]
+    assert [t["name"] for t in data["tags"]] == ["Backend"]
+    assert [j["title"] for j in data["jobs"]] == ["Dev"]
+    assert [c["title"] for c in data["certificates"]] == ["Cert"]
+    assert [s["name"] for s in data["socials"]] == ["GitHub"]
+    assert data["translations"] is None
+
+
+def test_portfolio_with_language(client: TestClient):
+    """Test that ?lang= embeds the translations, and unknown languages are a 404."""
+    data = client.get("/portfolio?lang=es").json()
+    assert data["lang"] == "es"
+    assert data["translations"]["navbar.home"] == "Inicio"
+
+    assert client.get("/portfolio?lang=fr").status_code == 404
+
+
+def test_portfolio_query_count(client: TestClient, db_session: Session, captured_sql):
+    """Test that the snapshot is built with one query per collection, then served from cache."""
+    _seed(db_session)
+    db_session.expire_all()
+    captured_sql.clear()
+    assert client.get("/portfolio").headers["X-Cache"] == "MISS"
+    selects = [s for s in captured_sql if s.lstrip().upper().startswith("SELECT")]
+    # 6 colecciones + tecnologías y tags de los proyectos
+    assert len(selects) <= 8
+
+    captured_sql.clear()
+    assert client.get("/portfolio").headers["X-Cache"] == "HIT"
+    assert captured_sql == []
+
+
+def test_portfolio_invalidated_by_admin_write(client: TestClient, admin_auth_headers: dict):
+    """Test that an admin write refreshes the cached snapshot."""
+    assert client.get("/portfolio").json()["tags"] == []
+    client.post("/tags/", json={"name": "Fresh"}, headers=admin_auth_headers)
+
+    response = client.get("/portfolio")
+    assert response.headers["X-Cache"] == "MISS"
+    assert [t["name"] for t in response.json()["tags"]] == ["Fresh"]
+
+
+def test_portfolio_invalidated_by_translation_update(
+    client: TestClient, admin_auth_headers: dict, i18n_store
+):
+    """Test that updating a language file refreshes the cached snapshot."""
+    (i18n_store.directory / "en.json").write_text('{"navbar.home": "Home"}', encoding="utf-8")
+    i18n_store.load()
+
+    assert client.get("/portfolio?lang=en").json()["translations"] == {"navbar.home": "Home"}
+    client.put("/i18n/en", headers=admin_auth_headers, json={"navbar.home": "Start"})
+
+    response = client.get("/portfolio?lang=en")
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.json()["translations"] == {"navbar.home": "Start"}
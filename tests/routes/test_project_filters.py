@@ -0,0 +1,67 @@
+# tests/routes/test_project_filters.py
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.models.project import Project
+from src.models.technology import Technology
+from src.models.tag import Tag
+
+
+def _seed(db: Session):
+    fastapi, react = Technology(name="FastAPI", icon="/i.png"), Technology(name="React", icon="/i.png")
+    backend, frontend = Tag(name="backend"), Tag(name="frontend")
+    for title, technologies, tags in [
+        ("API", [fastapi], [backend]),
+        ("Fullstack", [fastapi, react], [backend, frontend]),
+        ("Landing", [react], [frontend]),
+        ("Notes", [], []),
+    ]:
+        db.add(Project(
+            title=title, description_en="en", description_es="es",
+            image_route="/static/images/p.png", technologies=technologies, tags=tags,
+        ))
+    db.commit()
+
+
+def _titles(client: TestClient, query: str):
+    response = client.get(f"/projects/?{query}")
+    assert response.status_code == 200
+    return [project["title"] for project in response.json()]
+
+
+def test_filter_by_technology_and_tag(client: TestClient, db_session: Session):
+    """Test that technology and tag filters are ANDed by default."""
+    _seed(db_session)
+
+    assert _titles(client, "technology=FastAPI") == ["API", "Fullstack"]
+    assert _titles(client, "technology=FastAPI&tag=frontend") == ["Fullstack"]
+    assert _titles(client, "technology=FastAPI&technology=React") == ["Fullstack"]
+    assert _titles(client, "tag=backend&tag=missing") == []
+
+
+def test_filter_match_any(client: TestClient, db_session: Session):
+    """Test that match=any keeps projects with at least one of the technologies or tags."""
+    _seed(db_session)
+
+    assert _titles(client, "technology=FastAPI&technology=React&match=any") == ["API", "Fullstack", "Landing"]
+    assert _titles(client, "technology=React&tag=backend&match=any") == ["API", "Fullstack", "Landing"]
+    assert _titles(client, "tag=missing&tag=frontend&match=any") == ["Fullstack", "Landing"]
+
+
+def test_filter_pagination_and_total(client: TestClient, db_session: Session):
+    """Test that the total count and the next cursor follow the filters."""
+    _seed(db_session)
+
+    response = client.get("/projects/?tag=frontend&include_total=true&limit=1")
+    assert response.headers["X-Total-Count"] == "2"
+    assert [p["title"] for p in response.json()] == ["Fullstack"]
+
+    next_url = response.links["next"]["url"]
+    assert "tag=frontend" in next_url
+    assert [p["title"] for p in client.get(next_url).json()] == ["Landing"]
+
+
+def test_filter_rejects_unknown_match(client: TestClient, db_session: Session):
+    """Test that match only accepts all or any."""
+    assert client.get("/projects/?tag=backend&match=some").status_code == 422
@@ -0,0 +1,100 @@
+# tests/routes/test_query_counts.py
+
+import itertools
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from src.models.project import Project
+from src.models.technology import Technology
+from src.models.tag import Tag
+from src.models.job import Job
+from src.models.certificate import Certificate
+from src.models.social import Social
+from src.core.cache import response_cache
+
+
+_batch = itertools.count()
+
+
+def _seed_projects(db: Session, n: int):
+    batch = next(_batch)
+    technologies = [Technology(name=f"QTech{batch}-{i}", icon="/static/images/t.png") for i in range(3)]
+    tags = [Tag(name=f"QTag{batch}-{i}") for i in range(3)]
+    for i in range(n):
+        db.add(Project(
+            title=f"Q{i}", description_en="en", description_es="es",
+            image_route="/static/images/p.png",
+            technologies=technologies, tags=tags,
+        ))
+
+
+def _seed_technologies(db: Session, n: int):
+    _seed_projects(db, 2)
+    db.add_all(Technology(name=f"QOnlyTech{n}-{i}", icon="/static/images/t.png") for i in range(n))
+
+
+def _seed_tags(db: Session, n: int):
+    _seed_projects(db, 2)
+    db.add_all(Tag(name=f"QOnlyTag{n}-{i}") for i in range(n))
+
+
+def _seed_jobs(db: Session, n: int):
+    db.add_all(
+        Job(title=f"J{i}", start_date="2020", current_job=False, image_route="/static/images/j.png")
+        for i in range(n)
+    )
+
+
+def _seed_certificates(db: Session, n: int):
+    db.add_all(
+        Certificate(title=f"C{i}", school="S", image_route="/static/images/c.png")
+        for i in range(n)
+    )
+
+
+def _seed_socials(db: Session, n: int):
+    db.add_all(
+        Social(name=f"S{i}", link="https://example.com", image_route="/static/images/s.png")
+        for i in range(n)
+    )
+
+
+# Endpoint, función de carga y número máximo de SELECT permitidos
+LIST_ENDPOINTS = [
+    ("/projects/", _seed_projects, 3),
+    ("/technologies/", _seed_technologies, 1),
+    ("/tags/", _seed_tags, 1),
+    ("/jobs/", _seed_jobs, 1),
+    ("/certificates/", _seed_certificates, 1),
+    ("/socials/", _seed_socials, 1),
+]
+
+
+def _count_selects(client: TestClient, url: str, captured_sql) -> int:
+    # The seed helpers write straight to the session, bypassing the services
+    # that bump the response cache version; measure the uncached path.
+    response_cache.clear()
+    captured_sql.clear()
+    response = client.get(url)
+    assert response.status_code == 200
+    return sum(1 for statement in captured_sql if statement.lstrip().upper().startswith("SELECT"))
+
+
+@pytest.mark.parametrize("url, seed, max_selects", LIST_ENDPOINTS)
+def test_list_endpoint_query_count_is_constant(
+    client: TestClient, db_session: Session, captured_sql, url, seed, max_selects
+):
+    """Test that list endpoints run a fixed, small number of queries regardless of row count."""
+    seed(db_session, 1)
+    db_session.commit()
+    db_session.expire_all()
+    few = _count_selects(client, url, captured_sql)
+
+    seed(db_session, 20)
+    db_session.commit()
+    db_session.expire_all()
+    many = _count_selects(client, url, captured_sql)
+
+    assert few == many
+    assert many <= max_selects
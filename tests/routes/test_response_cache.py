@@ -0,0 +1,68 @@
+# tests/routes/test_response_cache.py
+
+import pytest
+from fastapi.testclient import TestClient
+
+
+def _selects(captured_sql) -> int:
+    return sum(1 for statement in captured_sql if statement.lstrip().upper().startswith("SELECT"))
+
+
+def test_list_is_served_from_cache(client: TestClient, admin_auth_headers: dict, captured_sql):
+    """Test that a repeated list request is answered without touching the database."""
+    client.post("/tags/", json={"name": "Cached"}, headers=admin_auth_headers)
+
+    first = client.get("/tags/")
+    assert first.headers["X-Cache"] == "MISS"
+
+    captured_sql.clear()
+    second = client.get("/tags/")
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.content == first.content
+    assert second.json() == [{"name": "Cached", "id": first.json()[0]["id"]}]
+    assert _selects(captured_sql) == 0
+
+
+def test_query_params_are_part_of_the_key(client: TestClient, admin_auth_headers: dict):
+    """Test that different pagination parameters get different cache entries."""
+    for name in ("A", "B"):
+        client.post("/tags/", json={"name": name}, headers=admin_auth_headers)
+
+    assert len(client.get("/tags/?limit=1").json()) == 1
+    response = client.get("/tags/?limit=2")
+    assert response.headers["X-Cache"] == "MISS"
+    assert len(response.json()) == 2
+    assert client.get("/tags/?limit=1").headers["X-Cache"] == "HIT"
+
+
+@pytest.mark.parametrize("method, url, payload", [
+    ("post", "/tags/", {"name": "New"}),
+    ("put", "/tags/{id}", {"name": "Renamed"}),
+    ("delete", "/tags/{id}", None),
+])
+def test_writes_invalidate_cached_lists(client: TestClient, admin_auth_headers: dict, method, url, payload):
+    """Test that every create/update/delete bumps the content version."""
+    tag_id = client.post("/tags/", json={"name": "Original"}, headers=admin_auth_headers).json()["id"]
+    before = client.get("/tags/").json()
+    client.get("/technologies/")
+
+    kwargs = {"json": payload} if payload else {}
+    response = getattr(client, method)(url.format(id=tag_id), headers=admin_auth_headers, **kwargs)
+    assert response.status_code < 300
+
+    after = client.get("/tags/")
+    assert after.headers["X-Cache"] == "MISS"
+    assert after.json() != before
+    # La versión es global: también se invalidan los demás listados
+    assert client.get("/technologies/").headers["X-Cache"] == "MISS"
+
+
+def test_cache_metrics_report_hit_ratio(client: TestClient):
+    """Test that the metrics endpoint exposes the response cache hit ratio."""
+    client.get("/jobs/")
+    client.get("/jobs/")
+    stats = client.get("/metrics/cache").json()["responses"]
+    assert stats["backend"] == "MemoryCacheBackend"
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_ratio"] == 0.5
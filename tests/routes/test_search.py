@@ -0,0 +1,66 @@
+# tests/routes/test_search.py
+
+from fastapi.testclient import TestClient
+from fastapi import UploadFile
+from sqlalchemy.orm import Session
+
+from src.schemas.project import ProjectCreate, ProjectUpdate
+from src.services import projects_service
+
+
+def _create(db: Session, create_test_image, title: str, en: str, es: str):
+    filename, image_bytes, _ = create_test_image()
+    return projects_service.create_project(
+        db,
+        ProjectCreate(title=title, description_en=en, description_es=es),
+        UploadFile(filename=filename, file=image_bytes),
+    )
+
+
+def test_search_ranks_and_highlights(client: TestClient, db_session: Session, create_test_image):
+    """Test that matches are ranked (title hits first) and highlighted."""
+    _create(db_session, create_test_image, "Weather app", "Shows the forecast with FastAPI", "Muestra el clima")
+    _create(db_session, create_test_image, "FastAPI backend", "A REST API", "Una API REST")
+    _create(db_session, create_test_image, "Blog", "Static site", "Sitio estático")
+
+    response = client.get("/projects/search?q=fastapi")
+    assert response.status_code == 200
+    results = response.json()
+    assert [r["project"]["title"] for r in results] == ["FastAPI backend", "Weather app"]
+    assert results[0]["rank"] > results[1]["rank"] > 0
+    assert results[0]["highlights"]["title"] == "<mark>FastAPI</mark> backend"
+    assert "<mark>FastAPI</mark>" in results[1]["highlights"]["description_en"]
+
+
+def test_search_prefix_and_language(client: TestClient, db_session: Session, create_test_image):
+    """Test prefix matching, accent folding and lang-restricted search."""
+    _create(db_session, create_test_image, "Tienda", "Online shop", "Tienda en línea con pagos")
+
+    assert [r["project"]["title"] for r in client.get("/projects/search?q=linea").json()] == ["Tienda"]
+    assert client.get("/projects/search?q=pag").json()[0]["project"]["title"] == "Tienda"
+
+    results = client.get("/projects/search?q=pagos&lang=en").json()
+    assert results == []
+    result = client.get("/projects/search?q=pagos&lang=es").json()[0]
+    assert "description_en" not in result["project"]
+    assert set(result["highlights"]) == {"title", "description_es"}
+
+
+def test_search_index_follows_updates_and_deletes(client: TestClient, db_session: Session, create_test_image):
+    """Test that the index is kept in sync by the project service."""
+    project = _create(db_session, create_test_image, "Old name", "en", "es")
+    projects_service.update_project(db_session, project.id, ProjectUpdate(title="Renamed"))
+
+    assert client.get("/projects/search?q=old").json() == []
+    assert client.get("/projects/search?q=renamed").json()[0]["project"]["id"] == project.id
+
+    projects_service.delete_project(db_session, project.id)
+    assert client.get("/projects/search?q=renamed").json() == []
+
+
+def test_search_escapes_markup_and_query_syntax(client: TestClient, db_session: Session, create_test_image):
+    """Test that highlighted text is HTML-escaped and FTS operators in q are ignored."""
+    _create(db_session, create_test_image, "<script>alert</script>", "en", "es")
+    result = client.get("/projects/search", params={"q": 'alert" :^(*'}).json()
+    assert result[0]["highlights"]["title"] == "&lt;script&gt;<mark>alert</mark>&lt;/script&gt;"
+    assert client.get("/projects/search", params={"q": "***"}).json() == []